@@ -0,0 +1,166 @@
+from typing import Dict, Any, List, Optional
+import logging
+import queue
+import threading
+import time
+import config
+
+class AutoSaveWorker:
+    """
+    Writes autosaves on a background thread.
+
+    The game loop only hands over a snapshot from
+    SaveLoadManager.create_snapshot(); serializing, writing and pruning the
+    save directory all happen on the worker so command latency does not
+    depend on the size of the saves directory. Snapshots arriving within
+    group_commit_window of each other are written as one group commit.
+
+    The thread is started by the first snapshot and exits once nothing
+    has been queued for idle_timeout seconds, so a server hosting many
+    mostly idle sessions doesn't keep a thread per session.
+    """
+
+    _STOP = object()
+
+    def __init__(self, save_load_manager: 'SaveLoadManager',
+                 queue_size: int = config.AUTO_SAVE_QUEUE_SIZE,
+                 group_commit_window: float = config.SAVE_GROUP_COMMIT_WINDOW,
+                 idle_timeout: float = config.AUTO_SAVE_WORKER_IDLE_TIMEOUT):
+        self.save_load_manager = save_load_manager
+        self.group_commit_window = group_commit_window
+        self.idle_timeout = idle_timeout
+        self.logger = logging.getLogger(__name__)
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        # Held while queueing and while an idle worker decides to exit, so
+        # a snapshot is never left behind with no thread to write it
+        self._lock = threading.Lock()
+
+    def submit(self, save_data: Dict[str, Any]) -> bool:
+        """
+        Queue an autosave snapshot without blocking.
+
+        If the queue is full the oldest pending snapshot is dropped, since
+        the new one supersedes it.
+
+        Args:
+            save_data: Snapshot from SaveLoadManager.create_snapshot()
+
+        Returns:
+            bool: True if the snapshot was queued, False otherwise
+        """
+        try:
+            with self._lock:
+                self._ensure_started()
+                while True:
+                    try:
+                        self._queue.put_nowait(save_data)
+                        return True
+                    except queue.Full:
+                        try:
+                            dropped = self._queue.get_nowait()
+                            self._queue.task_done()
+                            self.logger.info(f"Dropped superseded auto-save {dropped['save_name']}")
+                        except queue.Empty:
+                            continue
+        except Exception as e:
+            self.logger.error(f"Error queueing auto-save: {e}")
+            return False
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Write any pending autosaves and stop the worker thread.
+
+        Args:
+            timeout: Maximum seconds to wait for pending saves
+        """
+        try:
+            with self._lock:
+                thread = self._thread
+                if not thread or not thread.is_alive():
+                    return
+                self._queue.put(self._STOP, timeout=timeout)
+                self._thread = None
+            thread.join(timeout)
+        except queue.Full:
+            self.logger.warning("Auto-save worker did not drain before shutdown")
+        except Exception as e:
+            self.logger.error(f"Error stopping auto-save worker: {e}")
+
+    def _ensure_started(self) -> None:
+        """Start the worker thread on first use."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name="autosave-worker",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Worker loop: gather a batch of snapshots and group-commit them."""
+        while True:
+            batch: List[Dict[str, Any]] = []
+            stopping = self._collect(batch)
+            if batch:
+                try:
+                    self.save_load_manager.manage_saves(config.MAX_SAVE_DIR_SIZE_MB)
+                    self.save_load_manager.write_auto_saves(batch)
+                except Exception as e:
+                    self.logger.error(f"Auto-save worker error: {e}")
+            if stopping:
+                return
+            if not batch and self._retire():
+                return
+
+    def _retire(self) -> bool:
+        """
+        Let an idle worker thread exit if nothing was queued meanwhile.
+
+        Returns:
+            bool: True if the thread should exit
+        """
+        # Whoever holds the lock is queueing a snapshot or stopping the
+        # worker, which both need this thread to keep going
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            if not self._queue.empty():
+                return False
+            if self._thread is threading.current_thread():
+                self._thread = None
+            return True
+        finally:
+            self._lock.release()
+
+    def _collect(self, batch: List[Dict[str, Any]]) -> bool:
+        """
+        Wait for a snapshot, then gather any more arriving within the
+        group commit window.
+
+        Args:
+            batch: List to append the snapshots to; left empty if nothing
+                arrived within idle_timeout
+
+        Returns:
+            bool: True if the worker was asked to stop
+        """
+        deadline = None
+        while True:
+            try:
+                if deadline is None:
+                    save_data = self._queue.get(timeout=self.idle_timeout)
+                    deadline = time.monotonic() + self.group_commit_window
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    save_data = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return False
+
+            self._queue.task_done()
+            if save_data is self._STOP:
+                return True
+            batch.append(save_data)
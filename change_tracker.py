@@ -0,0 +1,109 @@
+from typing import Any, Dict, Optional, Set
+import copy
+import logging
+
+class ChangeTracker:
+    """
+    Records whether saved game state changed since the last save.
+
+    Managers call mark() whenever they mutate state that ends up in a save
+    snapshot. The game loop calls end_command() after every command so
+    commands that changed something can be counted, and clear() once the
+    state has been captured by a save.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        # Parts of the state changed since the last save
+        self.changed: Set[str] = set()
+        # Commands since the last save that changed anything
+        self.mutating_commands = 0
+        self._changed_this_command = False
+
+    @property
+    def dirty(self) -> bool:
+        """Whether anything changed since the last save."""
+        return bool(self.changed)
+
+    def mark(self, source: str) -> None:
+        """
+        Record a change to saved state.
+
+        Args:
+            source: Part of the state that changed, e.g. "inventory"
+        """
+        self.changed.add(source)
+        self._changed_this_command = True
+
+    def end_command(self) -> None:
+        """Count the command that just finished if it changed anything."""
+        if self._changed_this_command:
+            self.mutating_commands += 1
+            self._changed_this_command = False
+
+    def clear(self) -> None:
+        """Forget all changes after the state was saved or loaded."""
+        self.changed.clear()
+        self.mutating_commands = 0
+        self._changed_this_command = False
+
+class TrackedDict(dict):
+    """
+    Dictionary that marks a ChangeTracker whenever a value changes.
+
+    Used for game_state, which items, puzzles and conversations all update
+    directly. Assigning a value equal to the current one is not a change.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None,
+                 tracker: Optional[ChangeTracker] = None, source: str = "game_state"):
+        super().__init__(data or {})
+        self.tracker = tracker
+        self.source = source
+
+    def _mark(self) -> None:
+        if self.tracker:
+            self.tracker.mark(self.source)
+
+    def __setitem__(self, key, value) -> None:
+        if key not in self or self[key] != value:
+            self._mark()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._mark()
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key in self:
+            self._mark()
+        return super().pop(key, *default)
+
+    def popitem(self):
+        item = super().popitem()
+        self._mark()
+        return item
+
+    def clear(self) -> None:
+        if self:
+            self._mark()
+        super().clear()
+
+    def __copy__(self) -> Dict[str, Any]:
+        # Copies are plain dicts; only the live game state is tracked
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> Dict[str, Any]:
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
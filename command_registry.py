@@ -0,0 +1,136 @@
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class Command:
+    """
+    A game verb and how to run it.
+
+    The handler is called as handler(game, args) and returns False to end
+    the game, True to keep playing.
+    """
+    name: str
+    handler: Callable[..., bool]
+    aliases: Tuple[str, ...] = ()
+    min_args: int = 0
+    max_args: Optional[int] = None
+    usage: str = ""
+    # Names the arguments are completed from: "item", "exit" or "" for none
+    completes: str = ""
+    # Only run when typed in full, never from an abbreviation
+    exact: bool = False
+
+    def accepts(self, arg_count: int) -> bool:
+        """Check whether the verb takes this many arguments."""
+        if arg_count < self.min_args:
+            return False
+        return self.max_args is None or arg_count <= self.max_args
+
+class CommandRegistry:
+    """
+    Lookup table from every verb and alias to the command it runs.
+
+    Commands are registered once when their handlers are defined, usually
+    with the command() decorator, and resolving a typed word is a single
+    dictionary lookup. An alias may also carry fixed arguments, so "n"
+    can run "go north".
+    """
+
+    def __init__(self):
+        self._commands: Dict[str, Command] = {}
+        # word -> (command, arguments put in front of the typed ones)
+        self._aliases: Dict[str, Tuple[Command, Tuple[str, ...]]] = {}
+
+    def command(self, name: str, *aliases: str, min_args: int = 0,
+                max_args: Optional[int] = None, usage: str = "",
+                completes: str = "", exact: bool = False) -> Callable:
+        """
+        Decorator registering a function as the handler of a verb.
+
+        Args:
+            name: The verb
+            *aliases: Other words that run the same verb
+            min_args: Fewest arguments the verb needs
+            max_args: Most arguments the verb takes, None for no limit
+            usage: Message shown when the argument count is wrong
+            completes: Names arguments can be abbreviated from, "item" or "exit"
+            exact: Refuse abbreviations of the verb, for verbs that end
+                or replace the game
+
+        Returns:
+            A decorator that registers and returns the handler unchanged
+        """
+        def register(handler: Callable[..., bool]) -> Callable[..., bool]:
+            self.register(Command(name, handler, tuple(aliases), min_args, max_args, usage,
+                                  completes, exact))
+            return handler
+        return register
+
+    def register(self, command: Command) -> None:
+        """
+        Add a command under its name and all its aliases.
+
+        Raises:
+            ValueError: If the name or an alias is already taken
+        """
+        if command.name in self._commands:
+            raise ValueError(f"Command '{command.name}' is already registered")
+        self._commands[command.name] = command
+        for word in (command.name, *command.aliases):
+            self._bind(word, command, ())
+
+    def alias(self, word: str, name: str, *args: str) -> None:
+        """
+        Make a word run a registered command with fixed arguments.
+
+        Args:
+            word: The shortcut, e.g. "n"
+            name: The command it runs, e.g. "go"
+            *args: Arguments passed before any typed ones, e.g. "north"
+
+        Raises:
+            KeyError: If the command isn't registered
+            ValueError: If the word is already taken
+        """
+        self._bind(word, self._commands[name], tuple(args))
+
+    def resolve(self, word: str, args: Sequence[str] = ()) -> Optional[Tuple[Command, List[str]]]:
+        """
+        Find the command a typed word runs.
+
+        Args:
+            word: First word of the player's command, lowercased
+            args: The words typed after it
+
+        Returns:
+            Tuple of (command, arguments including any fixed ones),
+            or None for unknown words
+        """
+        entry = self._aliases.get(word)
+        if entry is None:
+            return None
+        command, fixed = entry
+        return command, [*fixed, *args] if fixed else list(args)
+
+    def words(self) -> Iterator[str]:
+        """Iterate over every word that runs a command."""
+        return iter(self._aliases)
+
+    def abbreviable_words(self) -> Iterator[str]:
+        """Iterate over the command words that may be typed abbreviated."""
+        return (word for word, (command, _) in self._aliases.items() if not command.exact)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._aliases
+
+    def __iter__(self) -> Iterator[Command]:
+        return iter(self._commands.values())
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def _bind(self, word: str, command: Command, args: Tuple[str, ...]) -> None:
+        """Point a word at a command, refusing to shadow another binding."""
+        if word in self._aliases:
+            raise ValueError(f"'{word}' already runs '{self._aliases[word][0].name}'")
+        self._aliases[word] = (command, args)
@@ -0,0 +1,215 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+class _Node:
+    """One letter position in a PrefixTrie."""
+    __slots__ = ("children", "count", "end")
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        # Words stored at or below this node
+        self.count = 0
+        self.end = False
+
+class PrefixTrie:
+    """
+    Set of words that can be searched by prefix.
+
+    Finding the words that start with a prefix costs the length of the
+    prefix plus the length of the results, however many words are stored.
+    Every node counts the words below it, so a unique completion is found
+    by following single children without visiting the rest of the trie.
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._root = _Node()
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self._root.count
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        node = self._find(word)
+        return node is not None and node.end
+
+    def __iter__(self):
+        return iter(self.with_prefix(""))
+
+    def add(self, word: str) -> bool:
+        """
+        Store a word.
+
+        Returns:
+            bool: False if it was already stored
+        """
+        if word in self:
+            return False
+        node = self._root
+        node.count += 1
+        for letter in word:
+            node = node.children.setdefault(letter, _Node())
+            node.count += 1
+        node.end = True
+        return True
+
+    def discard(self, word: str) -> bool:
+        """
+        Remove a word, pruning branches left empty.
+
+        Returns:
+            bool: False if it wasn't stored
+        """
+        if word not in self:
+            return False
+        node = self._root
+        node.count -= 1
+        for letter in word:
+            child = node.children[letter]
+            child.count -= 1
+            if not child.count:
+                del node.children[letter]
+                return True
+            node = child
+        node.end = False
+        return True
+
+    def with_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Get the stored words starting with a prefix, in alphabetical order.
+
+        Args:
+            prefix: Start of the words
+            limit: Most words to return, None for all
+
+        Returns:
+            List of matching words
+        """
+        node = self._find(prefix)
+        if node is None:
+            return []
+        matches: List[str] = []
+        # Depth-first, children pushed in reverse to pop in order
+        stack: List[Tuple[str, _Node]] = [(prefix, node)]
+        while stack and (limit is None or len(matches) < limit):
+            word, node = stack.pop()
+            if node.end:
+                matches.append(word)
+            for letter in sorted(node.children, reverse=True):
+                stack.append((word + letter, node.children[letter]))
+        return matches
+
+    def unique(self, prefix: str) -> Optional[str]:
+        """
+        Get the only stored word starting with a prefix.
+
+        Returns:
+            The word, or None if no word or several words match
+        """
+        node = self._find(prefix)
+        if node is None or node.count != 1:
+            return None
+        word = prefix
+        while not node.end:
+            letter, node = next(iter(node.children.items()))
+            word += letter
+        return word
+
+    def _find(self, prefix: str) -> Optional[_Node]:
+        """Get the node reached by a prefix, if any word has it."""
+        node = self._root
+        for letter in prefix:
+            node = node.children.get(letter)
+            if node is None:
+                return None
+        return node
+
+class Completer:
+    """
+    Abbreviation and tab completion for one game session.
+
+    Verbs come from a trie shared by every session. The items the player
+    can see or carry and the current exits are kept in per-session tries
+    that are brought up to date by sync(), which only adds and removes
+    the names that changed since the last call.
+    """
+
+    def __init__(self, verbs: PrefixTrie):
+        """
+        Args:
+            verbs: Trie of every command word
+        """
+        self.logger = logging.getLogger(__name__)
+        self.tries: Dict[str, PrefixTrie] = {
+            "verb": verbs,
+            "item": PrefixTrie(),
+            "exit": PrefixTrie(),
+        }
+        self._current: Dict[str, Set[str]] = {"item": set(), "exit": set()}
+
+    def sync(self, items: Iterable[str], exits: Iterable[str]) -> None:
+        """
+        Update the item and exit tries to what is reachable now.
+
+        Args:
+            items: Items in the room and in the inventory
+            exits: Exits from the current location
+        """
+        for kind, names in (("item", set(items)), ("exit", set(exits))):
+            current = self._current[kind]
+            if names == current:
+                continue
+            trie = self.tries[kind]
+            for name in current - names:
+                trie.discard(name)
+            for name in names - current:
+                trie.add(name)
+            self._current[kind] = names
+
+    def reachable(self, kind: str) -> Set[str]:
+        """Get the item or exit names as of the last sync()."""
+        return self._current[kind]
+
+    def expand(self, word: str, kind: str) -> Tuple[str, List[str]]:
+        """
+        Expand an abbreviation to the full word it stands for.
+
+        Args:
+            word: What the player typed
+            kind: "verb", "item" or "exit"
+
+        Returns:
+            Tuple of (word to use, other candidates). The word is expanded
+            when exactly one name starts with it; when several do it's
+            returned unchanged along with the names it could mean.
+        """
+        trie = self.tries[kind]
+        if not word or word in trie:
+            return word, []
+        full = trie.unique(word)
+        if full is not None:
+            return full, []
+        return word, trie.with_prefix(word)
+
+    def candidates(self, line: str, kinds: Tuple[str, ...] = ("item", "exit")) -> List[str]:
+        """
+        Complete the last word of a partly typed command line.
+
+        Args:
+            line: The line so far
+            kinds: Name lists to complete arguments from
+
+        Returns:
+            List of full words the last word could become
+        """
+        words = line.split()
+        if line.endswith(" ") or not line:
+            words.append("")
+        if len(words) == 1:
+            return self.tries["verb"].with_prefix(words[0])
+        matches: List[str] = []
+        for kind in kinds:
+            matches.extend(self.tries[kind].with_prefix(words[-1]))
+        return sorted(set(matches))
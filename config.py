@@ -5,6 +5,7 @@ from typing import Dict, Any
 
 # File System Settings
 SAVE_DIR = Path("saves")
+SAVE_MANIFEST_FILE = "index/saves.manifest"  # index of save metadata inside SAVE_DIR, kept in a subdirectory
 LOG_FILE = "seattle_noir.log"
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
 
@@ -13,13 +14,45 @@ AUTO_SAVE_INTERVAL = 300  # seconds (5 minutes)
 MAX_SAVE_FILES = 5
 MAX_AUTO_SAVES = 3
 MAX_SAVE_DIR_SIZE_MB = 50.0
+SAVE_NAME_MAX_LENGTH = 64  # longest save name; names may only use letters, digits, "-" and "_"
+SAVE_QUOTAS_MB = {}  # save name prefix -> MB limit for saves with that prefix
+SAVE_LEDGER_RECONCILE_EVERY = 100  # save size ledger updates before re-measuring the save directory
+AUTO_SAVE_IN_BACKGROUND = True  # write autosaves on a worker thread
+AUTO_SAVE_QUEUE_SIZE = 2  # pending autosave snapshots before the oldest is dropped
+AUTO_SAVE_WORKER_IDLE_TIMEOUT = 5.0  # seconds with nothing to write before the worker thread exits
+AUTO_SAVE_ONLY_WHEN_CHANGED = True  # skip autosaves when no saved state changed
+AUTO_SAVE_AFTER_COMMANDS = 0  # also autosave after this many state-changing commands, 0 to disable
+SAVE_FORMAT = "json"  # "json" or "binary" for new save checkpoints
+SAVE_CONVERT_ON_LOAD = True  # rewrite old-version or other-format saves when loaded
+SAVE_DEDUP_AUTOSAVES = True  # store autosave sections once in a shared blob store
+SAVE_BLOB_DIR = "blobs"  # blob store directory inside SAVE_DIR
+SAVE_JOURNAL_ENABLED = True  # repeated saves of one name append deltas to a journal
+SAVE_JOURNAL_COMPACT_EVERY = 20  # journal entries before a full checkpoint is written
+SAVE_BACKEND = "filesystem"  # "filesystem", "sqlite" or "memory"
+SAVE_DB_FILE = "saves.db"  # SQLite database inside SAVE_DIR for the sqlite backend
+SAVE_FSYNC = True  # flush saves to disk before reporting them written
+SAVE_GROUP_COMMIT_WINDOW = 0.5  # seconds to gather pending autosaves into one flush, 0 to disable
 
 # Display Settings
 TEXT_DELAY = 0.03  # seconds between characters for slow text
+TEXT_FRAME_RATE = 60  # frames per second for slow text output
+TEXT_SKIP_ON_KEYPRESS = True  # any key shows the rest of slow text at once
+WRAP_CACHE_SIZE = 512  # wrapped texts kept by DisplayManager.wrap_text
+WRAP_PREWARM = True  # wrap the intro, ending and puzzle intros in the background at startup
 MIN_TERMINAL_WIDTH = 40
 MAX_TERMINAL_WIDTH = 120
 DEFAULT_TERMINAL_WIDTH = 80
 DEFAULT_TERMINAL_HEIGHT = 24
+TERMINAL_SIZE_TTL = 1.0  # seconds to cache the terminal size where SIGWINCH is unavailable
+
+# Server Settings
+SERVER_HOST = "127.0.0.1"  # "0.0.0.0" to accept players from the LAN
+SERVER_PORT = 4747
+SERVER_MAX_SESSIONS = 200  # connections refused beyond this many players
+SERVER_MAX_INFLIGHT_COMMANDS = 8  # commands run at once across all sessions
+SERVER_WRITE_BUFFER_BYTES = 64 * 1024  # unsent output per client before its session waits
+SERVER_MAX_LINE_BYTES = 1024  # longest command line accepted from a client
+SERVER_PLAYER_SAVE_DIR = "players"  # per-player save directories inside SAVE_DIR
 
 # Game State Constants
 REQUIRED_ITEMS = {
@@ -52,6 +85,17 @@ COMPLEX_COMMANDS = {
     'take', 'go', 'examine', 'use', 'combine'
 }
 
+# Command chaining, e.g. "n; take badge; s"
+COMMAND_SEPARATOR = ";"
+MAX_CHAINED_COMMANDS = 20  # commands run from one input line
+
+# Words that move the player on their own
+DIRECTION_SHORTCUTS = {
+    'n': 'north', 's': 'south', 'e': 'east', 'w': 'west',
+    'u': 'up', 'd': 'down', 'nw': 'northwest', 'ne': 'northeast',
+    'sw': 'southwest', 'se': 'southeast'
+}
+
 # Initial Game State
 INITIAL_GAME_STATE: Dict[str, Any] = {
     "cipher_attempts": 3,
@@ -364,4 +408,4 @@ TROLLEY_ROUTES = {
 
 # Version Information
 GAME_VERSION = "1.0.0"
-SAVE_FILE_VERSION = "1.0.0"
\ No newline at end of file
+SAVE_FILE_VERSION = "1.1.0"
\ No newline at end of file
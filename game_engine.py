@@ -0,0 +1,184 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+import logging
+from game_manager import SeattleNoir
+from output_sink import BufferSink
+
+@dataclass
+class CommandResult:
+    """Outcome of one step of a headless game."""
+    text: str
+    # Parts of the game state the step changed, with their new values
+    delta: Dict[str, Any] = field(default_factory=dict)
+    ended: bool = False
+    # True while a puzzle waits for the answer to a prompt
+    awaiting_answer: bool = False
+    # The puzzle's question while awaiting_answer is set
+    prompt: Optional[str] = None
+
+class GameEngine:
+    """
+    Headless game session driven one command at a time.
+
+    step() takes a command string and returns the text it produced, the
+    state it changed and whether the game ended, without touching stdin
+    or stdout. When a command opens a puzzle, step() returns at the
+    puzzle's prompt with awaiting_answer set, and the next step() is taken
+    as the answer. Puzzles never block, so a step always returns as soon
+    as its output is ready.
+    """
+
+    def __init__(self, game: Optional[SeattleNoir] = None, save_dir: Optional[str] = None):
+        """
+        Args:
+            game: Game to drive, created with the engine's sink if None
+            save_dir: Save directory for a game created by the engine
+        """
+        self.logger = logging.getLogger(__name__)
+        self.output = BufferSink()
+        if game is None:
+            game = SeattleNoir(output=self.output, save_dir=save_dir)
+        else:
+            self._attach(game)
+        self.game = game
+        self.ended = False
+
+    @property
+    def awaiting_answer(self) -> bool:
+        """Whether a puzzle is waiting for the answer to its prompt."""
+        return self.game.puzzle_manager.active_puzzle is not None
+
+    def start(self) -> CommandResult:
+        """
+        Begin the session.
+
+        Returns:
+            CommandResult with the description of the first location
+        """
+        def opening() -> bool:
+            self.game.output.print("\n" + self.game.location_manager.get_location_description())
+            self.game.start_turn()
+            return True
+
+        return self._run(opening)
+
+    def step(self, command: str) -> CommandResult:
+        """
+        Run one line of player commands, or answer the open puzzle.
+
+        Args:
+            command: Command or answer as the player typed it; chained
+                commands ("n; take badge") run as a single step
+
+        Returns:
+            CommandResult for the step
+        """
+        if self.ended:
+            return CommandResult("", ended=True)
+
+        command = command.lower().strip()
+        if not command and not self.awaiting_answer:
+            return CommandResult("Please enter a command. Type 'help' for options.\n")
+
+        def turn() -> bool:
+            running = self.game.process_command(command)
+            if running:
+                self.game.start_turn()
+            else:
+                self.game.output.print("\nThanks for playing Seattle Noir!")
+            return running
+
+        return self._run(turn)
+
+    def close(self) -> None:
+        """End the session and release its resources."""
+        self.game.cleanup()
+
+    def _run(self, turn: Callable[[], bool]) -> CommandResult:
+        """
+        Run one turn and collect what it did.
+
+        Args:
+            turn: Function running the turn, returning False once the game is over
+
+        Returns:
+            CommandResult for the turn
+        """
+        before = self._capture()
+        try:
+            with self.output.command():
+                running = turn()
+        except Exception as e:
+            self.logger.error(f"Error running game step: {e}")
+            running = True
+        self.ended = not running
+
+        result = CommandResult(
+            text=self.output.take(),
+            delta=self._diff(before, self._capture()),
+            ended=self.ended,
+            awaiting_answer=self.awaiting_answer,
+            prompt=self.game.puzzle_manager.prompt
+        )
+        if self.ended:
+            self.close()
+        return result
+
+    def _attach(self, game: SeattleNoir) -> None:
+        """Point an existing game and its managers at the engine's sink."""
+        game.output = self.output
+        for manager in (game.location_manager, game.item_manager, game.puzzle_manager):
+            manager.output = self.output
+        for puzzle in game.puzzle_manager.puzzles.values():
+            puzzle.output = self.output
+
+    def _capture(self) -> Dict[str, Any]:
+        """Take the small view of the game state used to compute step deltas."""
+        game = self.game
+        location = game.current_location
+        return {
+            "current_location": location,
+            "game_state": dict(game.game_state),
+            "inventory": tuple(game.item_manager.inventory),
+            "newspaper_pieces": game.item_manager.newspaper_pieces,
+            "location_items": (location, tuple(game.location_manager.get_available_items())),
+            "puzzles_solved": {name: puzzle.solved
+                               for name, puzzle in game.puzzle_manager.puzzles.items()}
+        }
+
+    def _diff(self, before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compare two captures.
+
+        Returns:
+            Dict with an entry for each part of the state that changed
+        """
+        delta: Dict[str, Any] = {}
+        if before["current_location"] != after["current_location"]:
+            delta["current_location"] = after["current_location"]
+
+        game_state = {key: value for key, value in after["game_state"].items()
+                      if before["game_state"].get(key) != value}
+        if game_state:
+            delta["game_state"] = game_state
+
+        if before["inventory"] != after["inventory"]:
+            delta["inventory"] = {
+                "added": [item for item in after["inventory"] if item not in before["inventory"]],
+                "removed": [item for item in before["inventory"] if item not in after["inventory"]]
+            }
+        if before["newspaper_pieces"] != after["newspaper_pieces"]:
+            delta["newspaper_pieces"] = after["newspaper_pieces"]
+
+        location, items = before["location_items"]
+        # Items only leave the room the player was in when the command started
+        current_items: Tuple[str, ...] = tuple(
+            self.game.location_manager.locations.get(location, {}).get("items", []))
+        if current_items != items:
+            delta["location_items"] = {location: list(current_items)}
+
+        solved = [name for name, is_solved in after["puzzles_solved"].items()
+                  if is_solved and not before["puzzles_solved"].get(name)]
+        if solved:
+            delta["puzzles_solved"] = solved
+        return delta
@@ -2,14 +2,31 @@ from typing import Dict, List, Optional, Tuple
 import logging
 from location_manager import LocationManager
 from item_manager import ItemManager
-from utils import clear_screen, SaveLoadManager, print_text
+from utils import DisplayManager, SaveLoadManager, print_text
+from autosave_worker import AutoSaveWorker
+from change_tracker import ChangeTracker, TrackedDict
 from datetime import datetime
 import config
 from puzzles.puzzle_manager import PuzzleManager
 from natural_commands import NaturalCommandHandler
+from output_sink import OutputSink, TerminalSink
+from command_registry import CommandRegistry
+from completion import Completer, PrefixTrie
 
-def show_title_screen():
+try:
+    import readline
+except ImportError:  # Not available on every platform
+    readline = None
+
+# Every verb the player can type, filled in by the handlers on SeattleNoir
+COMMANDS = CommandRegistry()
+
+# Commands the trolley answers itself while riding
+TROLLEY_COMMANDS = frozenset(("status", "history", "look", "next"))
+
+def show_title_screen(output: Optional[OutputSink] = None):
     """Display the game's title screen with complete title and cityscape."""
+    output = output or TerminalSink()
     title_art = r"""
 ════════════════════════════════════════════════════════════════════════════════════════
 
@@ -48,28 +65,94 @@ def show_title_screen():
 
 ════════════════════════════════════════════════════════════════════════════════════════
 """
-    print(title_art)
-    input("                    Press Enter to begin your investigation...")
+    output.print(title_art)
+    output.prompt("                    Press Enter to begin your investigation...")
 
 class SeattleNoir:
     """Main game manager class that orchestrates the Seattle Noir detective game."""
+
+    INTRO_TEXT = """
+    The rain beats steadily against your office window at the Seattle Police Department. 
+    You're Detective Johnny Diamond, and a new case just landed on your desk.
+
+    World War II may be over, but Seattle is still adjusting to peacetime. The shipyards 
+    that once built warships now handle civilian cargo, and the city is growing faster 
+    than ever. But something's not right down at the waterfront.
+
+    A valuable medical shipment has disappeared, and rumors suggest it's connected to 
+    something bigger. Your investigation will take you through Seattle's historic streets,
+    from Pike Place Market to Pioneer Square's underground tunnels.
+
+    Your job: Navigate the streets of 1947 Seattle, gather clues, and solve the mystery.
+    But remember, in this city of rain and secrets, not everyone tells the truth...
+
+    Type 'help' at any time to see available commands.
+    """
+
+    ENDING_TEXT = """
+    Congratulations, Detective Diamond!
     
-    def __init__(self):
-        """Initialize the game state and managers."""
+    As the pieces come together, the full scope of the operation becomes clear. 
+    The missing medical supplies were part of a larger smuggling ring using 
+    Seattle's historic underground tunnels and converted wartime shipping routes.
+    
+    Your investigation has uncovered:
+    - The secret warehouse operation
+    - The underground tunnel network
+    - The coded communication system
+    - The connection to post-war medical supply shortages
+    
+    Thanks to your detective work, the Seattle PD raids the smuggling operation. 
+    The recovered supplies will now reach their intended destinations, helping 
+    hospitals still dealing with the aftermath of the war.
+    
+    Captain Morrison personally commends your work: "Outstanding detective work, 
+    Diamond. You've shown that even in peacetime, Seattle needs heroes who can 
+    uncover the truth."
+    
+    As the rain continues to fall outside your office window, you know that
+    Seattle is a little safer tonight, thanks to your determination and skill.
+    
+    THE END
+    
+    Historical Note: In the post-WWII period, Seattle's transformation from a 
+    wartime industrial center to a civilian port created unique challenges for 
+    law enforcement. The city's complex network of underground tunnels, dating 
+    back to the Great Seattle Fire of 1889, often featured in criminal activities 
+    of the era.
+    """
+    
+    def __init__(self, output: Optional[OutputSink] = None, save_dir: Optional[str] = None):
+        """
+        Initialize the game state and managers.
+
+        Args:
+            output: Session output sink, defaults to the local terminal
+            save_dir: Directory for this game's saves, defaults to config.SAVE_DIR
+        """
+        self.output = output or TerminalSink()
+        # Tracks changes to saved state so autosaves can be skipped
+        self.changes = ChangeTracker()
         self.game_state = config.INITIAL_GAME_STATE.copy()
-        self.command_handler = NaturalCommandHandler()
+        self.command_handler = NaturalCommandHandler(COMMANDS)
+        self.completer = Completer(VERB_TRIE)
+        self._completions: List[str] = []
+        # Set when the last command didn't do what was asked
+        self.command_failed = False
         
         # Initialize managers
-        self.location_manager = LocationManager()
-        self.puzzle_manager = PuzzleManager()
-        self.item_manager = ItemManager()
-        self.save_load_manager = SaveLoadManager(config.SAVE_DIR)
+        self.location_manager = LocationManager(self.changes, self.output)
+        self.puzzle_manager = PuzzleManager(self.changes, self.output)
+        self.item_manager = ItemManager(self.changes, self.output)
+        self.save_load_manager = SaveLoadManager(save_dir or config.SAVE_DIR)
+        self.auto_save_worker = AutoSaveWorker(self.save_load_manager)
         self.last_save_time = datetime.now()
         self.auto_save_interval = config.AUTO_SAVE_INTERVAL
         
         # Game state properties
         self.newspaper_pieces = 0
         self.current_location = config.STARTING_LOCATION
+        self.ending_shown = False
         
         # Configure logging
         logging.basicConfig(
@@ -77,254 +160,507 @@ class SeattleNoir:
             level=logging.INFO,
             format=config.LOG_FORMAT
         )
+        self.changes.clear()
+        
+        DisplayManager.install_resize_handler()
+        if config.WRAP_PREWARM:
+            # Only the fixed texts shown through print_text get wrapped
+            texts = [self.INTRO_TEXT, self.ENDING_TEXT]
+            texts.extend(puzzle.INTRO_TEXT for puzzle in self.puzzle_manager.puzzles.values() if puzzle.INTRO_TEXT)
+            DisplayManager.prewarm_wrap_cache(texts)
+
+    @property
+    def game_state(self) -> Dict:
+        """Game state flags; every change is recorded for autosaving."""
+        return self._game_state
+
+    @game_state.setter
+    def game_state(self, state: Dict) -> None:
+        self._game_state = TrackedDict(state, self.changes)
+        self.changes.mark("game_state")
+
+    @property
+    def current_location(self) -> str:
+        """ID of the player's current location."""
+        return self._current_location
+
+    @current_location.setter
+    def current_location(self, location: str) -> None:
+        if getattr(self, '_current_location', None) != location:
+            self.changes.mark("current_location")
+        self._current_location = location
 
     def show_intro(self) -> None:
         """Display the game's introduction sequence."""
-        clear_screen()
-        show_title_screen()  
+        DisplayManager.clear_screen(self.output.terminal)
+        show_title_screen(self.output)  
     
         # Check for existing saves
         saves = self.save_load_manager.list_saves()
         if saves:
-            print("\nFound existing saves:")
+            self.output.print("\nFound existing saves:")
             for save in saves:
-                print(f"- {save['name']} ({save['date']})")
-                print(f"  Location: {save['location']}")
+                self.output.print(f"- {save['name']} ({save['date']})")
+                self.output.print(f"  Location: {save['location']}")
         
             while True:
-                choice = input("\nWould you like to load a save? (enter save name or 'new' for new game): ").strip().lower()
+                choice = self.output.prompt("\nWould you like to load a save? (enter save name or 'new' for new game): ").strip().lower()
                 if choice == 'new':
                     break
                 elif choice in [save['name'] for save in saves]:
                     if self.save_load_manager.load_game(self, choice):
-                        print(f"\nLoaded save: {choice}")
-                        print("\n" + self.location_manager.get_location_description())
+                        self.changes.clear()
+                        self.output.print(f"\nLoaded save: {choice}")
+                        self.output.print("\n" + self.location_manager.get_location_description())
                         return  # Skip intro text if loading a save
                     else:
-                        print("\nFailed to load save.")
+                        self.output.print("\nFailed to load save.")
                 else:
-                    print("\nInvalid save name. Enter a save name from the list or 'new' for new game.")
+                    self.output.print("\nInvalid save name. Enter a save name from the list or 'new' for new game.")
     
         # Show intro text for new game
-        intro_text = """
-        The rain beats steadily against your office window at the Seattle Police Department. 
-        You're Detective Johnny Diamond, and a new case just landed on your desk.
-    
-        World War II may be over, but Seattle is still adjusting to peacetime. The shipyards 
-        that once built warships now handle civilian cargo, and the city is growing faster 
-        than ever. But something's not right down at the waterfront.
-    
-        A valuable medical shipment has disappeared, and rumors suggest it's connected to 
-        something bigger. Your investigation will take you through Seattle's historic streets,
-        from Pike Place Market to Pioneer Square's underground tunnels.
-    
-        Your job: Navigate the streets of 1947 Seattle, gather clues, and solve the mystery.
-        But remember, in this city of rain and secrets, not everyone tells the truth...
-    
-        Type 'help' at any time to see available commands.
-        """
-        print_text(intro_text, delay=0.03)
-        input("\nPress Enter to begin your investigation...")
+        print_text(self.INTRO_TEXT, delay=0.03, output=self.output)
+        self.output.prompt("\nPress Enter to begin your investigation...")
 
 
 
     def show_help(self) -> None:
         """Display available commands to the player."""
-        print("\nAvailable commands:")
-        print("- look: Examine your surroundings")
-        print("- inventory: Check your belongings")
-        print("- take [item]: Pick up an item")
-        print("- go [direction]: Move to a new location")
-        print("- examine [item]: Look at an item closely")
-        print("- talk: Speak to anyone present")
-        print("- use [item]: Use an item in your inventory")
-        print("- combine [item1] [item2]: Try to use two items together")
-        print("- history: Learn historical facts about your location")
-        print("- solve: Attempt to solve a puzzle in your location")
-        print("- quit: Exit the game")
-        print("- save [name]: Save your game")
-        print("- load [name]: Load a saved game")
-        print("- saves: List available saves")
-        print("- help: Show this help message")
-
-    def handle_save_load_commands(self, command: str) -> bool:
-        """Handle save/load related commands."""
-        cmd_parts = command.split()
-        cmd_type = cmd_parts[0]
-
-        if cmd_type == "save":
-            save_name = cmd_parts[1] if len(cmd_parts) > 1 else None
-            if self.save_load_manager.save_game(self, save_name):
-                print("\nGame saved successfully.")
-            else:
-                print("\nFailed to save game.")
-            return True
-
-        elif cmd_type == "load":
-            if len(cmd_parts) < 2:
-                print("\nPlease specify a save name to load.")
-                return True
-            
-            save_name = cmd_parts[1]
-            if self.save_load_manager.load_game(self, save_name):
-                print(f"\nLoaded save: {save_name}")
-                print("\n" + self.location_manager.get_location_description())
-            else:
-                print("\nFailed to load save.")
-            return True
-
-        elif cmd_type == "saves":
-            saves = self.save_load_manager.list_saves()
-            if not saves:
-                print("\nNo save files found.")
-                return True
+        self.output.print("\nAvailable commands:")
+        self.output.print("- look: Examine your surroundings")
+        self.output.print("- inventory: Check your belongings")
+        self.output.print("- take [item]: Pick up an item")
+        self.output.print("- go [direction]: Move to a new location")
+        self.output.print("- examine [item]: Look at an item closely")
+        self.output.print("- talk: Speak to anyone present")
+        self.output.print("- use [item]: Use an item in your inventory")
+        self.output.print("- combine [item1] [item2]: Try to use two items together")
+        self.output.print("- history: Learn historical facts about your location")
+        self.output.print("- solve: Attempt to solve a puzzle in your location")
+        self.output.print("- quit: Exit the game")
+        self.output.print("- save [name]: Save your game")
+        self.output.print("- load [name]: Load a saved game")
+        self.output.print("- saves: List available saves")
+        self.output.print("- help: Show this help message")
+
+    def auto_save_due(self, current_time: datetime) -> bool:
+        """
+        Check whether an autosave should be written now.
+        
+        Args:
+            current_time: Time of the check
             
-            print("\nAvailable saves:")
-            for save in saves:
-                print(f"- {save['name']} ({save['date']})")
-                print(f"  Location: {save['location']}")
+        Returns:
+            bool: True if an autosave is due
+        """
+        if config.AUTO_SAVE_ONLY_WHEN_CHANGED and not self.changes.dirty:
+            return False
+        if (config.AUTO_SAVE_AFTER_COMMANDS
+                and self.changes.mutating_commands >= config.AUTO_SAVE_AFTER_COMMANDS):
             return True
-
-        return False
+        return (current_time - self.last_save_time).total_seconds() >= config.AUTO_SAVE_INTERVAL
 
     def check_auto_save(self) -> None:
         """Check if it's time for an auto-save and manage save files."""
         current_time = datetime.now()
-        if (current_time - self.last_save_time).total_seconds() >= config.AUTO_SAVE_INTERVAL:
+        if self.auto_save_due(current_time):
             try:
+                if config.AUTO_SAVE_IN_BACKGROUND:
+                    # Only the snapshot is taken on the player's turn
+                    snapshot = self.save_load_manager.create_snapshot(self)
+                    if self.auto_save_worker.submit(snapshot):
+                        self.last_save_time = current_time
+                        self.changes.clear()
+                    return
+
                 # Manage saves first
                 self.save_load_manager.manage_saves(config.MAX_SAVE_DIR_SIZE_MB)
             
                 # Then create new auto-save
                 if self.save_load_manager.auto_save(self):
                     self.last_save_time = current_time
+                    self.changes.clear()
                 
             except Exception as e:
                 logging.error(f"Auto-save error: {e}")
 
     def process_command(self, command: str) -> bool:
-        """Process player commands and return False if quitting, True otherwise."""
+        """
+        Process a line of player commands and return False if quitting, True otherwise.
+
+        A line may chain commands with COMMAND_SEPARATOR, e.g.
+        "n; take badge; s". They run in order as if typed one at a time,
+        but share one output flush and one autosave check, and the first
+        command that fails skips the rest of the line.
+        """
+        with self.output.command():
+            result = self.run_commands(self.split_commands(command))
+            self.check_auto_save()
+        return result
+
+    def split_commands(self, line: str) -> List[str]:
+        """
+        Split an input line into its chained commands.
+
+        Returns:
+            List of commands, a blank line giving one empty command
+        """
+        if config.COMMAND_SEPARATOR not in line:
+            return [line]
+        commands = [part.strip() for part in line.split(config.COMMAND_SEPARATOR) if part.strip()]
+        if len(commands) > config.MAX_CHAINED_COMMANDS:
+            self.output.print(f"Only the first {config.MAX_CHAINED_COMMANDS} commands on a line are run.")
+            del commands[config.MAX_CHAINED_COMMANDS:]
+        return commands or [""]
+
+    def run_commands(self, commands: List[str]) -> bool:
+        """
+        Run chained commands until one fails or quits.
+
+        Args:
+            commands: Commands in the order typed
+
+        Returns:
+            bool: False if a command quit the game
+        """
+        for position, command in enumerate(commands):
+            if position:
+                # Whatever is due between turns happens between chained commands too
+                self.start_turn()
+            running = self.execute_command(command)
+            self.changes.end_command()
+            if not running:
+                return False
+            remaining = commands[position + 1:]
+            if self.command_failed and remaining:
+                self.output.print(f"\nSkipped: {'; '.join(remaining)}")
+                break
+        return True
+
+    def execute_command(self, command: str) -> bool:
+        """
+        Run a single command without the autosave check.
+
+        Sets command_failed when the command couldn't be carried out.
+        """
+        self.command_failed = False
         try:
+            # While a puzzle is open the input is its answer
+            if self.puzzle_manager.active_puzzle:
+                intent, _ = self.command_handler.understand_command(command, "puzzle")
+                # Any way of saying goodbye leaves the puzzle
+                self.puzzle_manager.feed("quit" if intent == "leave_puzzle" else command, self.game_state)
+                return True
+
             # Store command for trolley system
             self.location_manager.last_command = command
 
-            # Split the command into parts
-            parts = command.split()
-            if not parts:
-                print("Please enter a command. Type 'help' for options.")
+            cmd_type, cmd_args = self.parse_command(command)
+            if not cmd_type:
+                self.output.print("Please enter a command. Type 'help' for options.")
+                self.command_failed = True
                 return True
 
-            # Get base command and arguments
-            cmd_type = parts[0].lower()
-            cmd_args = parts[1:] if len(parts) > 1 else [""]
-
-            # Handle directional shortcuts (new!)
-            direction_shortcuts = {
-                'n': 'north', 's': 'south', 'e': 'east', 'w': 'west',
-                'u': 'up', 'd': 'down', 'nw': 'northwest', 'ne': 'northeast',
-                'sw': 'southwest', 'se': 'southeast'
-            }
-            if cmd_type in direction_shortcuts:
-                return self.handle_movement_command(direction_shortcuts[cmd_type])
-
-            # Handle natural movement (new!)
-            if cmd_type in direction_shortcuts.values():
-                return self.handle_movement_command(cmd_type)
-
-            # Handle save/load commands first
-            if cmd_type in ('save', 'load', 'saves'):
-                return self.handle_save_load_commands(command)
-            
             # Special trolley commands
-            if self.current_location == "trolley" and cmd_type in ["status", "history", "look", "next"]:
+            if self.current_location == "trolley" and cmd_type in TROLLEY_COMMANDS:
                 self.location_manager.handle_trolley()
                 return True
 
-            # Handle combine command separately due to multiple arguments
-            if cmd_type == "combine":
-                if len(cmd_args) != 2:
-                    print("Combine command requires two items. Example: combine map compass")
+            # Abbreviated verbs, e.g. "exam" for "examine"
+            if cmd_type not in COMMANDS:
+                cmd_type = self.expand_word(cmd_type, "verb")
+                if cmd_type is None:
+                    self.command_failed = True
                     return True
-                return (self.item_manager.combine_items(cmd_args[0], cmd_args[1], self.game_state), True)[1]
-
-            # Handle puzzle solving
-            if command.startswith('solve'):
-                try:
 
-                    # First check if there's a puzzle available
-                    available_puzzles = self.puzzle_manager.get_available_puzzles(self.current_location)
-                    if not available_puzzles:
-                        print("\nThere is no puzzle to solve here.")
-                        return True  # Return True to continue the game    
-
-                    return self.puzzle_manager.handle_puzzle(
-                        self.current_location,
-                        self.item_manager.get_inventory(),
-                        self.game_state
-                    )
-                except Exception as e:
-                    logging.error(f"Error in puzzle: {e}")
-                    print("\nPuzzle system error. Your progress has been saved.")
-                    return True
+            resolved = COMMANDS.resolve(cmd_type, cmd_args)
+            if resolved is None:
+                self.output.print("Invalid command. Type 'help' for a list of commands.")
+                self.command_failed = True
+                return True
 
-            # Handle item name variations (new!)
-            if cmd_type in ['take', 'get', 'grab', 'pickup']:
-                item = ' '.join(cmd_args).replace(' ', '_')
-                return (self.handle_take_command(item), True)[1]
-
-            # Single argument commands with their variations (new!)
-            command_variations = {
-                'quit': ['quit', 'exit', 'bye'],
-                'help': ['help', 'h', '?'],
-                'look': ['look', 'l', 'examine'],
-                'inventory': ['inventory', 'inv', 'i'],
-                'take': ['take', 'get', 'grab', 'pickup'],
-                'go': ['go', 'move', 'walk'],
-                'examine': ['examine', 'x', 'check', 'read'],
-                'talk': ['talk', 'speak', 'chat'],
-                'history': ['history', 'hist'],
-                'use': ['use', 'utilize']
-            }
-
-            # Find the base command from variations
-            base_cmd = next((base for base, variations in command_variations.items() 
-                            if cmd_type in variations), cmd_type)
-
-            # Use your existing command handlers with the base command
-            command_handlers = {
-                "quit": lambda: False,
-                "help": lambda: (self.show_help(), True)[1],
-                "look": lambda: (print("\n" + self.location_manager.get_location_description()), True)[1],
-                "inventory": lambda: (self.item_manager.show_inventory(), True)[1],
-                "take": lambda: (self.handle_take_command(cmd_args[0]), True)[1],
-                "go": lambda: self.handle_movement_command(cmd_args[0]),
-                "examine": lambda: (self.item_manager.examine_item(cmd_args[0], self.location_manager.get_available_items(), self.game_state), True)[1],
-                "talk": lambda: (self.handle_talk_command(), True)[1],
-                "history": lambda: (self.location_manager.show_historical_note(self.current_location), True)[1],
-                "use": lambda: (self.item_manager.use_item(cmd_args[0], self.current_location, self.game_state), True)[1]
-            }
-
-            if base_cmd not in command_handlers:
-                print("Invalid command. Type 'help' for a list of commands.")
+            handler, args = resolved
+            if not handler.accepts(len(args)):
+                self.output.print(handler.usage or "Invalid command. Type 'help' for a list of commands.")
+                self.command_failed = True
                 return True
 
-            result = command_handlers[base_cmd]()
-            self.check_auto_save()
-            return result
+            if handler.completes and args:
+                self.sync_completions()
+                args = [self.resolve_name(arg, handler.completes) for arg in args]
+                if None in args:
+                    self.command_failed = True
+                    return True
+            return handler.handler(self, args)
 
         except Exception as e:
             logging.error(f"Error processing command '{command}': {e}")
-            print(f"An error occurred: {e}")
-            print("Type 'help' for a list of valid commands.")
+            self.output.print(f"An error occurred: {e}")
+            self.output.print("Type 'help' for a list of valid commands.")
+            self.command_failed = True
             return True
     
-    def handle_take_command(self, item: str) -> None:
-        """Handle the take command and update game state accordingly."""
+    def parse_command(self, command: str) -> Tuple[str, List[str]]:
+        """
+        Turn player input into a game verb and its arguments.
+
+        Natural phrasings like "pick up the badge" or "look around" go
+        through the natural language parser; exact game commands and
+        anything it doesn't recognise are taken word for word.
+
+        Args:
+            command: The player's input
+
+        Returns:
+            Tuple of (verb, arguments); the verb is empty for blank input
+        """
+        intent, argument = self.command_handler.understand_command(command)
+        if intent == "invalid":
+            return "", []
+        if intent == "unknown":
+            parts = command.split()
+            return parts[0].lower(), parts[1:]
+        if intent in ("take", "examine") and argument:
+            # Typos are fixed later by resolve_name, after abbreviations
+            return intent, [self.command_handler.normalize_item_name(argument)]
+        return intent, argument.split()
+
+    def sync_completions(self) -> None:
+        """Bring the completer up to date with the current room and inventory."""
+        self.completer.sync(
+            self.location_manager.get_available_items() + self.item_manager.get_inventory(),
+            self.location_manager.get_available_exits()
+        )
+
+    def expand_word(self, word: str, kind: str) -> Optional[str]:
+        """
+        Expand a unique abbreviation of a verb, item or exit.
+
+        Args:
+            word: What the player typed
+            kind: "verb", "item" or "exit"
+
+        Returns:
+            The full word, the word unchanged if nothing starts with it,
+            or None after listing the choices when it's ambiguous
+        """
+        if kind != "verb" and word in COMMANDS:
+            # Whole direction words like "north" are never abbreviations
+            return word
+        full, choices = self.completer.expand(word, kind)
+        if choices:
+            self.output.print(f"Did you mean: {', '.join(choices)}?")
+            return None
+        return full
+
+    def resolve_name(self, word: str, kind: str) -> Optional[str]:
+        """
+        Work out which item or exit an argument means.
+
+        Exact names are used as typed, then unique abbreviations of a
+        reachable name are expanded, and only when no reachable name
+        starts with the word is it corrected to a reachable name of the
+        same kind that it looks like a misspelling of.
+
+        Args:
+            word: The argument as typed
+            kind: "item" or "exit"
+
+        Returns:
+            The name to use, or None after listing the choices when an
+            abbreviation is ambiguous
+        """
+        if word in self.completer.reachable(kind):
+            return word
+        word = self.expand_word(word, kind)
+        if word is None or word in self.completer.reachable(kind) or word in COMMANDS:
+            return word
+        return self.command_handler.correct_name(word, self.completer.reachable(kind), kind)
+
+    def completions(self, line: str) -> List[str]:
+        """
+        Get the ways to finish the last word of a partly typed command.
+
+        Args:
+            line: The command typed so far
+
+        Returns:
+            List of full words, in alphabetical order
+        """
+        self.sync_completions()
+        words = line.split()
+        kinds = ("item", "exit")
+        if words and (line.endswith(" ") or len(words) > 1):
+            verb, _ = self.completer.expand(words[0].lower(), "verb")
+            resolved = COMMANDS.resolve(verb)
+            if resolved is not None and resolved[0].completes:
+                kinds = (resolved[0].completes,)
+        return self.completer.candidates(line.lower(), kinds)
+
+    def complete(self, text: str, state: int) -> Optional[str]:
+        """readline completer returning the state-th completion of the current word."""
+        if state == 0:
+            line = readline.get_line_buffer()[:readline.get_endidx()]
+            self._completions = self.completions(line)
+        return self._completions[state] if state < len(self._completions) else None
+
+    def install_tab_completion(self) -> None:
+        """Complete verbs, items and exits with the Tab key when playing in a terminal."""
+        if readline is None or not isinstance(self.output, TerminalSink):
+            return
+        if self.output.input_stream is not None or not self.output.isatty():
+            return
+        readline.set_completer(self.complete)
+        # Item names contain underscores, so only whitespace ends a word
+        readline.set_completer_delims(" \t\n")
+        readline.parse_and_bind("tab: complete")
+
+    @COMMANDS.command("quit", "exit", "bye", exact=True)
+    def quit_command(self, args: List[str]) -> bool:
+        """End the game."""
+        return False
+
+    @COMMANDS.command("help", "h", "?")
+    def help_command(self, args: List[str]) -> bool:
+        """Show the command list."""
+        self.show_help()
+        return True
+
+    @COMMANDS.command("look", "l")
+    def look_command(self, args: List[str]) -> bool:
+        """Describe the current location."""
+        self.output.print("\n" + self.location_manager.get_location_description())
+        return True
+
+    @COMMANDS.command("inventory", "inv", "i")
+    def inventory_command(self, args: List[str]) -> bool:
+        """Show what the player is carrying."""
+        self.item_manager.show_inventory()
+        return True
+
+    @COMMANDS.command("take", "get", "grab", "pickup", min_args=1,
+                      usage="Take what? Example: take badge", completes="item")
+    def take_command(self, args: List[str]) -> bool:
+        """Pick up an item; multi-word names are joined with underscores."""
+        self.command_failed = not self.handle_take_command("_".join(args))
+        return True
+
+    @COMMANDS.command("go", "move", "walk", min_args=1,
+                      usage="Go where? Example: go north", completes="exit")
+    def go_command(self, args: List[str]) -> bool:
+        """Move in a direction."""
+        return self.handle_movement_command(args[0])
+
+    @COMMANDS.command("examine", "x", "check", "read", min_args=1,
+                      usage="Examine what? Example: examine badge", completes="item")
+    def examine_command(self, args: List[str]) -> bool:
+        """Look closely at an item here or in the inventory."""
+        self.command_failed = not self.item_manager.examine_item(
+            args[0], self.location_manager.get_available_items(), self.game_state)
+        return True
+
+    @COMMANDS.command("talk", "speak", "chat")
+    def talk_command(self, args: List[str]) -> bool:
+        """Talk to whoever is here."""
+        self.handle_talk_command()
+        return True
+
+    @COMMANDS.command("history", "hist")
+    def history_command(self, args: List[str]) -> bool:
+        """Show the historical note for the current location."""
+        self.location_manager.show_historical_note(self.current_location)
+        return True
+
+    @COMMANDS.command("use", "utilize", min_args=1,
+                      usage="Use what? Example: use radio", completes="item")
+    def use_command(self, args: List[str]) -> bool:
+        """Use an item from the inventory."""
+        self.command_failed = not self.item_manager.use_item(args[0], self.current_location, self.game_state)
+        return True
+
+    @COMMANDS.command("combine", min_args=2, max_args=2,
+                      usage="Combine command requires two items. Example: combine map compass", completes="item")
+    def combine_command(self, args: List[str]) -> bool:
+        """Try two inventory items together."""
+        self.command_failed = not self.item_manager.combine_items(args[0], args[1], self.game_state)
+        return True
+
+    @COMMANDS.command("solve")
+    def solve_command(self, args: List[str]) -> bool:
+        """Start the puzzle at the current location."""
+        try:
+            # First check if there's a puzzle available
+            available_puzzles = self.puzzle_manager.get_available_puzzles(self.current_location)
+            if not available_puzzles:
+                self.output.print("\nThere is no puzzle to solve here.")
+                self.command_failed = True
+                return True  # Return True to continue the game
+
+            # An unsolved puzzle doesn't end the game
+            outcome = self.puzzle_manager.handle_puzzle(
+                self.current_location,
+                self.item_manager.get_inventory(),
+                self.game_state
+            )
+            self.command_failed = outcome is False
+        except Exception as e:
+            logging.error(f"Error in puzzle: {e}")
+            self.output.print("\nPuzzle system error. Your progress has been saved.")
+            self.command_failed = True
+        return True
+
+    @COMMANDS.command("save")
+    def save_command(self, args: List[str]) -> bool:
+        """Save the game, under a name if one is given."""
+        save_name = args[0] if args else None
+        if self.save_load_manager.save_game(self, save_name):
+            self.changes.clear()
+            self.output.print("\nGame saved successfully.")
+        else:
+            self.output.print("\nFailed to save game.")
+            self.command_failed = True
+        return True
+
+    @COMMANDS.command("load", min_args=1, usage="\nPlease specify a save name to load.",
+                      exact=True)
+    def load_command(self, args: List[str]) -> bool:
+        """Load a named save."""
+        save_name = args[0]
+        if self.save_load_manager.load_game(self, save_name):
+            self.changes.clear()
+            self.output.print(f"\nLoaded save: {save_name}")
+            self.output.print("\n" + self.location_manager.get_location_description())
+        else:
+            self.output.print("\nFailed to load save.")
+            self.command_failed = True
+        return True
+
+    @COMMANDS.command("saves")
+    def saves_command(self, args: List[str]) -> bool:
+        """List the available saves."""
+        saves = self.save_load_manager.list_saves()
+        if not saves:
+            self.output.print("\nNo save files found.")
+            return True
+
+        self.output.print("\nAvailable saves:")
+        for save in saves:
+            self.output.print(f"- {save['name']} ({save['date']})")
+            self.output.print(f"  Location: {save['location']}")
+        return True
+
+    def handle_take_command(self, item: str) -> bool:
+        """
+        Handle the take command and update game state accordingly.
+
+        Returns:
+            bool: True if the item was taken
+        """
         available_items = self.location_manager.get_available_items()
         result = self.item_manager.take_item(item, available_items, self.game_state)
         if result:
             self.location_manager.remove_item(item)
-            
+        return result
 
     def handle_movement_command(self, direction: str) -> bool:
         """Handle movement commands and location transitions."""
@@ -334,8 +670,9 @@ class SeattleNoir:
         
         if self.location_manager.move_to_location(direction, self.game_state):
             self.current_location = self.location_manager.current_location
-            print("\n" + self.location_manager.get_location_description())
+            self.output.print("\n" + self.location_manager.get_location_description())
             return True
+        self.command_failed = True
         return True
 
     def handle_talk_command(self) -> None:
@@ -355,96 +692,85 @@ class SeattleNoir:
     
     def show_ending(self) -> None:
         """Display the game's ending sequence."""
-        ending_text = """
-        Congratulations, Detective Diamond!
-        
-        As the pieces come together, the full scope of the operation becomes clear. 
-        The missing medical supplies were part of a larger smuggling ring using 
-        Seattle's historic underground tunnels and converted wartime shipping routes.
-        
-        Your investigation has uncovered:
-        - The secret warehouse operation
-        - The underground tunnel network
-        - The coded communication system
-        - The connection to post-war medical supply shortages
-        
-        Thanks to your detective work, the Seattle PD raids the smuggling operation. 
-        The recovered supplies will now reach their intended destinations, helping 
-        hospitals still dealing with the aftermath of the war.
-        
-        Captain Morrison personally commends your work: "Outstanding detective work, 
-        Diamond. You've shown that even in peacetime, Seattle needs heroes who can 
-        uncover the truth."
-        
-        As the rain continues to fall outside your office window, you know that
-        Seattle is a little safer tonight, thanks to your determination and skill.
-        
-        THE END
-        
-        Historical Note: In the post-WWII period, Seattle's transformation from a 
-        wartime industrial center to a civilian port created unique challenges for 
-        law enforcement. The city's complex network of underground tunnels, dating 
-        back to the Great Seattle Fire of 1889, often featured in criminal activities 
-        of the era.
-        """
-        print_text(ending_text)
+        print_text(self.ENDING_TEXT, output=self.output)
+
+    def start_turn(self) -> None:
+        """Show anything due before the player's next command."""
+        if self.puzzle_manager.active_puzzle:
+            return
+
+        # Check win condition
+        if self.check_game_progress() and not self.ending_shown:
+            self.show_ending()
+            self.output.print("\nType 'quit' to exit or continue exploring.")
+            self.ending_shown = True
+
+        # Handle special locations
+        if self.current_location == "trolley":
+            self.location_manager.handle_trolley()
 
     def play(self) -> None:
         """Main game loop."""
         try:
+            self.install_tab_completion()
             self.show_intro()
             # Show initial location description after intro
-            print("\n" + self.location_manager.get_location_description())
+            self.output.print("\n" + self.location_manager.get_location_description())
         
             playing = True
             while playing:
                 try:
-                    # Check win condition
-                    if self.check_game_progress():
-                        self.show_ending()
-                        print("\nType 'quit' to exit or continue exploring.")
-                
-                    # Handle special locations
-                    if self.current_location == "trolley":
-                        self.location_manager.handle_trolley()
+                    self.start_turn()
                 
                     # Get and process player command
-                    command = input("\nWhat would you like to do? ").lower().strip()
-                    if not command:
-                        print("Please enter a command. Type 'help' for options.")
+                    prompt = self.puzzle_manager.prompt or "\nWhat would you like to do? "
+                    command = self.output.prompt(prompt).lower().strip()
+                    if not command and not self.puzzle_manager.active_puzzle:
+                        self.output.print("Please enter a command. Type 'help' for options.")
                         continue
                     
                     playing = self.process_command(command)
                     
                 except KeyboardInterrupt:
-                    print("\nGame paused. Type 'quit' to exit or press Enter to continue.")
+                    self.output.print("\nGame paused. Type 'quit' to exit or press Enter to continue.")
                     try:
-                        if input().lower().strip() == 'quit':
+                        if self.output.prompt().lower().strip() == 'quit':
                             playing = False
                     except:
                         continue
                 except Exception as e:
                     logging.error(f"Error in game loop: {e}")
-                    print(f"\nAn error occurred: {e}")
-                    print("Type 'quit' to exit or press Enter to continue.")
-                    if input().lower().strip() == 'quit':
+                    self.output.print(f"\nAn error occurred: {e}")
+                    self.output.print("Type 'quit' to exit or press Enter to continue.")
+                    if self.output.prompt().lower().strip() == 'quit':
                         playing = False
 
         except Exception as e:
             logging.error(f"Critical game error: {e}")
-            print(f"\nCritical error occurred: {e}")
+            self.output.print(f"\nCritical error occurred: {e}")
         finally:
-            print("\nThanks for playing Seattle Noir!")
+            self.output.print("\nThanks for playing Seattle Noir!")
             self.cleanup()
 
     def cleanup(self) -> None:
         """Cleanup method to handle any necessary resource cleanup when the game ends."""
         try:
+            self.auto_save_worker.stop(timeout=5.0)
+            self.save_load_manager.close()
             logging.info("Game session ended normally")
         except Exception as e:
             logging.error(f"Cleanup error: {e}")
-            print(f"Error during cleanup: {e}")
+            self.output.print(f"Error during cleanup: {e}")
+
+# Directions and their shortcuts move on their own
+for _shortcut, _direction in config.DIRECTION_SHORTCUTS.items():
+    COMMANDS.alias(_shortcut, "go", _direction)
+    COMMANDS.alias(_direction, "go", _direction)
+
+# Command words for abbreviations and tab completion; quitting and
+# loading are left out so a short typo can't end or replace the game
+VERB_TRIE = PrefixTrie(COMMANDS.abbreviable_words())
 
 if __name__ == "__main__":
     game = SeattleNoir()
-    game.play()
\ No newline at end of file
+    game.play()
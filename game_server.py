@@ -0,0 +1,313 @@
+from typing import Callable, Dict, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import argparse
+import asyncio
+import logging
+import re
+import config
+from game_engine import CommandResult, GameEngine
+
+# Telnet protocol bytes
+IAC = 255
+SB = 250
+SE = 240
+WILL, WONT, DO, DONT = 251, 252, 253, 254
+
+COMMAND_PROMPT = "\n> "
+NAME_PROMPT = "\nYour name, detective: "
+PLAYER_NAME = re.compile(r"^[A-Za-z0-9_-]{1,24}$")
+
+def strip_telnet(data: bytes) -> bytes:
+    """
+    Remove telnet option negotiation from received bytes.
+
+    Args:
+        data: Bytes as received from a telnet client
+
+    Returns:
+        bytes: The data with all IAC sequences removed
+    """
+    if IAC not in data:
+        return data
+    result = bytearray()
+    i = 0
+    while i < len(data):
+        byte = data[i]
+        if byte != IAC:
+            result.append(byte)
+            i += 1
+            continue
+        command = data[i + 1] if i + 1 < len(data) else None
+        if command == IAC:
+            # Escaped 0xFF data byte
+            result.append(IAC)
+            i += 2
+        elif command in (WILL, WONT, DO, DONT):
+            i += 3
+        elif command == SB:
+            end = data.find(bytes((IAC, SE)), i + 2)
+            i = len(data) if end < 0 else end + 2
+        else:
+            i += 2
+    return bytes(result)
+
+class GameSession:
+    """One connected player with their own isolated game."""
+
+    def __init__(self, server: 'GameServer', reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.logger = logging.getLogger(__name__)
+        self.name: Optional[str] = None
+        self.engine: Optional[GameEngine] = None
+        self.peer = writer.get_extra_info('peername')
+
+    async def run(self) -> None:
+        """Greet the player, then run their commands until they quit or disconnect."""
+        try:
+            await self.send("Welcome to Seattle Noir.\n")
+            if not await self._claim_name():
+                return
+            save_dir = Path(self.server.save_dir) / config.SERVER_PLAYER_SAVE_DIR / self.name.lower()
+            self.engine = await self.server.run_command(GameEngine, save_dir=save_dir)
+            result = await self.server.run_command(self.engine.start)
+            await self.send_result(result)
+
+            while not result.ended:
+                line = await self.read_line()
+                if line is None:
+                    break
+                result = await self.server.run_command(self.engine.step, line)
+                await self.send_result(result)
+
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            self.logger.info(f"Connection from {self.peer} lost: {e}")
+        finally:
+            await self.close()
+
+    async def read_line(self) -> Optional[str]:
+        """
+        Read one line from the client.
+
+        Returns:
+            The line without its line ending, None once the client disconnected
+        """
+        while True:
+            try:
+                data = await self.reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                # Disconnected; a last line without a line ending still counts
+                data = e.partial
+            except asyncio.LimitOverrunError:
+                # Longer than SERVER_MAX_LINE_BYTES
+                await self._discard_line()
+                await self.send("That's too long. Try a shorter command." + COMMAND_PROMPT)
+                continue
+            if not data:
+                return None
+            return strip_telnet(data).decode("utf-8", errors="replace").rstrip("\r\n")
+
+    async def _discard_line(self) -> None:
+        """
+        Skip the rest of an overlong line, up to and including its line ending.
+
+        The line may still be arriving, so this keeps reading and dropping
+        what came in until the line ending shows up, rather than letting
+        the tail of the line be read as a command of its own.
+        """
+        while True:
+            try:
+                await self.reader.readuntil(b"\n")
+                return
+            except asyncio.LimitOverrunError as e:
+                await self.reader.readexactly(e.consumed)
+            except asyncio.IncompleteReadError:
+                return
+
+    async def send(self, text: str) -> None:
+        """
+        Write text to the client, waiting while its send buffer is full.
+
+        Args:
+            text: Text to write
+        """
+        self.writer.write(text.replace("\n", "\r\n").encode("utf-8", errors="replace"))
+        # Slow clients hold up only their own session
+        await self.writer.drain()
+
+    async def send_result(self, result: CommandResult) -> None:
+        """Write a step's output followed by the next prompt."""
+        if result.ended:
+            await self.send(result.text)
+        else:
+            await self.send(result.text + (result.prompt or COMMAND_PROMPT))
+
+    async def close(self) -> None:
+        """End the player's game and drop the connection."""
+        self.server.release_name(self)
+        if self.engine and not self.engine.ended:
+            try:
+                await self.server.run_command(self.engine.close)
+            except Exception as e:
+                self.logger.error(f"Error closing session for {self.name}: {e}")
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def _claim_name(self) -> bool:
+        """
+        Ask for a player name that isn't already connected.
+
+        Returns:
+            bool: True once a name was claimed, False if the client left
+        """
+        while True:
+            await self.send(NAME_PROMPT)
+            name = await self.read_line()
+            if name is None:
+                return False
+            name = name.strip()
+            if not PLAYER_NAME.match(name):
+                await self.send("Use up to 24 letters, digits, '-' or '_'.\n")
+            elif not self.server.claim_name(self, name):
+                await self.send("A detective by that name is already on the case.\n")
+            else:
+                self.name = name
+                return True
+
+class GameServer:
+    """
+    Telnet-style TCP server hosting many concurrent games in one process.
+
+    Every connection gets its own GameEngine, driven one command at a
+    time. Commands run on a small thread pool so save file writes don't
+    stall the event loop, and at most max_inflight commands run at once;
+    the rest wait their turn. Each session writes through its own buffer
+    and waits for its client to drain it, so a slow reader only slows
+    down its own game. Saves go to a directory per player name, which
+    keeps each player's save manager the only writer of its directory.
+    """
+
+    def __init__(self, host: str = config.SERVER_HOST, port: int = config.SERVER_PORT,
+                 max_sessions: int = config.SERVER_MAX_SESSIONS,
+                 max_inflight: int = config.SERVER_MAX_INFLIGHT_COMMANDS,
+                 save_dir: Path = config.SAVE_DIR):
+        """
+        Args:
+            host: Address to listen on
+            port: Port to listen on, 0 for any free port
+            max_sessions: Most players connected at once
+            max_inflight: Most commands running at once
+            save_dir: Base directory for player saves
+        """
+        self.host = host
+        self.port = port
+        self.max_sessions = max_sessions
+        self.save_dir = save_dir
+        self.logger = logging.getLogger(__name__)
+        self.sessions: Dict[str, GameSession] = {}
+        self.commands_run = 0
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self._executor = ThreadPoolExecutor(max_workers=max_inflight, thread_name_prefix="game-command")
+        self._tasks: Set[asyncio.Task] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """Start listening for players."""
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port, limit=config.SERVER_MAX_LINE_BYTES)
+        # Report the real port when an ephemeral one was requested
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.logger.info(f"Seattle Noir server listening on {self.host}:{self.port}")
+
+    async def serve_forever(self) -> None:
+        """Serve players until cancelled."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop accepting players and end every running session."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._executor.shutdown(wait=True)
+
+    async def run_command(self, func: Callable, *args, **kwargs):
+        """
+        Run game code on the command pool, waiting for a free slot first.
+
+        Returns:
+            Whatever func returns
+        """
+        loop = asyncio.get_running_loop()
+        async with self._inflight:
+            self.commands_run += 1
+            return await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
+
+    def claim_name(self, session: GameSession, name: str) -> bool:
+        """
+        Reserve a player name for a session.
+
+        Returns:
+            bool: False if another session is using the name
+        """
+        key = name.lower()
+        if key in self.sessions:
+            return False
+        self.sessions[key] = session
+        return True
+
+    def release_name(self, session: GameSession) -> None:
+        """Free the name held by a session."""
+        if session.name and self.sessions.get(session.name.lower()) is session:
+            del self.sessions[session.name.lower()]
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Run a session for a new connection."""
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            writer.transport.set_write_buffer_limits(high=config.SERVER_WRITE_BUFFER_BYTES)
+            if len(self._tasks) > self.max_sessions:
+                writer.write(b"The precinct is full. Try again later.\r\n")
+                await writer.drain()
+                writer.close()
+                return
+            await GameSession(self, reader, writer).run()
+        except Exception as e:
+            self.logger.error(f"Session error: {e}")
+        finally:
+            self._tasks.discard(task)
+
+def main() -> None:
+    """Run the server from the command line."""
+    parser = argparse.ArgumentParser(description="Host Seattle Noir for many players")
+    parser.add_argument("--host", default=config.SERVER_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=config.SERVER_PORT, help="port to listen on")
+    parser.add_argument("--max-sessions", type=int, default=config.SERVER_MAX_SESSIONS)
+    parser.add_argument("--max-inflight", type=int, default=config.SERVER_MAX_INFLIGHT_COMMANDS)
+    args = parser.parse_args()
+
+    logging.basicConfig(filename=config.LOG_FILE, level=logging.INFO, format=config.LOG_FORMAT)
+    server = GameServer(args.host, args.port, args.max_sessions, args.max_inflight)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,14 @@ from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 import logging
 import config
+import static_content
+from change_tracker import ChangeTracker
+from output_sink import OutputSink, TerminalSink
 
 class ItemManager:
-    def __init__(self):
+    def __init__(self, tracker: Optional[ChangeTracker] = None, output: Optional[OutputSink] = None):
+        self.tracker = tracker
+        self.output = output or TerminalSink()
         self.inventory: List[str] = []
         self.newspaper_pieces: int = config.INITIAL_GAME_STATE.get("newspaper_pieces", 0)
         self.discovered_combinations: Set[str] = set()
@@ -15,87 +20,105 @@ class ItemManager:
         """Pick up an item from the current location."""
         try:
             if item not in location_items:
-                print(f"There is no {item} here.")
+                self.output.print(f"There is no {item} here.")
                 return False
         
             self.inventory.append(item)
             self.removed_items.add(item)  # Track that this item has been removed
+            self._mark_changed()
         
             # Handle special items first
             if item == "badge":
                 game_state["has_badge"] = True
-                print("You clip the badge to your belt. Its familiar weight is reassuring.")
+                self.output.print("You clip the badge to your belt. Its familiar weight is reassuring.")
                 logging.info("Badge taken and has_badge state set to True")
                 return True
             
             # Then handle newspaper pieces
             if item.startswith("newspaper_piece_"):
                 self.newspaper_pieces += 1
-                print(f"You've found piece {self.newspaper_pieces} of 8 of the newspaper story.")
+                self.output.print(f"You've found piece {self.newspaper_pieces} of 8 of the newspaper story.")
                 if self.newspaper_pieces == 8:
                     game_state["found_all_newspaper_pieces"] = True
-                    print("\nYou've collected all newspaper pieces!")
+                    self.output.print("\nYou've collected all newspaper pieces!")
                     self.show_newspaper_story()
                 return True
             
             # Generic message for all other items
-            print(f"You take the {item}.")
+            self.output.print(f"You take the {item}.")
             return True
         
         except Exception as e:
             logging.error(f"Error taking item {item}: {e}")
-            print("There was a problem picking up the item.")
+            self.output.print("There was a problem picking up the item.")
             return False
        
-    def examine_item(self, item: str, location_items: List[str], game_state: Dict) -> None:
-        """Examine an item in inventory or in the current location."""
+    def examine_item(self, item: str, location_items: List[str], game_state: Dict) -> bool:
+        """
+        Examine an item in inventory or in the current location.
+
+        Returns:
+            bool: True if the item was in the inventory to examine
+        """
         try:
             if item in self.inventory:
-                if item in config.ITEM_DESCRIPTIONS:
-                    print("\n" + config.ITEM_DESCRIPTIONS[item]["detailed"])
+                if item in static_content.ITEM_DESCRIPTIONS:
+                    self.output.print("\n" + static_content.ITEM_DESCRIPTIONS[item]["detailed"])
                     if item == "wallet" and not game_state.get("discovered_clue", False):
                         game_state["discovered_clue"] = True
-                        print("\nThe business card seems suspicious. This could be a valuable lead.")
+                        self.output.print("\nThe business card seems suspicious. This could be a valuable lead.")
                     elif item == "coded_message" and not game_state.get("examined_code", False):
                         game_state["examined_code"] = True
-                        print("\nThe code looks like it might be decipherable with the right tools...")
+                        self.output.print("\nThe code looks like it might be decipherable with the right tools...")
                 else:
-                    print(f"You examine the {item} closely but find nothing unusual.")
+                    self.output.print(f"You examine the {item} closely but find nothing unusual.")
+                return True
             elif item in location_items:
-                print(f"You'll need to take the {item} first to examine it closely.")
+                self.output.print(f"You'll need to take the {item} first to examine it closely.")
             else:
-                print(f"You don't see any {item} here.")
+                self.output.print(f"You don't see any {item} here.")
+            return False
             
         except Exception as e:
             logging.error(f"Error examining item {item}: {e}")
-            print("There was a problem examining the item.")
+            self.output.print("There was a problem examining the item.")
+            return False
+
+    def use_item(self, item: str, current_location: str, game_state: Dict) -> bool:
+        """
+        Use an item from the inventory.
 
-    def use_item(self, item: str, current_location: str, game_state: Dict) -> None:
-        """Use an item from the inventory."""
+        Returns:
+            bool: True if the item had an effect here
+        """
         try:
             if item not in self.inventory:
-                print("You don't have that item.")
-                return
+                self.output.print("You don't have that item.")
+                return False
            
-            item_data = config.ITEM_DESCRIPTIONS.get(item, {})
+            item_data = static_content.ITEM_DESCRIPTIONS.get(item, {})
             use_effects = item_data.get("use_effects", {})
             valid_locations = item_data.get("use_locations", [])
        
             if current_location in use_effects or ("all" in use_effects and current_location in valid_locations):
                 effect = use_effects.get(current_location, use_effects.get("all"))
-                print("\n" + effect)
+                self.output.print("\n" + effect)
            
                 if item_data.get("consumable", False):
                     self.inventory.remove(item)
-                    print(f"You no longer have the {item}.")
+                    self._mark_changed()
+                    self.output.print(f"You no longer have the {item}.")
            
                 self._handle_special_item_effects(item, current_location, game_state)
+                return True
             else:
-                print(f"You can't use the {item} here effectively.")
+                self.output.print(f"You can't use the {item} here effectively.")
+                return False
            
         except Exception as e:
             logging.error(f"Error using item {item}: {e}")
-            print("There was a problem using the item.")
+            self.output.print("There was a problem using the item.")
+            return False
 
     def _handle_special_item_effects(self, item: str, location: str, game_state: Dict) -> None:
         """Handle special effects when using certain items in specific locations."""
@@ -118,13 +141,13 @@ class ItemManager:
         """Attempt to combine two items from the inventory."""
         try:
             if item1 not in self.inventory or item2 not in self.inventory:
-                print("You need both items in your inventory to combine them.")
+                self.output.print("You need both items in your inventory to combine them.")
                 return False
            
             combo = frozenset([item1, item2])
-            if combo in config.ITEM_COMBINATIONS and combo not in self.discovered_combinations:
-                result = config.ITEM_COMBINATIONS[combo]
-                print("\n" + result['description'])
+            if combo in static_content.ITEM_COMBINATIONS and combo not in self.discovered_combinations:
+                result = static_content.ITEM_COMBINATIONS[combo]
+                self.output.print("\n" + result['description'])
            
                 if result['removes_items']:
                     for item in result['removes_items']:
@@ -133,35 +156,41 @@ class ItemManager:
            
                 game_state[result['result']] = True
                 self.discovered_combinations.add(combo)
+                self._mark_changed()
                 return True
             elif combo in self.discovered_combinations:
-                print("You've already discovered what these items reveal together.")
+                self.output.print("You've already discovered what these items reveal together.")
                 return False
             else:
-                print("These items can't be combined in any meaningful way.")
+                self.output.print("These items can't be combined in any meaningful way.")
                 return False
            
         except Exception as e:
             logging.error(f"Error combining items {item1} and {item2}: {e}")
-            print("There was a problem combining the items.")
+            self.output.print("There was a problem combining the items.")
             return False
 
+    def _mark_changed(self) -> None:
+        """Record that the inventory state needs saving."""
+        if self.tracker:
+            self.tracker.mark("inventory")
+
     def show_inventory(self) -> None:
         """Display the current inventory contents with basic descriptions."""
         try:
             if not self.inventory:
-                print("Your inventory is empty.")
+                self.output.print("Your inventory is empty.")
                 return
            
-            print("\nInventory:")
+            self.output.print("\nInventory:")
             for item in self.inventory:
-                basic_desc = config.ITEM_DESCRIPTIONS.get(item, {}).get("basic", "No description available.")
-                print(f"- {item}: {basic_desc}")
-            print("\nTip: Use 'examine <item>' for a closer look.")
+                basic_desc = static_content.ITEM_DESCRIPTIONS.get(item, {}).get("basic", "No description available.")
+                self.output.print(f"- {item}: {basic_desc}")
+            self.output.print("\nTip: Use 'examine <item>' for a closer look.")
        
         except Exception as e:
             logging.error(f"Error showing inventory: {e}")
-            print("There was a problem displaying the inventory.")
+            self.output.print("There was a problem displaying the inventory.")
 
     def show_newspaper_story(self) -> None:
         """Display the complete newspaper story once all pieces are collected."""
@@ -187,9 +216,9 @@ class ItemManager:
         supply operations taking advantage of post-war shortages and reconstruction 
         efforts across the Pacific coast.]
         """
-        print("\nAs you piece together the newspaper clippings, a bigger picture emerges...")
-        print(story)
-        print("\nThis could be the breakthrough you needed in the case.")
+        self.output.print("\nAs you piece together the newspaper clippings, a bigger picture emerges...")
+        self.output.print(story)
+        self.output.print("\nThis could be the breakthrough you needed in the case.")
 
     def get_inventory(self) -> List[str]:
         """Get the current inventory contents."""
@@ -0,0 +1,148 @@
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import config
+
+# Every server response ends with one of these prompts
+PROMPT_ENDINGS = ("> ", ": ")
+
+DEFAULT_SCRIPT = [
+    "look", "inventory", "take badge", "help", "examine badge",
+    "history", "talk", "look"
+]
+
+async def read_response(reader: asyncio.StreamReader) -> str:
+    """
+    Read one server response, up to and including its prompt.
+
+    Returns:
+        str: The response text, or what arrived before the server closed
+    """
+    chunks: List[str] = []
+    while True:
+        data = await reader.read(65536)
+        if not data:
+            break
+        chunks.append(data.decode("utf-8", errors="replace"))
+        if chunks[-1].endswith(PROMPT_ENDINGS):
+            break
+    return "".join(chunks)
+
+async def run_player(host: str, port: int, name: str, script: List[str],
+                     rounds: int, latencies: List[float]) -> int:
+    """
+    Play one scripted session.
+
+    Args:
+        host: Server address
+        port: Server port
+        name: Player name
+        script: Commands sent each round
+        rounds: Times to repeat the script
+        latencies: List collecting the seconds each command took
+
+    Returns:
+        int: Commands sent
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    sent = 0
+    try:
+        await read_response(reader)
+        writer.write(f"{name}\r\n".encode())
+        await read_response(reader)
+
+        for _ in range(rounds):
+            for command in script:
+                started = time.perf_counter()
+                writer.write(f"{command}\r\n".encode())
+                await read_response(reader)
+                latencies.append(time.perf_counter() - started)
+                sent += 1
+
+        writer.write(b"quit\r\n")
+        await writer.drain()
+        # Wait for the server to end the session
+        while await reader.read(65536):
+            pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+    return sent
+
+async def generate_load(host: str, port: int, clients: int, rounds: int,
+                        script: Optional[List[str]] = None) -> Dict[str, float]:
+    """
+    Run many scripted players at once and measure the server.
+
+    Args:
+        host: Server address
+        port: Server port
+        clients: Concurrent players
+        rounds: Times each player repeats the script
+        script: Commands per round, defaults to DEFAULT_SCRIPT
+
+    Returns:
+        Dict with the command count, throughput and latency percentiles
+    """
+    latencies: List[float] = []
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        run_player(host, port, f"load{i}", script or DEFAULT_SCRIPT, rounds, latencies)
+        for i in range(clients)
+    ), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+
+    failures = [result for result in results if isinstance(result, Exception)]
+    commands = sum(result for result in results if not isinstance(result, Exception))
+    stats = {
+        "clients": clients,
+        "failed_clients": len(failures),
+        "commands": commands,
+        "seconds": elapsed,
+        "commands_per_second": commands / elapsed if elapsed else 0.0,
+    }
+    if len(latencies) >= 2:
+        cuts = statistics.quantiles(latencies, n=100)
+        stats.update({
+            "p50_ms": cuts[49] * 1000,
+            "p95_ms": cuts[94] * 1000,
+            "p99_ms": cuts[98] * 1000,
+        })
+    return stats
+
+async def _run(args: argparse.Namespace) -> Dict[str, float]:
+    """Generate load, against a server started here if --local is given."""
+    if not args.local:
+        return await generate_load(args.host, args.port, args.clients, args.rounds)
+
+    from game_server import GameServer
+    with tempfile.TemporaryDirectory() as save_dir:
+        server = GameServer("127.0.0.1", 0, max_sessions=args.clients, save_dir=save_dir)
+        await server.start()
+        try:
+            return await generate_load("127.0.0.1", server.port, args.clients, args.rounds)
+        finally:
+            await server.close()
+
+def main() -> None:
+    """Run the load generator from the command line."""
+    parser = argparse.ArgumentParser(description="Drive a Seattle Noir server with scripted players")
+    parser.add_argument("--host", default=config.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=config.SERVER_PORT)
+    parser.add_argument("--clients", type=int, default=50, help="concurrent players")
+    parser.add_argument("--rounds", type=int, default=10, help="times each player repeats the script")
+    parser.add_argument("--local", action="store_true",
+                        help="start a server in this process with throwaway saves")
+    args = parser.parse_args()
+
+    for key, value in asyncio.run(_run(args)).items():
+        print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
+
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,24 @@ from typing import Dict, Optional, List
 import json
 import logging
 import config
+import static_content
 from trolley_system import TrolleySystem, TrolleyState
+from change_tracker import ChangeTracker
+from output_sink import OutputSink, TerminalSink
+from world_state import WorldState
 
 class LocationManager:
-    def __init__(self):
+    def __init__(self, tracker: Optional[ChangeTracker] = None, output: Optional[OutputSink] = None):
         """Initialize the LocationManager with all game locations and routes."""
+        self.tracker = tracker
+        self.output = output or TerminalSink()
         self.current_location: str = config.STARTING_LOCATION
         self.trolley_position: int = 0
         self.trolley_routes=config.TROLLEY_ROUTES
         
-        self.locations = config.LOCATIONS
         self.trolley_location = config.TROLLEY_ROUTES
-        self.locations = config.LOCATIONS.copy()  # Make a deep copy of the initial locations
-        self.original_items = {}  # Store original item locations
-        # Store the original item configurations
-        for location, data in self.locations.items():
-            self.original_items[location] = data.get("items", []).copy()
+        # Shared room definitions with this session's changes on top
+        self.locations = WorldState(static_content.LOCATIONS)
         self.trolley = TrolleySystem()
         
     def get_location_description(self) -> str:
@@ -61,12 +63,12 @@ class LocationManager:
         try:
             if self.current_location not in self.locations:
                 logging.error(f"Invalid current location '{self.current_location}'")
-                print(f"Error: Invalid current location '{self.current_location}'")
+                self.output.print(f"Error: Invalid current location '{self.current_location}'")
                 return False
 
             current_location = self.locations[self.current_location]
             if direction not in current_location["exits"]:
-                print("You can't go that way.")
+                self.output.print("You can't go that way.")
                 return False
 
             new_location = current_location["exits"][direction]
@@ -74,6 +76,7 @@ class LocationManager:
             #Special Trolley Handling
             if new_location == "trolley":
                 self.current_location = new_location
+                self._mark_changed()
                 self.handle_trolley()
                 return True
         
@@ -81,20 +84,21 @@ class LocationManager:
             if new_location in self.locations and "requires" in self.locations[new_location]:
                 requirement = self.locations[new_location]["requires"]
                 if not game_state.get(requirement, False):
-                    print(f"You can't access this area yet. You need to {requirement.replace('_', ' ')} first.")
+                    self.output.print(f"You can't access this area yet. You need to {requirement.replace('_', ' ')} first.")
                     return False
         
             self.current_location = new_location
+            self._mark_changed()
         
             # Handle first visit
             if self.locations[new_location]["first_visit"]:
-                self.locations[new_location]["first_visit"] = False
+                self.locations.set(new_location, "first_visit", False)
             
             return True
         
         except Exception as e:
             logging.error(f"Error moving to location: {e}")
-            print("There was a problem moving to that location.")
+            self.output.print("There was a problem moving to that location.")
             return False
     
     def handle_trolley(self) -> None:
@@ -104,31 +108,32 @@ class LocationManager:
             
             # First boarding
             if self.locations["trolley"].get("first_visit", True):
-                self.locations["trolley"]["first_visit"] = False
-                print(self.trolley.board_trolley())
+                self.locations.set("trolley", "first_visit", False)
+                self._mark_changed()
+                self.output.print(self.trolley.board_trolley())
                 initial_exits = {"next": "trolley", "off": self.trolley.routes[0]["exits"]["off"]}
-                self.locations["trolley"]["exits"] = initial_exits
+                self.locations.set("trolley", "exits", initial_exits)
                 return
 
             # Get current command
             command = self.last_command.lower().strip() if hasattr(self, 'last_command') else ""
         
             if command == "status":
-                print(self.trolley.get_status())
+                self.output.print(self.trolley.get_status())
             elif command == "history":
-                print(self.trolley.get_history())
+                self.output.print(self.trolley.get_history())
             elif command == "look":
-                print(self.trolley.get_status())
+                self.output.print(self.trolley.get_status())
             elif command in ["next", "off"]:
                 message, exits = self.trolley.handle_movement()
-                print(message)
-                self.locations["trolley"]["exits"] = exits
+                self.output.print(message)
+                self.locations.set("trolley", "exits", exits)
             else:
-                print("Invalid trolley command. Use: next, off, status, history, or look")
+                self.output.print("Invalid trolley command. Use: next, off, status, history, or look")
             
         except Exception as e:
             logging.error(f"Error handling trolley: {e}")
-            print("There was a problem with the trolley system.")
+            self.output.print("There was a problem with the trolley system.")
 
     def save_state(self) -> Dict:
         state = super().save_state()
@@ -144,18 +149,18 @@ class LocationManager:
         """Display historical information about the specified location."""
         try:
             if location in self.locations and "historical_note" in self.locations[location]:
-                print(f"\nHistorical Note: {self.locations[location]['historical_note']}")
+                self.output.print(f"\nHistorical Note: {self.locations[location]['historical_note']}")
             else:
-                print("No historical information available for this location.")
+                self.output.print("No historical information available for this location.")
            
         except Exception as e:
             logging.error(f"Error showing historical note for {location}: {e}")
-            print("There was a problem accessing the historical information.")
+            self.output.print("There was a problem accessing the historical information.")
 
     def get_available_items(self) -> List[str]:
         """Get list of items in current location."""
         try:
-            return self.locations[self.current_location].get("items", [])
+            return list(self.locations[self.current_location].get("items", ()))
         except KeyError:
             logging.error(f"Failed to get items - invalid location: {self.current_location}")
             return []
@@ -163,17 +168,28 @@ class LocationManager:
             logging.error(f"Error getting available items: {e}")
             return []
 
+    def get_available_exits(self) -> List[str]:
+        """Get list of exits from the current location."""
+        try:
+            return list(self.locations[self.current_location].get("exits", {}))
+        except KeyError:
+            logging.error(f"Failed to get exits - invalid location: {self.current_location}")
+            return []
+
     def remove_item(self, item: str) -> None:
         """Remove an item from the current location."""
         try:
-            if "items" in self.locations[self.current_location]:
-                items = self.locations[self.current_location]["items"]
-                if item in items:
-                    items.remove(item)
-                    logging.info(f"Removed {item} from {self.current_location}")
+            if self.locations.remove_item(self.current_location, item):
+                self._mark_changed()
+                logging.info(f"Removed {item} from {self.current_location}")
         except Exception as e:
             logging.error(f"Error removing item {item} from {self.current_location}: {e}")
 
+    def _mark_changed(self) -> None:
+        """Record that location state needs saving."""
+        if self.tracker:
+            self.tracker.mark("locations")
+
     def handle_conversation(self, location: str, game_state: Dict) -> bool:
         """
         Handle conversations with NPCs at the current location.
@@ -197,17 +213,17 @@ class LocationManager:
             if handler:
                 return handler(game_state)
             else:
-                print("There's nobody here to talk to.")
+                self.output.print("There's nobody here to talk to.")
                 return False
            
         except Exception as e:
             logging.error(f"Error handling conversation at {location}: {e}")
-            print("There was a problem starting the conversation.")
+            self.output.print("There was a problem starting the conversation.")
             return False
 
     def _handle_diner_conversation(self, game_state: Dict) -> bool:
         try:
-            print("\nThe waitress at the counter looks up as you approach...")
+            self.output.print("\nThe waitress at the counter looks up as you approach...")
             return True
         except Exception as e:
             logging.error(f"Error in diner conversation: {e}")
@@ -215,7 +231,7 @@ class LocationManager:
 
     def _handle_police_conversation(self, game_state: Dict) -> bool:
         try:
-            print("\nYour fellow officers are busy with their own cases...")
+            self.output.print("\nYour fellow officers are busy with their own cases...")
             return True
         except Exception as e:
             logging.error(f"Error in police station conversation: {e}")
@@ -223,7 +239,7 @@ class LocationManager:
 
     def _handle_waterfront_conversation(self, game_state: Dict) -> bool:
         try:
-            print("\nA weathered dock worker pauses from his work...")
+            self.output.print("\nA weathered dock worker pauses from his work...")
             return True
         except Exception as e:
             logging.error(f"Error in waterfront conversation: {e}")
@@ -233,7 +249,7 @@ class LocationManager:
         try:
             return {
                 location: {
-                    "items": self.locations[location].get("items", []).copy(),
+                    "items": list(self.locations[location].get("items", ())),
                     "first_visit": self.locations[location].get("first_visit", True)
                 }
                 for location in self.locations
@@ -252,8 +268,8 @@ class LocationManager:
         try:
             for location, state in location_states.items():
                 if location in self.locations:
-                    # Simply restore the saved state for each location
-                    self.locations[location]["items"] = state.get("items", []).copy()
-                    self.locations[location]["first_visit"] = state.get("first_visit", True)
+                    # Rooms saved unchanged end up with no overlay
+                    self.locations.set(location, "items", state.get("items", []))
+                    self.locations.set(location, "first_visit", state.get("first_visit", True))
         except Exception as e:
             logging.error(f"Error restoring location states: {e}")
\ No newline at end of file
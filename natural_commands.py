@@ -1,122 +1,188 @@
+from typing import Container, Dict, List, Mapping, NamedTuple, Optional, Set, Tuple
+from types import MappingProxyType
+from spelling_index import SpellingIndex
+from static_content import freeze
+import static_content
+
+# Where in the input a word has to appear to count
+ANYWHERE = 0
+LEADING = 1  # first word only
+ALONE = 2    # the whole input
+
+class Sense(NamedTuple):
+    """One meaning of a command word."""
+    intent: str
+    priority: int  # lower wins when several words in one input match
+    placement: int
+
 class NaturalCommandHandler:
     """Handles natural language commands with context awareness"""
-    
-    def __init__(self):
-        # Basic direction shortcuts that are always valid
-        self.direction_words = {
-            # Single letter shortcuts
-            'n': 'north',
-            's': 'south',
-            'e': 'east',
-            'w': 'west',
-            'u': 'up',
-            'd': 'down',
-            # Common variations
-            'nw': 'northwest',
-            'ne': 'northeast',
-            'sw': 'southwest',
-            'se': 'southeast',
-            # Natural language variations
-            'upstairs': 'up',
-            'downstairs': 'down',
-            'upward': 'up',
-            'downward': 'down',
-            'forward': 'north'  # Assumes north is forward by default
-        }
-
-        # Common action words and their variations
-        self.action_words = {
-            'movement': [
-                'go', 'walk', 'run', 'move', 'travel', 'head', 
-                'proceed', 'enter', 'leave', 'exit'
-            ],
-            'taking': [
-                'take', 'get', 'grab', 'pick', 'collect', 'acquire'
-            ],
-            'looking': [
-                'look', 'examine', 'check', 'inspect', 'view', 'see',
-                'read', 'study', 'observe'
-            ],
-            'talking': [
-                'talk', 'speak', 'chat', 'ask', 'tell', 'say',
-                'discuss', 'converse'
-            ],
-            'quitting': [
-                'quit', 'exit', 'bye', 'goodbye', 'leave game'
-            ],
-            'inventory': [
-                'inventory', 'inv', 'i', 'items', 'possessions', 
-                'belongings', 'carrying'
-            ]
-        }
+
+    # Basic direction shortcuts that are always valid
+    direction_words = freeze({
+        # Single letter shortcuts
+        'n': 'north',
+        's': 'south',
+        'e': 'east',
+        'w': 'west',
+        'u': 'up',
+        'd': 'down',
+        # Common variations
+        'nw': 'northwest',
+        'ne': 'northeast',
+        'sw': 'southwest',
+        'se': 'southeast',
+        # Natural language variations
+        'upstairs': 'up',
+        'downstairs': 'down',
+        'upward': 'up',
+        'downward': 'down',
+        'forward': 'north'  # Assumes north is forward by default
+    })
+
+    # Common action words and their variations
+    action_words = freeze({
+        'movement': [
+            'go', 'walk', 'run', 'move', 'travel', 'head',
+            'proceed', 'enter', 'leave', 'exit'
+        ],
+        'taking': [
+            'take', 'get', 'grab', 'pick', 'pick up', 'collect', 'acquire'
+        ],
+        'looking': [
+            'look', 'examine', 'check', 'inspect', 'view', 'see',
+            'read', 'study', 'observe'
+        ],
+        'talking': [
+            'talk', 'speak', 'chat', 'ask', 'tell', 'say',
+            'discuss', 'converse'
+        ],
+        'quitting': [
+            'quit', 'exit', 'bye', 'goodbye', 'leave game'
+        ],
+        'inventory': [
+            'inventory', 'inv', 'i', 'items', 'possessions',
+            'belongings', 'carrying'
+        ]
+    })
+
+    # Which intent wins when one input has several command words, and
+    # where each one counts. Quitting only as the first word, so
+    # "go exit" still walks through an exit.
+    intent_rules = freeze({
+        'quitting': (0, LEADING),
+        'direction': (1, ANYWHERE),
+        'inventory': (2, ANYWHERE),
+        'looking': (3, ANYWHERE),
+        'taking': (4, ANYWHERE),
+        'talking': (5, ANYWHERE),
+        'movement': (6, ANYWHERE),
+    })
+
+    # Intents whose command depends on what the player is doing
+    context_intents = freeze({
+        'normal': {'quitting': 'quit'},
+        'conversation': {'quitting': 'end_conversation'},
+        'puzzle': {'quitting': 'leave_puzzle'},
+    })
+
+    # Words dropped from item and direction names
+    filler_words = frozenset(('the', 'a', 'an', 'at', 'to', 'my', 'around', 'into', 'on', 'in'))
+
+    def __init__(self, literal_verbs: Container[str] = ()):
+        """
+        Args:
+            literal_verbs: Game verbs that, as the first word, mark the input
+                as an exact game command to pass through unparsed
+        """
+        self.literal_verbs = literal_verbs
 
     def understand_command(self, user_input: str, context: str = "normal") -> tuple[str, str]:
         """
         Convert natural language input into game commands based on context.
-        
+
+        The input is read in one pass, looking each word (and each pair of
+        words, for phrases like "pick up") up in the word index, so the
+        cost depends on the length of the input, not the vocabulary.
+
         Args:
             user_input: The raw input from the user
             context: The current context (e.g., "normal", "conversation", "puzzle")
-            
+
         Returns:
             tuple of (command_type, command_argument)
         """
         # Clean up the input
-        words = user_input.lower().strip().split()
+        words = user_input.lower().split()
         if not words:
             return ("invalid", "")
 
-        # First, check for single-word directions
-        if len(words) == 1 and words[0] in self.direction_words:
-            return ("go", self.direction_words[words[0]])
+        first = words[0]
+        if first in self.literal_verbs and first not in _WORD_INDEX:
+            return ("unknown", user_input)
+
+        best: Optional[Sense] = None
+        best_word = ""
+        # Positions of the words that made up the winning command word
+        best_span: Tuple[int, ...] = ()
+        position = 0
+        while position < len(words):
+            # Two-word phrases like "pick up" take precedence over their words
+            word = words[position]
+            span: Tuple[int, ...] = (position,)
+            senses = None
+            if position + 1 < len(words):
+                senses = _PHRASE_INDEX.get((word, words[position + 1]))
+                if senses is not None:
+                    word = f"{word} {words[position + 1]}"
+                    span = (position, position + 1)
+            if senses is None:
+                senses = _WORD_INDEX.get(word)
+            position += len(span)
+            if senses is None:
+                continue
+            for sense in senses:
+                if sense.placement == ALONE and len(span) != len(words):
+                    continue
+                if sense.placement == LEADING and span[0] != 0:
+                    continue
+                if best is None or sense.priority < best.priority:
+                    best, best_word, best_span = sense, word, span
+                break
+
+        if best is None:
+            # If we can't understand the command, return it as-is for the game to handle
+            return ("unknown", user_input)
 
         # Handle quit variations based on context
-        if context == "conversation":
-            if any(word in self.action_words['quitting'] for word in words):
-                return ("end_conversation", "")
-        elif context == "puzzle":
-            if any(word in self.action_words['quitting'] for word in words):
-                return ("leave_puzzle", "")
-        else:
-            if any(word in self.action_words['quitting'] for word in words):
-                return ("quit", "")
+        intents = self.context_intents.get(context, self.context_intents['normal'])
+        if best.intent in intents:
+            return (intents[best.intent], "")
 
-        # Look for direction words anywhere in the input
-        for word in words:
-            if word in self.direction_words:
-                return ("go", self.direction_words[word])
+        if best.intent == 'direction':
+            return ("go", self.direction_words.get(best_word, best_word))
 
-        # Handle inventory checks
-        if any(word in self.action_words['inventory'] for word in words):
+        if best.intent == 'inventory':
             return ("inventory", "")
 
-        # Handle looking/examining
-        if any(word in self.action_words['looking'] for word in words):
-            # If it's just "look" by itself, examine the room
-            if len(words) == 1:
-                return ("look", "")
-            # Otherwise, they're examining something specific
-            # Remove the look word and get what they're looking at
-            look_word = next(word for word in words if word in self.action_words['looking'])
-            target = " ".join(word for word in words if word != look_word)
-            return ("examine", target)
-
-        # Handle taking items
-        if any(word in self.action_words['taking'] for word in words):
-            # Find what they're trying to take
-            take_word = next(word for word in words if word in self.action_words['taking'])
-            # Special case for "pick up"
-            if take_word == "pick" and "up" in words:
-                words.remove("up")
-            words.remove(take_word)
-            item = " ".join(words)
-            return ("take", item)
-
-        # Handle talking
-        if any(word in self.action_words['talking'] for word in words):
+        if best.intent == 'talking':
             return ("talk", "")
 
-        # If we can't understand the command, return it as-is for the game to handle
+        target = " ".join(
+            word for position, word in enumerate(words)
+            if position not in best_span and word not in self.filler_words
+        )
+
+        if best.intent == 'looking':
+            # Just "look" by itself examines the room
+            return ("examine", target) if target else ("look", "")
+
+        if best.intent == 'taking':
+            return ("take", target)
+
+        if best.intent == 'movement' and target:
+            return ("go", target.split()[0])
+
         return ("unknown", user_input)
 
     def get_simple_help(self) -> str:
@@ -130,12 +196,34 @@ class NaturalCommandHandler:
         - "examine newspaper" or "read paper" to look at items
         - "talk" to speak with someone
         - "quit" to exit (but try "goodbye" in conversations!)
-        
+
         Just try saying what you want to do in a natural way!
         """
 
-    def convert_item_name(self, item: str) -> str:
-        """Convert natural item names to game format"""
+    def convert_item_name(self, item: str, reachable: Container[str] = ()) -> str:
+        """
+        Convert natural item names to game format, fixing typos.
+
+        Args:
+            item: Item name as the player typed it
+            reachable: Items the player can use right now; a misspelling
+                is only corrected to one of these
+
+        Returns:
+            str: The item ID
+        """
+        return self.correct_name(self.normalize_item_name(item), reachable)
+
+    def normalize_item_name(self, item: str) -> str:
+        """
+        Convert natural item names to game format without fixing typos.
+
+        Args:
+            item: Item name as the player typed it
+
+        Returns:
+            str: The item name as an ID, e.g. "police badge" -> "police_badge"
+        """
         # Handle newspaper pieces specially
         if "newspaper" in item.lower() and "piece" in item.lower():
             words = item.lower().split()
@@ -144,7 +232,95 @@ class NaturalCommandHandler:
                 number = next(word for word in words if word.isdigit())
                 return f"newspaper_piece_{number}"
             except StopIteration:
-                return item.lower().replace(" ", "_")
-        
+                pass
+
         # Default conversion just replaces spaces with underscores
-        return item.lower().replace(" ", "_")
\ No newline at end of file
+        return item.lower().replace(" ", "_")
+
+    def correct_name(self, name: str, reachable: Container[str] = (), kind: str = "item") -> str:
+        """
+        Fix a misspelled item or exit name.
+
+        Args:
+            name: Name in game format
+            reachable: Names of this kind in the current room, inventory
+                or exits; only these are offered as corrections
+            kind: "item" or "exit"
+
+        Returns:
+            str: The closest reachable name, or the name unchanged if it's
+            known or no reachable name is close
+        """
+        index = _NAME_INDEXES[kind]
+        if not reachable or name in reachable or name in index:
+            return name
+        for match, _ in index.lookup(name):
+            if match in reachable:
+                return match
+        return name
+
+def _build_index(direction_words: Mapping[str, str], action_words: Mapping[str, List[str]],
+                 intent_rules: Mapping[str, Tuple[int, int]]) -> Tuple[Dict, Dict]:
+    """
+    Build the word and phrase lookup tables for the parser.
+
+    Returns:
+        Tuple of (word -> senses, (word, word) -> senses), each word's
+        senses sorted so the highest priority comes first
+    """
+    words: Dict[str, List[Sense]] = {}
+    phrases: Dict[Tuple[str, str], List[Sense]] = {}
+
+    def add(word: str, intent: str, placement: Optional[int] = None) -> None:
+        priority, default_placement = intent_rules[intent]
+        sense = Sense(intent, priority, default_placement if placement is None else placement)
+        parts = word.split()
+        if len(parts) == 2:
+            phrases.setdefault((parts[0], parts[1]), []).append(sense)
+        else:
+            words.setdefault(word, []).append(sense)
+
+    for word, direction in direction_words.items():
+        # Shortcuts like "n" or "se" are only directions on their own
+        add(word, 'direction', ALONE if len(word) <= 2 else None)
+    for direction in set(direction_words.values()):
+        if direction not in words:
+            add(direction, 'direction')
+    for intent, variations in action_words.items():
+        for word in variations:
+            add(word, intent, ALONE if len(word) == 1 else None)
+
+    return (
+        {word: tuple(sorted(senses, key=lambda sense: sense.priority)) for word, senses in words.items()},
+        {pair: tuple(sorted(senses, key=lambda sense: sense.priority)) for pair, senses in phrases.items()},
+    )
+
+# Built once from the class vocabulary and shared by every handler
+_WORD_INDEX, _PHRASE_INDEX = (
+    MappingProxyType(table) for table in _build_index(
+        NaturalCommandHandler.direction_words,
+        NaturalCommandHandler.action_words,
+        NaturalCommandHandler.intent_rules,
+    )
+)
+
+def _item_names() -> Set[str]:
+    """Collect every item ID in the game."""
+    names = set(static_content.ITEM_DESCRIPTIONS)
+    for location in static_content.LOCATIONS.values():
+        names.update(location.get("items", ()))
+    return names
+
+def _exit_names() -> Set[str]:
+    """Collect every exit name in the game."""
+    names: Set[str] = set()
+    for location in static_content.LOCATIONS.values():
+        names.update(location.get("exits", {}))
+    return names
+
+# Shared by every handler; item and exit names never change during a game.
+# Kept apart so an item is never corrected to an exit or the other way round.
+_NAME_INDEXES = MappingProxyType({
+    "item": SpellingIndex(_item_names()),
+    "exit": SpellingIndex(_exit_names()),
+})
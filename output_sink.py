@@ -0,0 +1,211 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, TextIO
+from contextlib import contextmanager
+import logging
+import socket
+import sys
+from terminal import Terminal
+
+class OutputSink(ABC):
+    """
+    Destination for everything a game session prints.
+
+    The game and its managers write through a sink instead of the global
+    stdout, so several games can run in one process and output can be
+    captured. Inside command() writes are buffered and emitted in a
+    single write when the command finishes. Sinks also supply the
+    session's line input for prompts.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._buffer: List[str] = []
+        self._depth = 0
+        # Output cost counters
+        self.writes = 0
+        self.bytes_written = 0
+
+    @abstractmethod
+    def _emit(self, text: str) -> None:
+        """Deliver text to the destination in one write."""
+        pass
+
+    @abstractmethod
+    def read_line(self) -> str:
+        """
+        Read one line of player input.
+
+        Raises:
+            EOFError: If no more input is available
+        """
+        pass
+
+    def write(self, text: str) -> None:
+        """
+        Write text, buffering it while a command is running.
+
+        Args:
+            text: Text to write
+        """
+        if self._depth:
+            self._buffer.append(text)
+        else:
+            self._deliver(text)
+
+    def print(self, *values, sep: str = " ", end: str = "\n") -> None:
+        """Write values like the built-in print()."""
+        self.write(sep.join(str(value) for value in values) + end)
+
+    def flush(self) -> None:
+        """Emit any buffered output now."""
+        if self._buffer:
+            text = "".join(self._buffer)
+            self._buffer.clear()
+            self._deliver(text)
+
+    def prompt(self, text: str = "") -> str:
+        """
+        Show a prompt and read the player's answer, like input().
+
+        Args:
+            text: Prompt text
+
+        Returns:
+            str: The line entered, without its newline
+        """
+        self.write(text)
+        self.flush()
+        return self.read_line()
+
+    @contextmanager
+    def command(self):
+        """Context manager coalescing all output of one command into one write."""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self.flush()
+
+    def isatty(self) -> bool:
+        """Whether the sink is an interactive terminal."""
+        return False
+
+    @property
+    def terminal(self) -> Terminal:
+        """Terminal control writing through this sink."""
+        if getattr(self, '_terminal', None) is None:
+            self._terminal = Terminal(self, ansi=self.supports_ansi())
+        return self._terminal
+
+    def supports_ansi(self) -> bool:
+        """Whether the other end understands ANSI escape sequences."""
+        return False
+
+    def _deliver(self, text: str) -> None:
+        """Emit text and count the write."""
+        if not text:
+            return
+        self.writes += 1
+        self.bytes_written += len(text)
+        self._emit(text)
+
+class TerminalSink(OutputSink):
+    """Output to a local terminal or console stream, input from stdin."""
+
+    def __init__(self, stream: Optional[TextIO] = None, input_stream: Optional[TextIO] = None):
+        super().__init__()
+        self.stream = stream
+        self.input_stream = input_stream
+
+    def _emit(self, text: str) -> None:
+        stream = self.stream or sys.stdout
+        stream.write(text)
+        stream.flush()
+
+    def read_line(self) -> str:
+        if self.input_stream is None:
+            return input()
+        line = self.input_stream.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\r\n")
+
+    def isatty(self) -> bool:
+        try:
+            return (self.stream or sys.stdout).isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    @property
+    def terminal(self) -> Terminal:
+        stream = self.stream or sys.stdout
+        if getattr(self, '_terminal', None) is None or self._terminal_stream is not stream:
+            # Detect capabilities on the real stream, but write through the sink
+            self._terminal = Terminal(self, ansi=Terminal(stream).ansi)
+            self._terminal_stream = stream
+        return self._terminal
+
+    def is_process_stdout(self) -> bool:
+        """Whether this sink writes to the process's own terminal."""
+        return (self.stream or sys.stdout) is sys.__stdout__
+
+class BufferSink(OutputSink):
+    """
+    Output collected in memory, input from a scripted list of lines.
+
+    Used for headless games and to measure output separately from the
+    cost of a real terminal.
+    """
+
+    def __init__(self, inputs: Optional[Iterable[str]] = None):
+        super().__init__()
+        self._chunks: List[str] = []
+        self._inputs = iter(inputs or [])
+
+    def _emit(self, text: str) -> None:
+        self._chunks.append(text)
+
+    def read_line(self) -> str:
+        try:
+            return next(self._inputs)
+        except StopIteration:
+            raise EOFError from None
+
+    def feed(self, lines: Iterable[str]) -> None:
+        """Queue more input lines after any not yet read."""
+        self._inputs = iter([*self._inputs, *lines])
+
+    def getvalue(self) -> str:
+        """Get all output emitted so far."""
+        return "".join(self._chunks)
+
+    def take(self) -> str:
+        """Get the output emitted so far and clear it."""
+        text = self.getvalue()
+        self._chunks.clear()
+        return text
+
+class SocketSink(OutputSink):
+    """Output to and input from a connected socket, e.g. a telnet client."""
+
+    def __init__(self, sock: socket.socket, encoding: str = "utf-8", ansi: bool = True):
+        super().__init__()
+        self.sock = sock
+        self.encoding = encoding
+        self.ansi = ansi
+        self._reader = sock.makefile('r', encoding=encoding, newline='')
+
+    def _emit(self, text: str) -> None:
+        # Network terminals expect CRLF line endings
+        self.sock.sendall(text.replace("\n", "\r\n").encode(self.encoding, errors='replace'))
+
+    def read_line(self) -> str:
+        line = self._reader.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\r\n")
+
+    def supports_ansi(self) -> bool:
+        return self.ansi
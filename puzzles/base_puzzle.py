@@ -2,20 +2,81 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 import logging
 from contextlib import contextmanager
+from output_sink import OutputSink, TerminalSink
 
 class BasePuzzle(ABC):
-    """Abstract base class for all puzzles."""
+    """
+    Abstract base class for all puzzles.
+
+    A puzzle is a dialog driven one answer at a time: start() opens it,
+    feed() hands it the player's next answer and prompt is the question
+    it is waiting on. Both return None while the dialog continues and the
+    outcome once it ends, so a puzzle never blocks waiting for input and
+    many sessions' puzzles can be stepped on one thread. Attempts and
+    hints used are kept on the puzzle between steps.
+    """
+
+    # Name used in error messages
+    title = "puzzle"
+    # Question shown while the dialog waits for an answer
+    PROMPT = "\nYour answer: "
+    # Fixed introduction shown when the dialog opens, "" if it varies
+    INTRO_TEXT = ""
     
-    def __init__(self):
+    def __init__(self, output: Optional[OutputSink] = None):
+        """
+        Args:
+            output: Where the puzzle's text goes and its answers come from
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.output = output or TerminalSink()
         self.attempts = 0
         self.max_attempts = 5  # Default value, can be overridden
         self.solved = False
+        self.hints_used = 0
+        # Whether the dialog is waiting for an answer
+        self.active = False
+
+    @property
+    def prompt(self) -> Optional[str]:
+        """Question the open dialog is waiting on, None if no dialog is open."""
+        return self.PROMPT if self.active else None
+
+    def start(self, inventory: List[str], game_state: Dict) -> Optional[bool]:
+        """
+        Open the puzzle's dialog.
+        
+        Args:
+            inventory: List of items the player has
+            game_state: Current game state dictionary
+            
+        Returns:
+            None if the dialog now waits for an answer, otherwise True if
+            the puzzle was solved and False if not
+        """
+        self.active = True
+        return self._step(self._begin, inventory, game_state)
+
+    def feed(self, answer: str, game_state: Dict) -> Optional[bool]:
+        """
+        Give the open dialog the player's answer to its prompt.
+        
+        Args:
+            answer: Answer as the player typed it
+            game_state: Current game state dictionary
+            
+        Returns:
+            None if the dialog waits for another answer, otherwise True if
+            the puzzle was solved and False if not
+        """
+        if not self.active:
+            self.logger.warning("Answer given with no puzzle dialog open")
+            return False
+        return self._step(self._answer, answer.strip(), game_state)
 
-    @abstractmethod
     def solve(self, inventory: List[str], game_state: Dict) -> bool:
         """
-        Attempt to solve the puzzle.
+        Run the whole dialog, reading answers through the output sink.
         
         Args:
             inventory: List of items the player has
@@ -24,7 +85,46 @@ class BasePuzzle(ABC):
         Returns:
             bool: True if puzzle was solved, False otherwise
         """
+        outcome = self.start(inventory, game_state)
+        try:
+            while outcome is None:
+                outcome = self.feed(self.output.prompt(self.prompt), game_state)
+        except (KeyboardInterrupt, EOFError):
+            self.output.print("\nPuzzle attempt interrupted.")
+            self.active = False
+            return False
+        return outcome
+
+    @abstractmethod
+    def _begin(self, inventory: List[str], game_state: Dict) -> Optional[bool]:
+        """
+        Show the puzzle and decide whether it needs answers.
+        
+        Returns:
+            None to wait for an answer, otherwise the outcome
+        """
+        pass
+
+    @abstractmethod
+    def _answer(self, answer: str, game_state: Dict) -> Optional[bool]:
+        """
+        Handle one answer.
+        
+        Returns:
+            None to wait for another answer, otherwise the outcome
+        """
         pass
+
+    def _step(self, handler, *args) -> Optional[bool]:
+        """Run one step of the dialog, closing it on an outcome or error."""
+        outcome = False
+        with self.error_handler(self.title):
+            outcome = handler(*args)
+        if outcome is not None:
+            self.active = False
+        if outcome:
+            self.solved = True
+        return outcome
     
     @abstractmethod
     def get_state(self) -> Dict:
@@ -38,7 +138,7 @@ class BasePuzzle(ABC):
             "attempts": self.attempts,
             "max_attempts": self.max_attempts,
             "solved": self.solved,
-            # Add any additional common state here
+            "hints_used": self.hints_used,
         }
     
     @abstractmethod
@@ -52,6 +152,9 @@ class BasePuzzle(ABC):
         self.attempts = state.get("attempts", 0)
         self.max_attempts = state.get("max_attempts", 5)
         self.solved = state.get("solved", False)
+        self.hints_used = state.get("hints_used", 0)
+        # Dialogs are not saved; a restored puzzle starts over from solve
+        self.active = False
     
     @property
     @abstractmethod
@@ -89,7 +192,7 @@ class BasePuzzle(ABC):
             yield
         except Exception as e:
             self.logger.error(f"Error in {operation}: {e}")
-            print(f"\nThere was a problem with {operation}. Please try again.")
+            self.output.print(f"\nThere was a problem with {operation}. Please try again.")
     
     def increment_attempts(self) -> bool:
         """
@@ -102,10 +205,10 @@ class BasePuzzle(ABC):
         remaining = self.max_attempts - self.attempts
         
         if remaining <= 0:
-            print("\nYou've run out of attempts. Try again later.")
+            self.output.print("\nYou've run out of attempts. Try again later.")
             return False
             
-        print(f"\n{remaining} attempts remaining.")
+        self.output.print(f"\n{remaining} attempts remaining.")
         return True
     
     def reset_attempts(self) -> None:
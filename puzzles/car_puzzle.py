@@ -1,6 +1,8 @@
 from typing import Dict, List, Optional, Set
 import random
 from .base_puzzle import BasePuzzle
+from output_sink import OutputSink
+from static_content import freeze
 from utils import print_text
 from input_validator import InputValidator
 
@@ -10,17 +12,32 @@ class CarPuzzle(BasePuzzle):
     of a suspicious vehicle's movements through the city.
     """
 
-    def __init__(self):
+    title = "car tracking puzzle"
+    PROMPT = "\nEnter movement pattern (or 'hint'/'quit'): "
+    INTRO_TEXT = """
+    From this height, you can see vehicles moving through the streets below.
+    Your notes mention a blue sedan making regular deliveries.
+
+    You spot the blue sedan! Quick, track its movements!
+    The car appears to be following a specific pattern.
+
+    Directions:
+    - Use N (North), S (South), E (East), W (West)
+    - Enter the full pattern you observe
+    - Example: If the car goes North, then East, enter: NE
+    """
+
+    # Define possible movement patterns with their descriptions
+    PATTERNS = freeze({
+        "NSEW": "around the block clockwise",
+        "NWSE": "through back alleys",
+        "SENW": "counter-clockwise route",
+        "SWNE": "zigzag pattern"
+    })
+
+    def __init__(self, output: Optional[OutputSink] = None):
         # Initialize base puzzle features (attempts, logging, etc.)
-        super().__init__()
-        
-        # Define possible movement patterns with their descriptions
-        self.PATTERNS = {
-            "NSEW": "around the block clockwise",
-            "NWSE": "through back alleys",
-            "SENW": "counter-clockwise route",
-            "SWNE": "zigzag pattern"
-        }
+        super().__init__(output)
         
         # Puzzle state variables - using Optional for clarity on nullable fields
         self.current_pattern: Optional[str] = None
@@ -62,99 +79,85 @@ class CarPuzzle(BasePuzzle):
         Hints become more specific as attempts increase.
         """
         if attempt_number == 0:
-            print_text("\nHint: The pattern contains four movements.")
+            print_text("\nHint: The pattern contains four movements.", output=self.output)
         elif attempt_number == 1:
-            print_text("\nHint: Watch for repeated directions.")
+            print_text("\nHint: Watch for repeated directions.", output=self.output)
         elif attempt_number == 2:
             first_move = self.current_pattern[0]
-            print_text(f"\nHint: The car starts by going {first_move}...")
+            print_text(f"\nHint: The car starts by going {first_move}...", output=self.output)
         else:
-            print_text("\nHint: The car seems to be making a complete circuit.")
+            print_text("\nHint: The car seems to be making a complete circuit.", output=self.output)
 
     def _display_puzzle_introduction(self) -> None:
         """
         Display the initial puzzle description and instructions.
         Separated from solve() for better code organization.
         """
-        intro_text = """
-        From this height, you can see vehicles moving through the streets below.
-        Your notes mention a blue sedan making regular deliveries.
-
-        You spot the blue sedan! Quick, track its movements!
-        The car appears to be following a specific pattern.
-
-        Directions:
-        - Use N (North), S (South), E (East), W (West)
-        - Enter the full pattern you observe
-        - Example: If the car goes North, then East, enter: NE
-        """
-        print_text(intro_text)
+        print_text(self.INTRO_TEXT, output=self.output)
 
-    def solve(self, inventory: List[str], game_state: Dict) -> bool:
+    def _begin(self, inventory: List[str], game_state: Dict) -> Optional[bool]:
         """
-        Main puzzle solving logic. Implements the abstract method from BasePuzzle.
-        Uses error handling and input validation.
+        Start tracking a new route. Implements the abstract method from BasePuzzle.
         """
-        # Use error handler from BasePuzzle
-        with self.error_handler("car tracking puzzle"):
-            # Check if already solved
-            if game_state.get("tracked_car", False):
-                print_text("\nYou've already tracked the car's route successfully.")
-                print_text("However, you could observe for more suspicious activity.")
-                return True
+        # Check if already solved
+        if game_state.get("tracked_car", False):
+            print_text("\nYou've already tracked the car's route successfully.", output=self.output)
+            print_text("However, you could observe for more suspicious activity.", output=self.output)
+            return True
 
-            # Check requirements using BasePuzzle property
-            if "binoculars" not in inventory:
-                print_text("\nYou'll need binoculars to track the vehicle effectively.")
-                return False
-
-            # Generate new pattern and display introduction
-            self._generate_pattern()
-            self._display_puzzle_introduction()
-
-            # Main puzzle loop
-            while self.attempts < self.max_attempts:
-                try:
-                    command = input("\nEnter movement pattern (or 'hint'/'quit'): ").upper()
+        # Check requirements using BasePuzzle property
+        if "binoculars" not in inventory:
+            print_text("\nYou'll need binoculars to track the vehicle effectively.", output=self.output)
+            return False
 
-                    if command == 'QUIT':
-                        return False
+        # Generate new pattern and display introduction
+        self._generate_pattern()
+        self._display_puzzle_introduction()
 
-                    if command == 'HINT':
-                        self._provide_hint(self.attempts)
-                        continue
+        if self.attempts >= self.max_attempts:
+            print_text("\nThe car has disappeared into traffic. Try again later.", output=self.output)
+            return False
+        return None
 
-                    # Validate input using our enhanced validation
-                    if not self._validate_direction_input(command):
-                        print_text("\nPlease use only N, S, E, or W to describe the pattern.")
-                        continue
+    def _answer(self, answer: str, game_state: Dict) -> Optional[bool]:
+        """
+        Check one observed pattern. Implements the abstract method from BasePuzzle.
+        """
+        command = answer.upper()
 
-                    # Check solution
-                    if command == self.current_pattern:
-                        return self._handle_correct_solution(game_state)
+        if command == 'QUIT':
+            return False
 
-                    # Handle incorrect answer using BasePuzzle method
-                    if not self.increment_attempts():
-                        return False
+        if command == 'HINT':
+            self.hints_used += 1
+            self._provide_hint(self.attempts)
+            return None
 
-                    # Provide feedback on pattern length
-                    if len(command) != len(self.current_pattern):
-                        print_text(f"\nThe pattern seems to be {len(self.current_pattern)} moves long.")
+        # Validate input using our enhanced validation
+        if not self._validate_direction_input(command):
+            print_text("\nPlease use only N, S, E, or W to describe the pattern.", output=self.output)
+            return None
 
-                except KeyboardInterrupt:
-                    print_text("\nPuzzle attempt interrupted.")
-                    return False
+        # Check solution
+        if command == self.current_pattern:
+            return self._handle_correct_solution(game_state)
 
-            print_text("\nThe car has disappeared into traffic. Try again later.")
+        # Handle incorrect answer using BasePuzzle method
+        if not self.increment_attempts():
             return False
 
+        # Provide feedback on pattern length
+        if len(command) != len(self.current_pattern):
+            print_text(f"\nThe pattern seems to be {len(self.current_pattern)} moves long.", output=self.output)
+        return None
+
     def _handle_correct_solution(self, game_state: Dict) -> bool:
         """
         Handle correct puzzle solution and update game state.
         Separated from solve() for better organization.
         """
-        print_text(f"\nSuccess! You've tracked the car {self.pattern_description}!")
-        print_text("This route seems deliberately planned to avoid main streets.")
+        print_text(f"\nSuccess! You've tracked the car {self.pattern_description}!", output=self.output)
+        print_text("This route seems deliberately planned to avoid main streets.", output=self.output)
         game_state["tracked_car"] = True
         return True
 
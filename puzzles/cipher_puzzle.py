@@ -1,20 +1,32 @@
 from typing import Dict, List, Set, Optional
 import logging
 from .base_puzzle import BasePuzzle
+from output_sink import OutputSink
+from static_content import freeze
 from utils import print_text
 from input_validator import InputValidator
 
 class CipherPuzzle(BasePuzzle):
     """Cipher wheel puzzle implementation."""
 
-    def __init__(self):
-        super().__init__()
-        self.CIPHER_SHIFT = 7
-        self.CIPHER_MESSAGES = {
-            "initial": ("ZLHAASL", "SEATTLE"),  # City name
-            "second": ("KVJRZ", "DOCKS"),       # Location clue
-            "final": ("YLKZAHY", "REDSTAR")     # Final clue
-        }
+    title = "cipher puzzle"
+    PROMPT = "\nEnter decoded message (or 'hint' for help, 'quit' to leave): "
+    INTRO_TEXT = """
+    Examining the cipher wheel, you see:
+    - An outer ring with the letters A through Z
+    - An inner ring that can be rotated to align with different letters
+    - Several encoded messages scratched into the desk:
+    """
+
+    CIPHER_SHIFT = 7
+    CIPHER_MESSAGES = freeze({
+        "initial": ("ZLHAASL", "SEATTLE"),  # City name
+        "second": ("KVJRZ", "DOCKS"),       # Location clue
+        "final": ("YLKZAHY", "REDSTAR")     # Final clue
+    })
+
+    def __init__(self, output: Optional[OutputSink] = None):
+        super().__init__(output)
         self.solved_ciphers: Set[str] = set()
         # Note: removed self.attempts as it's now in BasePuzzle
         self.max_attempts = 5  # Override default from BasePuzzle if needed
@@ -42,75 +54,67 @@ class CipherPuzzle(BasePuzzle):
                     result += char
             return result
 
-    def solve(self, inventory: List[str], game_state: Dict) -> bool:
-        """Implement the cipher wheel puzzle."""
-        with self.error_handler("cipher puzzle"):
-            # Check for cipher wheel
-            if "cipher_wheel" not in inventory:
-                print_text("\nYou'll need the cipher wheel to decode these messages.")
-                return False
+    def _begin(self, inventory: List[str], game_state: Dict) -> Optional[bool]:
+        """Show the cipher wheel and the messages still to decode."""
+        # Check for cipher wheel
+        if "cipher_wheel" not in inventory:
+            print_text("\nYou'll need the cipher wheel to decode these messages.", output=self.output)
+            return False
 
-            # If already solved main puzzle but not all ciphers
-            if game_state.get("solved_cipher", False):
-                print_text("\nYou've already decoded the main message, but there might be more to find.")
+        # If already solved main puzzle but not all ciphers
+        if game_state.get("solved_cipher", False):
+            print_text("\nYou've already decoded the main message, but there might be more to find.", output=self.output)
 
-            self._display_puzzle_introduction()
-            
-            # Show available encoded messages
-            unsolved = [k for k in self.CIPHER_MESSAGES.keys() if k not in self.solved_ciphers]
-            for k in unsolved:
-                encoded, _ = self.CIPHER_MESSAGES[k]
-                print_text(f"  {encoded}")
-
-            # Main puzzle loop
-            while self.attempts < self.max_attempts:
-                try:
-                    command = input("\nEnter decoded message (or 'hint' for help, 'quit' to leave): ").upper()
-                    
-                    if command == 'QUIT':
-                        return False
-                    
-                    if command == 'HINT':
-                        self._provide_hint(self.attempts)
-                        continue
-                    
-                    if not InputValidator.validate_puzzle_input(command):
-                        print_text("\nPlease use only letters for your answer.")
-                        continue
-
-                    # Check solution
-                    if self._check_solution(command, game_state):
-                        return True
-
-                    # Wrong answer
-                    if not self.increment_attempts():
-                        return False
-
-                except KeyboardInterrupt:
-                    print_text("\nPuzzle attempt interrupted.")
-                    return False
-
-            print_text("\nThe cipher wheel needs to be realigned. Try again later.")
+        self._display_puzzle_introduction()
+        
+        # Show available encoded messages
+        unsolved = [k for k in self.CIPHER_MESSAGES.keys() if k not in self.solved_ciphers]
+        for k in unsolved:
+            encoded, _ = self.CIPHER_MESSAGES[k]
+            print_text(f"  {encoded}", output=self.output)
+
+        if self.attempts >= self.max_attempts:
+            print_text("\nThe cipher wheel needs to be realigned. Try again later.", output=self.output)
+            return False
+        return None
+
+    def _answer(self, answer: str, game_state: Dict) -> Optional[bool]:
+        """Check one decoding attempt."""
+        command = answer.upper()
+        
+        if command == 'QUIT':
+            return False
+        
+        if command == 'HINT':
+            self.hints_used += 1
+            self._provide_hint(self.attempts)
+            return None
+        
+        if not InputValidator.validate_puzzle_input(command):
+            print_text("\nPlease use only letters for your answer.", output=self.output)
+            return None
+
+        # Check solution
+        if self._check_solution(command, game_state):
+            return True
+
+        # Wrong answer
+        if not self.increment_attempts():
             return False
+        return None
 
     def _display_puzzle_introduction(self) -> None:
         """Display the puzzle introduction text."""
-        intro_text = """
-        Examining the cipher wheel, you see:
-        - An outer ring with the letters A through Z
-        - An inner ring that can be rotated to align with different letters
-        - Several encoded messages scratched into the desk:
-        """
-        print_text(intro_text)
+        print_text(self.INTRO_TEXT, output=self.output)
             
         
     def _provide_hint(self, attempt_number: int) -> None:
         """Provide progressive hints based on attempts."""
         if attempt_number < 2:
-            print_text("\nTry aligning different letters and looking for patterns.")
-            print_text("The text might be a local place or common word.")
+            print_text("\nTry aligning different letters and looking for patterns.", output=self.output)
+            print_text("The text might be a local place or common word.", output=self.output)
         else:
-            print_text("\nNotice how each letter might be shifted by the same amount...")
+            print_text("\nNotice how each letter might be shifted by the same amount...", output=self.output)
 
     def _check_solution(self, command: str, game_state: Dict) -> bool:
         """Check if the provided solution is correct."""
@@ -124,24 +128,24 @@ class CipherPuzzle(BasePuzzle):
 
     def _handle_correct_solution(self, key: str, encoded: str, decoded: str, game_state: Dict) -> bool:
         """Handle a correct solution for the puzzle."""
-        print_text(f"\nSuccess! You've decoded '{encoded}' to '{decoded}'!")
+        print_text(f"\nSuccess! You've decoded '{encoded}' to '{decoded}'!", output=self.output)
         self.solved_ciphers.add(key)
         
         # Handle specific solutions
         if key == "initial" and not game_state.get("solved_cipher", False):
-            print_text("\nThis must be significant - it's the name of our city!")
+            print_text("\nThis must be significant - it's the name of our city!", output=self.output)
             game_state["solved_cipher"] = True
         elif key == "second":
-            print_text("\nThe docks... this confirms the waterfront connection.")
+            print_text("\nThe docks... this confirms the waterfront connection.", output=self.output)
         elif key == "final":
-            print_text("\nRed Star - this matches what we heard about!")
+            print_text("\nRed Star - this matches what we heard about!", output=self.output)
             if len(self.solved_ciphers) == len(self.CIPHER_MESSAGES):
-                print_text("\nYou've decoded all the messages! The pattern is clear now.")
+                print_text("\nYou've decoded all the messages! The pattern is clear now.", output=self.output)
         
         # Show remaining message count
         remaining = len(self.CIPHER_MESSAGES) - len(self.solved_ciphers)
         if remaining > 0:
-            print_text(f"\nThere are {remaining} more encoded messages to solve.")
+            print_text(f"\nThere are {remaining} more encoded messages to solve.", output=self.output)
         
         return True
 
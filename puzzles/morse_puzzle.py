@@ -1,5 +1,7 @@
 from typing import Dict, List, Optional, Set, Tuple
 from .base_puzzle import BasePuzzle
+from output_sink import OutputSink
+from static_content import freeze
 from utils import print_text
 from input_validator import InputValidator
 
@@ -9,36 +11,38 @@ class MorsePuzzle(BasePuzzle):
     Players must decode messages tapped through the walls.
     """
 
-    def __init__(self):
-        # Initialize base puzzle features
-        super().__init__()
-        
-        # Morse code lookup dictionary - standard International Morse Code
-        self.MORSE_CODE = {
-            'A': '.-',    'B': '-...',  'C': '-.-.', 'D': '-..', 
-            'E': '.',     'F': '..-.',  'G': '--.',  'H': '....',
-            'I': '..',    'J': '.---',  'K': '-.-',  'L': '.-..',
-            'M': '--',    'N': '-.',    'O': '---',  'P': '.--.',
-            'Q': '--.-',  'R': '.-.',   'S': '...',  'T': '-',
-            'U': '..-',   'V': '...-',  'W': '.--',  'X': '-..-',
-            'Y': '-.--',  'Z': '--..',  ' ': '/'
-        }
-        
-         # Available messages with their associated data
-        self.MESSAGES = {
-            "SECRET ROOM": {
-                "morse": "... . -.-. .-. . - / .-. --- --- --",
-                "clue": "A hidden location",
-                "hint": "Think about where something might be concealed...",
-                "success": "The tapping reveals a hidden area!"
-            },
-            "DOCK SEVEN": {
-                "morse": "... . ...- . -. / -.. --- -.-. -.-",
-                "clue": "A specific location",
-                "hint": "Where ships might be found...",
-                "success": "Another location revealed through the code!"
-            }
+    title = "morse puzzle"
+    PROMPT = "\nWhat's the message? (or 'hint'/'quit'): "
+
+    # Morse code lookup dictionary - standard International Morse Code
+    MORSE_CODE = freeze({
+        'A': '.-',    'B': '-...',  'C': '-.-.', 'D': '-..', 
+        'E': '.',     'F': '..-.',  'G': '--.',  'H': '....',
+        'I': '..',    'J': '.---',  'K': '-.-',  'L': '.-..',
+        'M': '--',    'N': '-.',    'O': '---',  'P': '.--.',
+        'Q': '--.-',  'R': '.-.',   'S': '...',  'T': '-',
+        'U': '..-',   'V': '...-',  'W': '.--',  'X': '-..-',
+        'Y': '-.--',  'Z': '--..',  ' ': '/'
+    })
+    # Available messages with their associated data
+    MESSAGES = freeze({
+        "SECRET ROOM": {
+            "morse": "... . -.-. .-. . - / .-. --- --- --",
+            "clue": "A hidden location",
+            "hint": "Think about where something might be concealed...",
+            "success": "The tapping reveals a hidden area!"
+        },
+        "DOCK SEVEN": {
+            "morse": "... . ...- . -. / -.. --- -.-. -.-",
+            "clue": "A specific location",
+            "hint": "Where ships might be found...",
+            "success": "Another location revealed through the code!"
         }
+    })
+
+    def __init__(self, output: Optional[OutputSink] = None):
+        # Initialize base puzzle features
+        super().__init__(output)
         
         # Puzzle state variables
         self.solved_messages: Set[str] = set()
@@ -78,16 +82,16 @@ class MorsePuzzle(BasePuzzle):
         message_data = self.MESSAGES[message_key]
         
         if attempt_number == 1:
-            print_text(f"\nHint: {message_data['hint']}")
+            print_text(f"\nHint: {message_data['hint']}", output=self.output)
         elif attempt_number == 2:
-            print_text("\nHint: Remember:")
-            print_text("S = ... (three dots)")
-            print_text("E = . (single dot)")
+            print_text("\nHint: Remember:", output=self.output)
+            print_text("S = ... (three dots)", output=self.output)
+            print_text("E = . (single dot)", output=self.output)
         elif attempt_number >= 3:
             # Show first letter decoded
             first_char = message_key[0]
-            print_text(f"\nHint: The message starts with '{first_char}'")
-            print_text(f"'{self.MORSE_CODE[first_char]}' decodes to '{first_char}'")
+            print_text(f"\nHint: The message starts with '{first_char}'", output=self.output)
+            print_text(f"'{self.MORSE_CODE[first_char]}' decodes to '{first_char}'", output=self.output)
 
     def _display_puzzle_introduction(self, morse_code: str, clue: str) -> None:
         """
@@ -106,84 +110,81 @@ class MorsePuzzle(BasePuzzle):
         - '.' represents a dot (short tap)
         - '-' represents a dash (long tap)
         """
-        print_text(intro_text)
+        print_text(intro_text, output=self.output)
 
     def _handle_correct_solution(self, message_key: str, game_state: Dict) -> bool:
         """
         Process a correct solution and update game state.
         Returns True if puzzle should continue, False if complete.
         """
-        print_text(f"\n{self.MESSAGES[message_key]['success']}")
+        print_text(f"\n{self.MESSAGES[message_key]['success']}", output=self.output)
         self.solved_messages.add(message_key)
         
         # Update game state based on message
         if message_key == "SECRET ROOM":
             game_state["found_secret_room"] = True
-            print_text("\nThis must be significant - a secret room in the underground!")
+            print_text("\nThis must be significant - a secret room in the underground!", output=self.output)
         
         # Check for remaining messages
         remaining = len(self.MESSAGES) - len(self.solved_messages)
         if remaining > 0:
-            print_text(f"\nYou can still hear tapping... {remaining} more message(s) to decode.")
+            print_text(f"\nYou can still hear tapping... {remaining} more message(s) to decode.", output=self.output)
             return True
             
         return True
 
-    def solve(self, inventory: List[str], game_state: Dict) -> bool:
-        """
-        Main puzzle solving logic.
-        Implements the abstract method from BasePuzzle.
-        """
-        with self.error_handler("morse puzzle"):
-            # Get next unsolved message
-            message_key, morse_code, clue = self._get_current_message()
-            if not message_key:
-                print_text("\nYou've decoded all the messages in the walls.")
-                return True
+    def _begin(self, inventory: List[str], game_state: Dict) -> Optional[bool]:
+        """Play the next undecoded message."""
+        # Get next unsolved message
+        message_key, morse_code, clue = self._get_current_message()
+        if not message_key:
+            print_text("\nYou've decoded all the messages in the walls.", output=self.output)
+            return True
 
-            self.current_message = message_key
-            self._display_puzzle_introduction(morse_code, clue)
+        self.current_message = message_key
+        self._display_puzzle_introduction(morse_code, clue)
+
+        if self.attempts >= self.max_attempts:
+            print_text("\nThe tapping fades away. Try listening again later.", output=self.output)
+            return False
+        return None
+
+    def _answer(self, answer: str, game_state: Dict) -> Optional[bool]:
+        """Check one decoding of the current message."""
+        message_key = self.current_message
+        command = answer.upper()
+        
+        if command == 'QUIT':
+            return False
             
-            # Main puzzle loop
-            while self.attempts < self.max_attempts:
-                try:
-                    command = input("\nWhat's the message? (or 'hint'/'quit'): ").upper()
-                    
-                    if command == 'QUIT':
-                        return False
-                        
-                    if command == 'HINT':
-                        self._provide_hint(message_key, self.attempts)
-                        continue
-                    
-                    # Validate input
-                    if not InputValidator.validate_puzzle_input(
-                        command, 
-                        valid_chars="ABCDEFGHIJKLMNOPQRSTUVWXYZ ",
-                        max_length=len(message_key) + 5
-                    ):
-                        print_text("\nPlease enter a valid message using letters and spaces.")
-                        continue
-                    
-                    # Check solution
-                    if command == message_key:
-                        return self._handle_correct_solution(message_key, game_state)
-                    
-                    # Handle incorrect answer
-                    if not self.increment_attempts():
-                        break
-
-                    # Offer hint on first failure
-                    if self.attempts == 1:
-                        print_text("Type 'hint' for help.")
-                    
-                except KeyboardInterrupt:
-                    print_text("\nPuzzle attempt interrupted.")
-                    return False
-
-            print_text("\nThe tapping fades away. Try listening again later.")
+        if command == 'HINT':
+            self.hints_used += 1
+            self._provide_hint(message_key, self.attempts)
+            return None
+        
+        # Validate input
+        if not InputValidator.validate_puzzle_input(
+            command, 
+            valid_chars="ABCDEFGHIJKLMNOPQRSTUVWXYZ ",
+            max_length=len(message_key) + 5
+        ):
+            print_text("\nPlease enter a valid message using letters and spaces.", output=self.output)
+            return None
+        
+        # Check solution
+        if command == message_key:
+            return self._handle_correct_solution(message_key, game_state)
+        
+        # Handle incorrect answer
+        if not self.increment_attempts():
+            print_text("\nThe tapping fades away. Try listening again later.", output=self.output)
             return False
 
+        # Offer hint on first failure
+        if self.attempts == 1:
+            print_text("Type 'hint' for help.", output=self.output)
+        return None
+
     def get_state(self) -> Dict:
         """
         Get current puzzle state for saving.
@@ -2,6 +2,8 @@ from typing import Dict, List, Optional
 import logging
 from contextlib import contextmanager
 from utils import print_text
+from change_tracker import ChangeTracker
+from output_sink import OutputSink, TerminalSink
 from .cipher_puzzle import CipherPuzzle
 from .radio_puzzle import RadioPuzzle
 from .morse_puzzle import MorsePuzzle
@@ -9,15 +11,17 @@ from .morse_puzzle import MorsePuzzle
 class PuzzleManager:
     """Enhanced puzzle manager with improved error handling and state management."""
     
-    def __init__(self):
+    def __init__(self, tracker: Optional[ChangeTracker] = None, output: Optional[OutputSink] = None):
         """Initialize puzzle instances and state tracking."""
         self.logger = logging.getLogger(__name__)
+        self.tracker = tracker
+        self.output = output or TerminalSink()
         
         # Initialize all puzzle instances
         self.puzzles = {
-            "cipher_puzzle": CipherPuzzle(),
-            "radio_puzzle": RadioPuzzle(),
-            "morse_puzzle": MorsePuzzle()
+            "cipher_puzzle": CipherPuzzle(self.output),
+            "radio_puzzle": RadioPuzzle(self.output),
+            "morse_puzzle": MorsePuzzle(self.output)
         }
 
         # Map locations to their corresponding puzzles
@@ -29,6 +33,15 @@ class PuzzleManager:
         
         # State management
         self._last_state = {}
+        # Puzzle whose dialog is waiting for an answer
+        self.active_puzzle: Optional[str] = None
+
+    @property
+    def prompt(self) -> Optional[str]:
+        """Question of the open puzzle dialog, None if no puzzle is open."""
+        if self.active_puzzle is None:
+            return None
+        return self.puzzles[self.active_puzzle].prompt
 
     @contextmanager
     def error_handler(self, operation: str):
@@ -37,7 +50,7 @@ class PuzzleManager:
             yield
         except Exception as e:
             self.logger.error(f"Error in puzzle manager {operation}: {e}")
-            print_text(f"\nThere was a problem with {operation}. Progress has been saved.")
+            print_text(f"\nThere was a problem with {operation}. Progress has been saved.", output=self.output)
             # Restore last known good state
             self._restore_last_state()
 
@@ -59,9 +72,13 @@ class PuzzleManager:
                 self.puzzles[puzzle_name].restore_state(state)
                 self.logger.debug(f"Restored state for {puzzle_name}")
 
-    def handle_puzzle(self, location: str, inventory: List[str], game_state: Dict) -> bool:
+    def handle_puzzle(self, location: str, inventory: List[str], game_state: Dict) -> Optional[bool]:
         """
-        Handle puzzle attempt for a given location.
+        Start the puzzle for a given location.
+        
+        The puzzle's dialog stays open until it ends; feed() gives it the
+        player's answers. Nothing here waits for input, so the turns of
+        many sessions' puzzles can be interleaved.
         
         Args:
             location: Current game location
@@ -69,12 +86,13 @@ class PuzzleManager:
             game_state: Current game state
             
         Returns:
-            bool: True if puzzle was solved, False otherwise
+            None while the puzzle waits for an answer, otherwise True if
+            the puzzle was solved and False if not
         """
         with self.error_handler("puzzle handling"):
             # Check if location has a puzzle
             if location not in self.puzzle_map:
-                print_text("There's no puzzle here.")
+                print_text("There's no puzzle here.", output=self.output)
                 return False
                 
             puzzle_name = self.puzzle_map[location]
@@ -87,34 +105,74 @@ class PuzzleManager:
             # Backup current state
             self._backup_state(puzzle_name)
             
-            try:
-                # Check requirements
-                missing_items = [item for item in puzzle.requirements 
-                               if item not in inventory]
-                if missing_items:
-                    items_str = ", ".join(missing_items)
-                    print_text(f"\nYou need: {items_str}")
-                    return False
-                    
-                # Attempt to solve puzzle
-                result = puzzle.solve(inventory, game_state)
-                
-                # If puzzle was solved, update any related game state
-                if result:
-                    self._handle_puzzle_completion(puzzle_name, game_state)
-                
-                return result
-                
-            except KeyboardInterrupt:
-                print_text("\nPuzzle interrupted. Progress saved.")
-                self._restore_last_state()
+            # Check requirements
+            missing_items = [item for item in puzzle.requirements 
+                           if item not in inventory]
+            if missing_items:
+                items_str = ", ".join(missing_items)
+                print_text(f"\nYou need: {items_str}", output=self.output)
                 return False
                 
-            except Exception as e:
-                self.logger.error(f"Error in puzzle {puzzle_name}: {e}")
-                print_text("\nPuzzle error occurred. Progress saved.")
-                self._restore_last_state()
-                return False
+            self.active_puzzle = puzzle_name
+            return self._after_step(puzzle_name, lambda: puzzle.start(inventory, game_state), game_state)
+        return False
+
+    def feed(self, answer: str, game_state: Dict) -> Optional[bool]:
+        """
+        Give the open puzzle the player's answer.
+        
+        Args:
+            answer: Answer as the player typed it
+            game_state: Current game state
+            
+        Returns:
+            None while the puzzle waits for another answer, otherwise True
+            if the puzzle was solved and False if not
+        """
+        puzzle_name = self.active_puzzle
+        if puzzle_name is None:
+            return False
+        with self.error_handler("puzzle handling"):
+            puzzle = self.puzzles[puzzle_name]
+            return self._after_step(puzzle_name, lambda: puzzle.feed(answer, game_state), game_state)
+        self.active_puzzle = None
+        return False
+
+    def _after_step(self, puzzle_name: str, step, game_state: Dict) -> Optional[bool]:
+        """
+        Run one step of a puzzle dialog and record its effects.
+        
+        Args:
+            puzzle_name: Name of the puzzle
+            step: Function running the step, returning its outcome
+            game_state: Current game state
+            
+        Returns:
+            The step's outcome
+        """
+        try:
+            result = step()
+        except Exception as e:
+            self.logger.error(f"Error in puzzle {puzzle_name}: {e}")
+            print_text("\nPuzzle error occurred. Progress saved.", output=self.output)
+            self.puzzles[puzzle_name].active = False
+            self.active_puzzle = None
+            self._restore_last_state()
+            return False
+
+        if self.puzzles[puzzle_name].get_state() != self._last_state.get(puzzle_name):
+            if self.tracker:
+                self.tracker.mark("puzzles")
+            # The new state is the one to fall back to if a later answer fails
+            self._backup_state(puzzle_name)
+        if result is None:
+            return None
+
+        self.active_puzzle = None
+        # If puzzle was solved, update any related game state
+        if result:
+            self._handle_puzzle_completion(puzzle_name, game_state)
+        return result
 
     def _handle_puzzle_completion(self, puzzle_name: str, game_state: Dict) -> None:
         """
@@ -152,6 +210,7 @@ class PuzzleManager:
         Args:
             states: Dictionary of puzzle states to restore
         """
+        self.active_puzzle = None
         for name, state in states.items():
             if name in self.puzzles:
                 self.puzzles[name].restore_state(state)
@@ -1,6 +1,8 @@
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import random
 from .base_puzzle import BasePuzzle
+from output_sink import OutputSink
+from static_content import freeze
 from utils import print_text
 from input_validator import InputValidator
 
@@ -10,38 +12,49 @@ class RadioPuzzle(BasePuzzle):
     Players must tune to correct frequencies to intercept suspicious transmissions.
     """
 
-    def __init__(self):
+    title = "radio puzzle"
+    PROMPT = "\nEnter frequency to tune (or 'quit'): "
+    INTRO_TEXT = """
+    Objective: Locate the emergency frequency being used by the smugglers.
+    The radio manual indicates suspicious activity on emergency channels.
+
+    The radio manual lists several frequency ranges:
+    Emergency Services: 1400-1500 kHz  (Known smuggler activity)
+    Police Band: 1200-1300 kHz        (May contain useful intel)
+    Civilian Band: 1000-1100 kHz      (Dock worker communications)
+    """
+
+    # Define frequency ranges for different radio bands
+    RADIO_RANGES = freeze({
+        "emergency": (1400, 1500),
+        "police": (1200, 1300),
+        "civilian": (1000, 1100)
+    })
+    # Define possible messages for each band
+    RADIO_MESSAGES = freeze({
+        "emergency": [
+            ("...urgent shipment tonight... dock 7... look for red star...",
+             "Emergency broadcast about suspicious shipment"),
+            ("...medical supplies... warehouse district... midnight...",
+             "Emergency alert about medical supplies"),
+        ],
+        "police": [
+            ("...patrol units report to waterfront... suspicious activity...",
+             "Police dispatch about waterfront"),
+            ("...all units... warehouse district... maintain surveillance...",
+             "Police alert about warehouse"),
+        ],
+        "civilian": [
+            ("...weather forecast: heavy rain expected... port closing early...",
+             "Civilian broadcast about weather"),
+            ("...dock workers union meeting... discussing night shifts...",
+             "Civilian broadcast about dock workers"),
+        ]
+    })
+
+    def __init__(self, output: Optional[OutputSink] = None):
         # Initialize base puzzle features
-        super().__init__()
-        
-        # Define frequency ranges for different radio bands
-        self.RADIO_RANGES = {
-            "emergency": (1400, 1500),
-            "police": (1200, 1300),
-            "civilian": (1000, 1100)
-        }
-        
-        # Define possible messages for each band
-        self.RADIO_MESSAGES = {
-            "emergency": [
-                ("...urgent shipment tonight... dock 7... look for red star...",
-                 "Emergency broadcast about suspicious shipment"),
-                ("...medical supplies... warehouse district... midnight...",
-                 "Emergency alert about medical supplies"),
-            ],
-            "police": [
-                ("...patrol units report to waterfront... suspicious activity...",
-                 "Police dispatch about waterfront"),
-                ("...all units... warehouse district... maintain surveillance...",
-                 "Police alert about warehouse"),
-            ],
-            "civilian": [
-                ("...weather forecast: heavy rain expected... port closing early...",
-                 "Civilian broadcast about weather"),
-                ("...dock workers union meeting... discussing night shifts...",
-                 "Civilian broadcast about dock workers"),
-            ]
-        }
+        super().__init__(output)
         
         # Puzzle state variables
         self.active_frequencies = self._generate_frequencies()
@@ -111,101 +124,92 @@ class RadioPuzzle(BasePuzzle):
         Display the puzzle introduction and instructions.
         Provides context and guidance to the player.
         """
-        intro_text = """
-        Objective: Locate the emergency frequency being used by the smugglers.
-        The radio manual indicates suspicious activity on emergency channels.
-
-        The radio manual lists several frequency ranges:
-        Emergency Services: 1400-1500 kHz  (Known smuggler activity)
-        Police Band: 1200-1300 kHz        (May contain useful intel)
-        Civilian Band: 1000-1100 kHz      (Dock worker communications)
-        """
-        print_text(intro_text)
+        print_text(self.INTRO_TEXT, output=self.output)
     
     def _handle_strong_signal(self, band: str, message: str, game_state: Dict) -> bool:
         """
         Process a strong signal detection and update game state.
         Returns True if puzzle should continue, False if complete.
         """
-        print_text(f"\nClear transmission:")
-        print_text(message)
+        print_text(f"\nClear transmission:", output=self.output)
+        print_text(message, output=self.output)
         self.found_frequencies.add(band)
         
         # Check if found emergency frequency
         if band == "emergency" and not game_state.get("solved_radio_puzzle", False):
-            print_text("\nThis is it! You've found the smugglers' frequency!")
+            print_text("\nThis is it! You've found the smugglers' frequency!", output=self.output)
             game_state["solved_radio_puzzle"] = True
         
         # Check if found all frequencies
         if len(self.found_frequencies) == len(self.RADIO_RANGES):
-            print_text("\nBy cross-referencing all the transmissions, you've uncovered")
-            print_text("a clear pattern of suspicious activity at the waterfront.")
+            print_text("\nBy cross-referencing all the transmissions, you've uncovered", output=self.output)
+            print_text("a clear pattern of suspicious activity at the waterfront.", output=self.output)
             game_state["understood_radio"] = True
             return True
             
         return False
     
-    def solve(self, inventory: List[str], game_state: Dict) -> bool:
-        """
-        Main puzzle solving logic.
-        Implements the abstract method from BasePuzzle.
-        """
-        with self.error_handler("radio puzzle"):
-            # Check if already solved
-            if game_state.get("solved_radio_puzzle", False):
-                print_text("\nYou've already decoded the critical emergency transmission.")
-                print_text("The radio remains available for scanning other frequencies.")
-            
-            # Reset frequencies for new attempt
-            self.active_frequencies = self._generate_frequencies()
-            
-            # Display introduction
-            self._display_puzzle_introduction()
-            
-            # Main puzzle loop
-            while self.attempts < self.max_attempts:
-                try:
-                    print_text(f"\nAttempts remaining: {self.max_attempts - self.attempts}")
-                    if self.found_frequencies:
-                        print_text("Tuned bands: " + ", ".join(self.found_frequencies))
-                    
-                    guess = input("\nEnter frequency to tune (or 'quit'): ").lower()
-                    
-                    if guess == "quit":
-                        return False
-                    
-                    # Validate input
-                    if not self._validate_frequency(guess):
-                        print_text("Please enter a valid frequency number.")
-                        continue
-                    
-                    frequency = int(guess)
-                    strength, message, band = self.get_signal_strength(frequency)
-                    
-                    # Only increment attempts for actual tuning attempts
-                    if not self.increment_attempts():
-                        break
-                    
-                    print_text(f"\nSignal Strength: {strength}")
-                    
-                    if strength == "STRONG":
-                        if self._handle_strong_signal(band, message, game_state):
-                            return True
-                    else:
-                        print_text(message)
-                    
-                    # Give hint after several attempts
-                    if self.attempts == 3:
-                        print_text("\nHint: Try methodically scanning through each band's range.")
-                    
-                except ValueError:
-                    print_text("Please enter a valid frequency number.")
-                except KeyboardInterrupt:
-                    print_text("\nRadio operation interrupted.")
-                    return False
-
-            print_text("\nThe radio needs time to cool down. Try again later.")
+    def _begin(self, inventory: List[str], game_state: Dict) -> Optional[bool]:
+        """Show the radio and retune the transmissions for a new session."""
+        # Check if already solved
+        if game_state.get("solved_radio_puzzle", False):
+            print_text("\nYou've already decoded the critical emergency transmission.", output=self.output)
+            print_text("The radio remains available for scanning other frequencies.", output=self.output)
+        
+        # Reset frequencies for new attempt
+        self.active_frequencies = self._generate_frequencies()
+        
+        # Display introduction
+        self._display_puzzle_introduction()
+
+        if self.attempts >= self.max_attempts:
+            print_text("\nThe radio needs time to cool down. Try again later.", output=self.output)
+            return False
+        self._display_status()
+        return None
+
+    def _answer(self, answer: str, game_state: Dict) -> Optional[bool]:
+        """Tune to one frequency."""
+        guess = answer.lower()
+        
+        if guess == "quit":
+            return False
+        
+        # Validate input
+        if not self._validate_frequency(guess):
+            print_text("Please enter a valid frequency number.", output=self.output)
+            self._display_status()
+            return None
+        
+        frequency = int(guess)
+        strength, message, band = self.get_signal_strength(frequency)
+        
+        # Only increment attempts for actual tuning attempts
+        if not self.increment_attempts():
+            print_text("\nThe radio needs time to cool down. Try again later.", output=self.output)
             return False
+        
+        print_text(f"\nSignal Strength: {strength}", output=self.output)
+        
+        if strength == "STRONG":
+            if self._handle_strong_signal(band, message, game_state):
+                return True
+        else:
+            print_text(message, output=self.output)
+        
+        # Give hint after several attempts
+        if self.attempts == 3:
+            self.hints_used += 1
+            print_text("\nHint: Try methodically scanning through each band's range.", output=self.output)
+
+        self._display_status()
+        return None
+
+    def _display_status(self) -> None:
+        """Show the attempts left and the bands tuned so far."""
+        print_text(f"\nAttempts remaining: {self.max_attempts - self.attempts}", output=self.output)
+        if self.found_frequencies:
+            print_text("Tuned bands: " + ", ".join(self.found_frequencies), output=self.output)
 
     def get_state(self) -> Dict:
         """
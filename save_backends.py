@@ -0,0 +1,691 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from contextlib import contextmanager
+import logging
+import re
+import sqlite3
+import time
+import config
+from save_manifest import SaveManifest
+from save_journal import SaveJournal
+from save_store import BlobStore
+from save_ledger import SizeLedger
+from save_format import (SAVE_SUFFIXES, decode_save, encode_save, find_save_file,
+                         iter_save_files, read_save_file, read_save_header,
+                         write_file_atomic)
+
+# Save names starting with this prefix are automatic saves
+AUTOSAVE_PREFIX = "autosave_"
+
+# Save names become file names, so no separators, dots or empty names
+SAVE_NAME = re.compile(rf"^[A-Za-z0-9_-]{{1,{config.SAVE_NAME_MAX_LENGTH}}}$")
+
+# Temporary files from interrupted atomic writes older than this are removed
+STALE_TEMP_FILE_AGE = 3600  # seconds
+
+def is_valid_save_name(save_name: Any) -> bool:
+    """Check that a save name is safe to use as a file name in the save directory."""
+    return isinstance(save_name, str) and SAVE_NAME.match(save_name) is not None
+
+def _prefix_bounds(prefix: str) -> Tuple[str, str]:
+    """Get the range of names starting with prefix, for indexed SQL lookups."""
+    return prefix, prefix + chr(0x10FFFF)
+
+class SaveBackend(ABC):
+    """
+    Abstract storage for saved games.
+
+    Backends store and query save data produced by
+    SaveLoadManager.create_snapshot(); restoring a game and version
+    migrations stay in SaveLoadManager.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @abstractmethod
+    def write(self, save_data: Dict[str, Any], checkpoint: bool = False) -> None:
+        """
+        Store a save, replacing any save of the same name.
+
+        Args:
+            save_data: Save data to store
+            checkpoint: Store the full state even if incremental writes are supported
+        """
+        pass
+
+    @abstractmethod
+    def read(self, save_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest data of a save.
+
+        Args:
+            save_name: Name of the save
+
+        Returns:
+            Dict containing the save data, or None if it does not exist
+        """
+        pass
+
+    @abstractmethod
+    def list_saves(self) -> List[Dict[str, Any]]:
+        """
+        List metadata of all saves, newest first.
+
+        Returns:
+            List of dictionaries with name, date, location and file_path
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, save_name: str) -> bool:
+        """
+        Delete a save.
+
+        Args:
+            save_name: Name of the save
+
+        Returns:
+            bool: True if a save was deleted
+        """
+        pass
+
+    @abstractmethod
+    def prune_autosaves(self, keep_count: int) -> None:
+        """
+        Delete all but the newest autosaves.
+
+        Args:
+            keep_count: Number of autosaves to keep
+        """
+        pass
+
+    @abstractmethod
+    def usage(self, prefix: str = "") -> int:
+        """
+        Get the bytes used by saves whose names start with prefix.
+
+        Args:
+            prefix: Save name prefix, "" for all saves
+
+        Returns:
+            int: Bytes used
+        """
+        pass
+
+    @abstractmethod
+    def enforce_quota(self, prefix: str, max_bytes: int) -> None:
+        """
+        Delete the oldest autosaves starting with prefix until the saves
+        with that prefix fit in max_bytes.
+
+        Args:
+            prefix: Save name prefix, "" for all saves
+            max_bytes: Size limit for those saves
+        """
+        pass
+
+    def enforce_quotas(self, quotas: Dict[str, int]) -> None:
+        """
+        Enforce several quotas, most specific prefix first.
+
+        Args:
+            quotas: Save name prefix -> size limit in bytes
+        """
+        for prefix in sorted(quotas, key=len, reverse=True):
+            self.enforce_quota(prefix, quotas[prefix])
+
+    @abstractmethod
+    def autosave_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about autosaves.
+
+        Returns:
+            Dict with count, total_size_bytes, oldest and newest
+        """
+        pass
+
+    @contextmanager
+    def group_commit(self):
+        """
+        Context manager deferring the flush of writes made inside it.
+
+        Writes inside the block are flushed to disk together when it exits,
+        so a batch of autosaves costs one flush instead of one per save.
+        """
+        yield
+
+    def can_extend(self, save_name: str) -> bool:
+        """
+        Check whether the next write of this name can be incremental.
+
+        Backends without incremental writes always store full saves, so
+        autosaves each get their own entry.
+        """
+        return False
+
+    def needs_conversion(self, save_name: str, save_data: Dict[str, Any]) -> bool:
+        """Check whether a save should be rewritten in the current version."""
+        return save_data.get('version') != config.SAVE_FILE_VERSION
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+        pass
+
+class FilesystemSaveBackend(SaveBackend):
+    """
+    Saves as files in one directory.
+
+    Checkpoints are JSON or binary files, repeated saves of one name go to
+    a journal, autosave sections can be deduplicated in a blob store and
+    a manifest indexes the metadata for listing.
+    """
+
+    def __init__(self, save_dir: Path):
+        super().__init__()
+        self.save_dir = Path(save_dir)
+        self.save_dir.mkdir(parents=True, exist_ok=True)
+        self.journal = SaveJournal(self.save_dir)
+        self.blob_store = BlobStore(self.save_dir)
+        self.manifest = SaveManifest(self.save_dir, loader=self._read_save_metadata)
+        self.ledger = SizeLedger()
+        self._group_depth = 0
+
+    def write(self, save_data: Dict[str, Any], checkpoint: bool = False) -> None:
+        save_name = save_data['save_name']
+
+        with self.manifest.updating():
+            existing = self._find_save_file(save_name)
+            if not checkpoint and existing and self.can_extend(save_name):
+                # Only the changes since the last save of this name
+                self.journal.append(save_data, durable=config.SAVE_FSYNC and not self._group_depth)
+                file_path = existing
+            else:
+                # Full checkpoint, which also compacts any journal
+                file_path = self._save_path(save_name, SAVE_SUFFIXES[config.SAVE_FORMAT])
+                if config.SAVE_DEDUP_AUTOSAVES and save_name.startswith(AUTOSAVE_PREFIX):
+                    # Autosaves share identical sections through the blob store
+                    contents = self.blob_store.store(save_data)
+                else:
+                    contents = save_data
+                if existing:
+                    self._release_blobs(existing)
+                write_file_atomic(file_path, encode_save(contents, config.SAVE_FORMAT),
+                                  config.SAVE_FSYNC)
+                if existing and existing != file_path:
+                    # The save was converted to another format
+                    existing.unlink()
+                self.journal.start(save_data)
+            self.manifest.record(save_data, file_path)
+            self.ledger.record(save_name, self._save_size(file_path), file_path.stat().st_mtime)
+
+        self.logger.info(f"Game saved successfully to {file_path}")
+
+    @contextmanager
+    def group_commit(self):
+        # Checkpoints are always flushed before they replace the old file;
+        # journal appends inside the group share one fsync per journal.
+        self._group_depth += 1
+        try:
+            yield
+        finally:
+            self._group_depth -= 1
+            if not self._group_depth and config.SAVE_FSYNC:
+                self.journal.sync()
+
+    def read(self, save_name: str) -> Optional[Dict[str, Any]]:
+        file_path = self._find_save_file(save_name)
+        if not file_path:
+            return None
+        return self.journal.replay(save_name, self._load_checkpoint(file_path))
+
+    def list_saves(self) -> List[Dict[str, Any]]:
+        return self.manifest.list_entries()
+
+    def delete(self, save_name: str) -> bool:
+        file_path = self._find_save_file(save_name)
+        if not file_path:
+            return False
+        with self.manifest.updating():
+            self._remove_save_files(file_path)
+        self.logger.info(f"Deleted save file: {file_path}")
+        return True
+
+    def can_extend(self, save_name: str) -> bool:
+        return (config.SAVE_JOURNAL_ENABLED and self.journal.can_append(save_name)
+                and self._find_save_file(save_name) is not None)
+
+    def needs_conversion(self, save_name: str, save_data: Dict[str, Any]) -> bool:
+        file_path = self._find_save_file(save_name)
+        return (super().needs_conversion(save_name, save_data)
+                or (file_path is not None
+                    and (file_path.suffix != SAVE_SUFFIXES[config.SAVE_FORMAT]
+                         or read_save_header(file_path) is None)))
+
+    def prune_autosaves(self, keep_count: int) -> None:
+        # Get all auto-save files
+        autosaves = []
+        for save_file in iter_save_files(self.save_dir, f"{AUTOSAVE_PREFIX}*"):
+            try:
+                timestamp = int(save_file.stem.split('_')[1])
+                autosaves.append((timestamp, save_file))
+            except (IndexError, ValueError):
+                # Handle files that don't match our naming pattern
+                continue
+
+        # Sort by timestamp (newest first) and remove old ones
+        autosaves.sort(reverse=True)
+
+        # Keep the newest 'keep_count' saves, delete the rest
+        with self.manifest.updating():
+            for _, file_path in autosaves[keep_count:]:
+                try:
+                    self._remove_save_files(file_path)
+                    self.logger.info(f"Cleaned up old auto-save: {file_path}")
+                except Exception as e:
+                    self.logger.warning(f"Failed to delete old auto-save {file_path}: {e}")
+
+    def usage(self, prefix: str = "") -> int:
+        if self.ledger.needs_reconcile():
+            self._reconcile_ledger()
+        # Blobs are shared between saves, so they only count in the total
+        blob_size = 0 if prefix else self.blob_store.total_size()
+        return self.ledger.usage(prefix) + blob_size
+
+    def enforce_quotas(self, quotas: Dict[str, int]) -> None:
+        if self.blob_store.needs_reconcile():
+            self._reconcile_blob_refs()
+        if self.ledger.needs_reconcile():
+            self._reconcile_ledger()
+
+        super().enforce_quotas(quotas)
+
+        # Free blobs no longer referenced by any save
+        self.blob_store.collect_garbage()
+
+    def enforce_quota(self, prefix: str, max_bytes: int) -> None:
+        total_size = self.usage(prefix)
+        if total_size <= max_bytes:
+            return
+
+        # Remove old auto-saves until we're under the limit
+        self.logger.warning(f"Saves starting with '{prefix}' exceed their quota, cleaning up...")
+        with self.manifest.updating():
+            for save_name in self.ledger.oldest_first(prefix):
+                if total_size <= max_bytes:
+                    break
+                if not save_name.startswith(AUTOSAVE_PREFIX):
+                    continue
+
+                save_file = find_save_file(self.save_dir, save_name)
+                try:
+                    if save_file:
+                        total_size -= self._remove_save_files(save_file)
+                        self.logger.info(f"Removed old auto-save to free space: {save_file}")
+                    else:
+                        self.ledger.remove(save_name)
+                except Exception as e:
+                    self.logger.error(f"Failed to remove old save {save_file}: {e}")
+
+    def autosave_stats(self) -> Dict[str, Any]:
+        autosaves = list(iter_save_files(self.save_dir, f"{AUTOSAVE_PREFIX}*"))
+        total_size = sum(f.stat().st_size for f in autosaves)
+
+        return {
+            'count': len(autosaves),
+            'total_size_bytes': total_size,
+            'oldest': min(f.stat().st_mtime for f in autosaves) if autosaves else None,
+            'newest': max(f.stat().st_mtime for f in autosaves) if autosaves else None,
+        }
+
+    def _reconcile_ledger(self) -> None:
+        """Measure every save on disk and reset the size ledger."""
+        entries = []
+        for save_file in iter_save_files(self.save_dir):
+            try:
+                entries.append((save_file.stem, self._save_size(save_file), save_file.stat().st_mtime))
+            except OSError as e:
+                self.logger.warning(f"Error measuring save file {save_file}: {e}")
+        self.ledger.reset(entries)
+        self.blob_store.measure()
+        self._remove_stale_temp_files()
+
+    def _remove_stale_temp_files(self) -> None:
+        """Delete temporary files left behind by writes interrupted by a crash."""
+        cutoff = time.time() - STALE_TEMP_FILE_AGE
+        for temp_file in self.save_dir.glob("**/.*.tmp"):
+            try:
+                if temp_file.stat().st_mtime < cutoff:
+                    temp_file.unlink()
+                    self.logger.info(f"Removed stale temporary file: {temp_file}")
+            except OSError as e:
+                self.logger.warning(f"Failed to remove temporary file {temp_file}: {e}")
+
+    def _save_path(self, save_name: str, suffix: str) -> Path:
+        """
+        Get the path of a save file, refusing names that leave the save directory.
+
+        Raises:
+            ValueError: If the path would not be directly inside save_dir
+        """
+        file_path = self.save_dir / f"{save_name}{suffix}"
+        if file_path.resolve().parent != self.save_dir.resolve():
+            raise ValueError(f"Save name {save_name!r} points outside the save directory")
+        return file_path
+
+    def _find_save_file(self, save_name: str) -> Optional[Path]:
+        """Find a save's checkpoint file after checking its name stays in save_dir."""
+        self._save_path(save_name, "")
+        return find_save_file(self.save_dir, save_name)
+
+    def _read_save_metadata(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Read the listing metadata of a save.
+
+        Only the checkpoint header is read; journal entries are applied on
+        top since they may change the date and location. Saves from before
+        save headers are read in full.
+        """
+        metadata = read_save_header(file_path)
+        if metadata is None:
+            metadata = self._load_checkpoint(file_path)
+        else:
+            # The header may hold a shortened name; the file name is the full one
+            metadata['save_name'] = file_path.stem
+        return self.journal.replay(file_path.stem, metadata, track=False)
+
+    def _load_checkpoint(self, file_path: Path) -> Dict[str, Any]:
+        """Read a save checkpoint, resolving blob manifests."""
+        save_data = read_save_file(file_path)
+        if BlobStore.is_manifest(save_data):
+            save_data = self.blob_store.load(save_data)
+        return save_data
+
+    def _release_blobs(self, file_path: Path) -> int:
+        """
+        Release the blobs referenced by a save checkpoint, if any.
+
+        Returns:
+            int: Bytes that blob garbage collection will free
+        """
+        try:
+            save_data = read_save_file(file_path)
+            if BlobStore.is_manifest(save_data):
+                return self.blob_store.release(save_data)
+        except Exception as e:
+            self.logger.warning(f"Error releasing blobs of {file_path}: {e}")
+        return 0
+
+    def _reconcile_blob_refs(self) -> None:
+        """Recount blob references from every save manifest on disk."""
+        manifests = []
+        for file_path in iter_save_files(self.save_dir):
+            try:
+                save_data = read_save_file(file_path)
+                if BlobStore.is_manifest(save_data):
+                    manifests.append(save_data)
+            except Exception as e:
+                self.logger.warning(f"Error reading save file {file_path}: {e}")
+        self.blob_store.reset_refs(manifests)
+        self.logger.info(f"Reconciled blob references from {len(manifests)} saves")
+
+    def _save_size(self, file_path: Path) -> int:
+        """Get the size of a save checkpoint plus its journal."""
+        size = file_path.stat().st_size
+        journal_path = self.journal.journal_path(file_path.stem)
+        if journal_path.exists():
+            size += journal_path.stat().st_size
+        return size
+
+    def _remove_save_files(self, file_path: Path) -> int:
+        """
+        Delete a save checkpoint and its journal, releasing its blobs.
+        Must be called inside manifest.updating().
+
+        Returns:
+            int: Bytes freed, counting blobs left for garbage collection
+        """
+        size = self._save_size(file_path) + self._release_blobs(file_path)
+        file_path.unlink()
+        self.journal.discard(file_path.stem)
+        self.manifest.remove(file_path.stem)
+        self.ledger.remove(file_path.stem)
+        return size
+
+class SQLiteSaveBackend(SaveBackend):
+    """
+    Saves as rows in an SQLite database in WAL mode.
+
+    Metadata lives in indexed columns, so listing, autosave pruning and
+    size limits are SQL queries instead of directory scans.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS saves (
+            name TEXT PRIMARY KEY,
+            save_date TEXT NOT NULL,
+            location TEXT,
+            version TEXT,
+            format TEXT NOT NULL,
+            is_autosave INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            payload BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS saves_by_date ON saves (save_date);
+        CREATE INDEX IF NOT EXISTS autosaves_by_date ON saves (is_autosave, save_date);
+    """
+
+    def __init__(self, db_path: Path):
+        super().__init__()
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Writes come from the autosave worker; SaveLoadManager serializes access
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # FULL syncs the WAL on every commit; NORMAL only at WAL checkpoints
+        self.connection.execute(f"PRAGMA synchronous={'FULL' if config.SAVE_FSYNC else 'NORMAL'}")
+        self.connection.executescript(self.SCHEMA)
+        self._group_depth = 0
+
+    @contextmanager
+    def group_commit(self):
+        # All writes in the group become one transaction, hence one WAL sync
+        self._group_depth += 1
+        try:
+            yield
+        except Exception:
+            if self._group_depth == 1:
+                self.connection.rollback()
+            raise
+        else:
+            if self._group_depth == 1:
+                self.connection.commit()
+        finally:
+            self._group_depth -= 1
+
+    @contextmanager
+    def _transaction(self):
+        """Commit on exit unless inside group_commit()."""
+        if self._group_depth:
+            yield
+            return
+        with self.connection:
+            yield
+
+    def write(self, save_data: Dict[str, Any], checkpoint: bool = False) -> None:
+        payload = encode_save(save_data, config.SAVE_FORMAT)
+        with self._transaction():
+            self.connection.execute(
+                "INSERT OR REPLACE INTO saves VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (save_data['save_name'], save_data['save_date'],
+                 save_data.get('current_location'), save_data.get('version'),
+                 config.SAVE_FORMAT, save_data['save_name'].startswith(AUTOSAVE_PREFIX),
+                 len(payload), payload)
+            )
+        self.logger.info(f"Game saved successfully to {self.db_path}: {save_data['save_name']}")
+
+    def read(self, save_name: str) -> Optional[Dict[str, Any]]:
+        row = self.connection.execute(
+            "SELECT payload FROM saves WHERE name = ?", (save_name,)
+        ).fetchone()
+        return decode_save(row[0]) if row else None
+
+    def list_saves(self) -> List[Dict[str, Any]]:
+        rows = self.connection.execute(
+            "SELECT name, save_date, location FROM saves ORDER BY save_date DESC"
+        )
+        return [{'name': name, 'date': date, 'location': location,
+                 'file_path': str(self.db_path)}
+                for name, date, location in rows]
+
+    def delete(self, save_name: str) -> bool:
+        with self._transaction():
+            cursor = self.connection.execute("DELETE FROM saves WHERE name = ?", (save_name,))
+        return cursor.rowcount > 0
+
+    def needs_conversion(self, save_name: str, save_data: Dict[str, Any]) -> bool:
+        row = self.connection.execute(
+            "SELECT format FROM saves WHERE name = ?", (save_name,)
+        ).fetchone()
+        return (super().needs_conversion(save_name, save_data)
+                or (row is not None and row[0] != config.SAVE_FORMAT))
+
+    def prune_autosaves(self, keep_count: int) -> None:
+        with self._transaction():
+            cursor = self.connection.execute(
+                """DELETE FROM saves WHERE is_autosave = 1 AND name NOT IN (
+                       SELECT name FROM saves WHERE is_autosave = 1
+                       ORDER BY save_date DESC LIMIT ?)""",
+                (keep_count,)
+            )
+        if cursor.rowcount > 0:
+            self.logger.info(f"Cleaned up {cursor.rowcount} old auto-saves")
+
+    def usage(self, prefix: str = "") -> int:
+        return self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM saves WHERE name >= ? AND name < ?",
+            _prefix_bounds(prefix)
+        ).fetchone()[0]
+
+    def enforce_quota(self, prefix: str, max_bytes: int) -> None:
+        total_size = self.usage(prefix)
+        if total_size <= max_bytes:
+            return
+
+        self.logger.warning(f"Saves starting with '{prefix}' exceed their quota, cleaning up...")
+        # Oldest autosaves whose removal is still needed to get under the limit
+        with self._transaction():
+            cursor = self.connection.execute(
+                """DELETE FROM saves WHERE name IN (
+                       SELECT name FROM (
+                           SELECT name, SUM(size) OVER (
+                               ORDER BY save_date, name ROWS UNBOUNDED PRECEDING
+                           ) - size AS freed_before
+                           FROM saves
+                           WHERE is_autosave = 1 AND name >= ? AND name < ?)
+                       WHERE freed_before < ?)""",
+                (*_prefix_bounds(prefix), total_size - max_bytes)
+            )
+        self.logger.info(f"Removed {cursor.rowcount} old auto-saves to free space")
+
+    def autosave_stats(self) -> Dict[str, Any]:
+        count, total_size, oldest, newest = self.connection.execute(
+            """SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(save_date), MAX(save_date)
+               FROM saves WHERE is_autosave = 1"""
+        ).fetchone()
+        return {
+            'count': count,
+            'total_size_bytes': total_size,
+            'oldest': oldest,
+            'newest': newest,
+        }
+
+    def close(self) -> None:
+        self.connection.close()
+
+class MemorySaveBackend(SaveBackend):
+    """
+    Saves kept in process memory.
+
+    Nothing touches the disk, which suits headless sessions and tests.
+    Saves are kept encoded, so they share nothing with the game and
+    count against quotas by their encoded size.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # save name -> (metadata entry, encoded save)
+        self._saves: Dict[str, Tuple[Dict[str, Any], bytes]] = {}
+
+    def write(self, save_data: Dict[str, Any], checkpoint: bool = False) -> None:
+        entry = {'name': save_data['save_name'], 'date': save_data['save_date'],
+                 'location': save_data.get('current_location'), 'file_path': None}
+        self._saves[save_data['save_name']] = (entry, encode_save(save_data, config.SAVE_FORMAT))
+
+    def read(self, save_name: str) -> Optional[Dict[str, Any]]:
+        saved = self._saves.get(save_name)
+        return decode_save(saved[1]) if saved else None
+
+    def list_saves(self) -> List[Dict[str, Any]]:
+        return sorted(
+            (dict(entry) for entry, _ in self._saves.values()),
+            key=lambda x: x['date'],
+            reverse=True
+        )
+
+    def delete(self, save_name: str) -> bool:
+        return self._saves.pop(save_name, None) is not None
+
+    def prune_autosaves(self, keep_count: int) -> None:
+        for name in self._autosaves_by_date()[keep_count:]:
+            del self._saves[name]
+
+    def usage(self, prefix: str = "") -> int:
+        return sum(len(payload) for name, (_, payload) in self._saves.items()
+                   if name.startswith(prefix))
+
+    def enforce_quota(self, prefix: str, max_bytes: int) -> None:
+        total_size = self.usage(prefix)
+        for name in reversed(self._autosaves_by_date()):
+            if total_size <= max_bytes:
+                break
+            if name.startswith(prefix):
+                total_size -= len(self._saves.pop(name)[1])
+
+    def autosave_stats(self) -> Dict[str, Any]:
+        autosaves = self._autosaves_by_date()
+        return {
+            'count': len(autosaves),
+            'total_size_bytes': sum(len(self._saves[name][1]) for name in autosaves),
+            'oldest': self._saves[autosaves[-1]][0]['date'] if autosaves else None,
+            'newest': self._saves[autosaves[0]][0]['date'] if autosaves else None,
+        }
+
+    def _autosaves_by_date(self) -> List[str]:
+        """Get autosave names, newest first."""
+        return sorted(
+            (name for name in self._saves if name.startswith(AUTOSAVE_PREFIX)),
+            key=lambda name: self._saves[name][0]['date'],
+            reverse=True
+        )
+
+def create_save_backend(backend: str = config.SAVE_BACKEND,
+                        save_dir: Path = config.SAVE_DIR) -> SaveBackend:
+    """
+    Create the save backend selected in config.
+
+    Args:
+        backend: "filesystem", "sqlite" or "memory"
+        save_dir: Directory for save files or the save database
+
+    Returns:
+        SaveBackend instance
+    """
+    if backend == "sqlite":
+        return SQLiteSaveBackend(Path(save_dir) / config.SAVE_DB_FILE)
+    if backend == "memory":
+        return MemorySaveBackend()
+    if backend != "filesystem":
+        raise ValueError(f"Unknown save backend: {backend}")
+    return FilesystemSaveBackend(save_dir)
@@ -0,0 +1,429 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from pathlib import Path
+import json
+import logging
+import os
+import struct
+import tempfile
+import zlib
+import config
+
+logger = logging.getLogger(__name__)
+
+# File suffix used by each save format
+SAVE_SUFFIXES = {
+    "json": ".json",
+    "binary": ".sav"
+}
+
+# Every save starts with a fixed-size header: magic, layout version,
+# payload encoding, payload length, CRC-32 of the payload and the
+# metadata shown in save listings as NUL-padded UTF-8 fields
+SAVE_MAGIC = b"SNSV"
+SAVE_LAYOUT_VERSION = 2
+SAVE_HEADER = struct.Struct("<4sBBII96s32s64s16s34x")
+HEADER_FIELDS = ('save_name', 'save_date', 'current_location', 'version')
+PAYLOAD_ENCODINGS = {"json": 0, "binary": 1}
+
+# Layout 1 binary saves: magic, layout version, metadata length, payload length
+LEGACY_BINARY_LAYOUT_VERSION = 1
+LEGACY_BINARY_HEADER = struct.Struct("<4sBHI")
+
+# Game state flags that are stored as bits in binary saves
+FLAG_KEYS = [key for key, value in config.INITIAL_GAME_STATE.items()
+             if isinstance(value, bool)]
+
+# Value tags for the binary encoding
+_TAG_NONE, _TAG_FALSE, _TAG_TRUE, _TAG_INT, _TAG_STR, _TAG_LIST, _TAG_DICT, _TAG_FLOAT = range(8)
+
+# from_version -> function upgrading save data by one version
+SAVE_MIGRATIONS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+
+def register_migration(from_version: str):
+    """
+    Decorator registering a migration from one save file version.
+
+    The decorated function receives save data of from_version and must
+    return the data with its 'version' set to the next version.
+
+    Args:
+        from_version: Save file version the migration upgrades
+    """
+    def decorator(func: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        SAVE_MIGRATIONS[from_version] = func
+        return func
+    return decorator
+
+@register_migration("1.0.0")
+def _add_puzzle_states(save_data: Dict[str, Any]) -> Dict[str, Any]:
+    """1.1.0 saves carry puzzle states; older saves start with none."""
+    save_data.setdefault('puzzle_states', {})
+    save_data['version'] = "1.1.0"
+    return save_data
+
+def migrate_save_data(save_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Upgrade save data to config.SAVE_FILE_VERSION.
+
+    Args:
+        save_data: Save data of any known version
+
+    Returns:
+        Dict containing the upgraded save data
+
+    Raises:
+        ValueError: If no migration path exists for the save's version
+    """
+    version = save_data.get('version', "1.0.0")
+    save_data['version'] = version
+
+    while version != config.SAVE_FILE_VERSION:
+        migration = SAVE_MIGRATIONS.get(version)
+        if not migration:
+            raise ValueError(f"No migration from save version {version}")
+        save_data = migration(save_data)
+        logger.info(f"Migrated save {save_data.get('save_name')} from {version} to {save_data['version']}")
+        version = save_data['version']
+
+    return save_data
+
+def iter_save_files(save_dir: Path, pattern: str = "*") -> Iterator[Path]:
+    """
+    Iterate over save checkpoint files of every format.
+
+    Args:
+        save_dir: Directory containing saves
+        pattern: Glob pattern for the save name
+
+    Yields:
+        Path of each save file
+    """
+    for suffix in SAVE_SUFFIXES.values():
+        yield from Path(save_dir).glob(f"{pattern}{suffix}")
+
+def find_save_file(save_dir: Path, save_name: str) -> Optional[Path]:
+    """
+    Find the checkpoint file of a save in any format.
+
+    Args:
+        save_dir: Directory containing saves
+        save_name: Name of the save
+
+    Returns:
+        Path of the save file, or None if it does not exist
+    """
+    for suffix in SAVE_SUFFIXES.values():
+        file_path = Path(save_dir) / f"{save_name}{suffix}"
+        if file_path.exists():
+            return file_path
+    return None
+
+def encode_save(save_data: Dict[str, Any], save_format: str = config.SAVE_FORMAT) -> bytes:
+    """
+    Serialize save data in the given format behind a save header.
+
+    Args:
+        save_data: Save data to serialize
+        save_format: "json" or "binary"
+
+    Returns:
+        bytes: Serialized save
+
+    Header fields longer than their slot are cut short at a character
+    boundary; the payload always keeps the full values.
+    """
+    if save_format == "binary":
+        payload = _encode_binary(save_data)
+    else:
+        payload = json.dumps(save_data, indent=2).encode('utf-8')
+
+    fields = []
+    for key, size in zip(HEADER_FIELDS, (96, 32, 64, 16)):
+        raw = str(save_data.get(key) or "").encode('utf-8')
+        if len(raw) > size:
+            # Drop any partial character left at the cut
+            raw = raw[:size].decode('utf-8', errors='ignore').encode('utf-8')
+        fields.append(raw)
+
+    header = SAVE_HEADER.pack(SAVE_MAGIC, SAVE_LAYOUT_VERSION, PAYLOAD_ENCODINGS[save_format],
+                              len(payload), zlib.crc32(payload), *fields)
+    return header + payload
+
+def decode_save(data: bytes) -> Dict[str, Any]:
+    """
+    Deserialize a save written by encode_save(), detecting its format.
+
+    Args:
+        data: Serialized save
+
+    Returns:
+        Dict containing the save data
+
+    Raises:
+        ValueError: If the save is truncated or fails its checksum
+    """
+    if not data.startswith(SAVE_MAGIC):
+        # Plain JSON save from before save headers
+        return json.loads(data.decode('utf-8'))
+    if data[len(SAVE_MAGIC)] == LEGACY_BINARY_LAYOUT_VERSION:
+        return _decode_legacy_binary(data)
+
+    header = parse_save_header(data[:SAVE_HEADER.size])
+    payload = memoryview(data)[SAVE_HEADER.size:]
+    if len(payload) != header['payload_length']:
+        raise ValueError("Save is truncated")
+    if zlib.crc32(payload) != header['checksum']:
+        raise ValueError("Save checksum mismatch")
+
+    if header['encoding'] == PAYLOAD_ENCODINGS["binary"]:
+        return _decode_binary(payload)
+    return json.loads(bytes(payload).decode('utf-8'))
+
+def parse_save_header(data: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parse the fixed-size header at the start of a save.
+
+    Args:
+        data: At least the first SAVE_HEADER.size bytes of a save
+
+    Returns:
+        Dict with the HEADER_FIELDS metadata plus encoding, payload_length
+        and checksum, or None if the save has no header
+    """
+    if len(data) < SAVE_HEADER.size or not data.startswith(SAVE_MAGIC):
+        return None
+    magic, layout, encoding, payload_length, checksum, *fields = SAVE_HEADER.unpack_from(data)
+    if layout != SAVE_LAYOUT_VERSION:
+        return None
+
+    header = {key: raw.rstrip(b"\0").decode('utf-8') or None
+              for key, raw in zip(HEADER_FIELDS, fields)}
+    header.update(encoding=encoding, payload_length=payload_length, checksum=checksum)
+    return header
+
+def write_file_atomic(file_path: Path, data: bytes, durable: bool = True) -> None:
+    """
+    Replace a file so readers see either the old or the new contents.
+
+    The data goes to a temporary file in the same directory which is then
+    renamed over the target. A crash mid-write leaves only a stray
+    temporary file, never a truncated save.
+
+    Args:
+        file_path: File to write
+        data: New file contents
+        durable: fsync the data and the directory entry before returning
+    """
+    file_path = Path(file_path)
+    fd, temp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_name, file_path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+    if durable:
+        sync_directory(file_path.parent)
+
+def sync_directory(directory: Path) -> None:
+    """fsync a directory so renames and new entries in it survive a crash."""
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def read_save_file(file_path: Path) -> Dict[str, Any]:
+    """
+    Read and deserialize a save checkpoint.
+
+    Raises:
+        ValueError: If the save is truncated or fails its checksum
+    """
+    with open(file_path, 'rb') as f:
+        header = parse_save_header(f.read(SAVE_HEADER.size))
+        # A truncated save is rejected before its payload is read
+        if header and os.fstat(f.fileno()).st_size != SAVE_HEADER.size + header['payload_length']:
+            raise ValueError(f"Save file is truncated: {file_path}")
+        f.seek(0)
+        return decode_save(f.read())
+
+def read_save_header(file_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read only the header of a save, with a single read() call.
+
+    Args:
+        file_path: Path of a save checkpoint
+
+    Returns:
+        Dict from parse_save_header(), or None for saves without a header
+    """
+    with open(file_path, 'rb') as f:
+        return parse_save_header(f.read(SAVE_HEADER.size))
+
+def _encode_binary(save_data: Dict[str, Any]) -> bytes:
+    """
+    Encode save data as a string table, flag bits and values.
+
+    Every string (location and item IDs, keys) is stored once in the string
+    table and referenced by index. Boolean game state flags named in
+    FLAG_KEYS are packed eight to a byte.
+    """
+    body = dict(save_data)
+    game_state = dict(body.get('game_state', {}))
+    present = bytearray((len(FLAG_KEYS) + 7) // 8)
+    values = bytearray(len(present))
+    for index, key in enumerate(FLAG_KEYS):
+        if isinstance(game_state.get(key), bool):
+            present[index // 8] |= 1 << (index % 8)
+            if game_state.pop(key):
+                values[index // 8] |= 1 << (index % 8)
+    body['game_state'] = game_state
+
+    strings: Dict[str, int] = {}
+    # Flag names are stored so bit positions survive config changes
+    flag_refs = [strings.setdefault(key, len(strings)) for key in FLAG_KEYS]
+    encoded_body = bytearray()
+    _encode_value(body, encoded_body, strings)
+
+    payload = bytearray()
+    _write_varint(payload, len(strings))
+    for text in strings:
+        raw = text.encode('utf-8')
+        _write_varint(payload, len(raw))
+        payload += raw
+    _write_varint(payload, len(flag_refs))
+    for ref in flag_refs:
+        _write_varint(payload, ref)
+    payload += present + values + encoded_body
+    return bytes(payload)
+
+def _decode_legacy_binary(data: bytes) -> Dict[str, Any]:
+    """Decode a layout 1 binary save, which had its own variable-size header."""
+    _, _, meta_length, payload_length = LEGACY_BINARY_HEADER.unpack_from(data)
+    offset = LEGACY_BINARY_HEADER.size + meta_length
+    payload = memoryview(data)[offset:offset + payload_length]
+    if len(payload) != payload_length:
+        raise ValueError("Binary save is truncated")
+    return _decode_binary(payload)
+
+def _decode_binary(payload: memoryview) -> Dict[str, Any]:
+    """Decode a payload written by _encode_binary()."""
+    position = 0
+    strings: List[str] = []
+    count, position = _read_varint(payload, position)
+    for _ in range(count):
+        length, position = _read_varint(payload, position)
+        strings.append(bytes(payload[position:position + length]).decode('utf-8'))
+        position += length
+
+    flag_keys = []
+    count, position = _read_varint(payload, position)
+    for _ in range(count):
+        ref, position = _read_varint(payload, position)
+        flag_keys.append(strings[ref])
+    flag_bytes = (len(flag_keys) + 7) // 8
+    present = payload[position:position + flag_bytes]
+    values = payload[position + flag_bytes:position + 2 * flag_bytes]
+    position += 2 * flag_bytes
+
+    save_data, _ = _decode_value(payload, position, strings)
+    game_state = save_data.setdefault('game_state', {})
+    for index, key in enumerate(flag_keys):
+        if present[index // 8] & (1 << (index % 8)):
+            game_state[key] = bool(values[index // 8] & (1 << (index % 8)))
+    return save_data
+
+def _encode_value(value: Any, out: bytearray, strings: Dict[str, int]) -> None:
+    """Append a tagged value, interning strings into the table."""
+    if value is None:
+        out.append(_TAG_NONE)
+    elif value is True:
+        out.append(_TAG_TRUE)
+    elif value is False:
+        out.append(_TAG_FALSE)
+    elif isinstance(value, int):
+        out.append(_TAG_INT)
+        _write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)  # zigzag
+    elif isinstance(value, float):
+        out.append(_TAG_FLOAT)
+        out += struct.pack("<d", value)
+    elif isinstance(value, str):
+        out.append(_TAG_STR)
+        _write_varint(out, strings.setdefault(value, len(strings)))
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        out.append(_TAG_LIST)
+        _write_varint(out, len(value))
+        for item in value:
+            _encode_value(item, out, strings)
+    elif isinstance(value, dict):
+        out.append(_TAG_DICT)
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            _write_varint(out, strings.setdefault(str(key), len(strings)))
+            _encode_value(item, out, strings)
+    else:
+        raise TypeError(f"Cannot encode {type(value).__name__} in a binary save")
+
+def _decode_value(data: memoryview, position: int, strings: List[str]):
+    """Read a tagged value, returning it and the next position."""
+    tag = data[position]
+    position += 1
+    if tag == _TAG_NONE:
+        return None, position
+    if tag == _TAG_TRUE:
+        return True, position
+    if tag == _TAG_FALSE:
+        return False, position
+    if tag == _TAG_INT:
+        raw, position = _read_varint(data, position)
+        return (raw >> 1) ^ -(raw & 1), position
+    if tag == _TAG_FLOAT:
+        return struct.unpack_from("<d", data, position)[0], position + 8
+    if tag == _TAG_STR:
+        index, position = _read_varint(data, position)
+        return strings[index], position
+    if tag == _TAG_LIST:
+        count, position = _read_varint(data, position)
+        items = []
+        for _ in range(count):
+            item, position = _decode_value(data, position, strings)
+            items.append(item)
+        return items, position
+    if tag == _TAG_DICT:
+        count, position = _read_varint(data, position)
+        result = {}
+        for _ in range(count):
+            index, position = _read_varint(data, position)
+            result[strings[index]], position = _decode_value(data, position, strings)
+        return result, position
+    raise ValueError(f"Unknown value tag {tag} in binary save")
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 integer."""
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+def _read_varint(data: memoryview, position: int):
+    """Read an unsigned LEB128 integer, returning it and the next position."""
+    result = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
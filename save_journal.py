@@ -0,0 +1,194 @@
+from typing import Dict, Any, Set, Tuple
+from pathlib import Path
+import copy
+import json
+import logging
+import os
+import config
+
+# Save sections whose keys are diffed individually
+DIFFED_SECTIONS = ('game_state', 'location_states', 'inventory_state', 'puzzle_states')
+
+# Marks keys absent from the previous snapshot
+_MISSING = object()
+
+def compute_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the changes between two save snapshots.
+
+    Top-level values are replaced wholesale, except for the sections in
+    DIFFED_SECTIONS which record only the keys that changed.
+
+    Args:
+        old: Previous snapshot
+        new: Current snapshot
+
+    Returns:
+        Dict with 'replace', 'update' and 'remove' entries
+    """
+    delta: Dict[str, Any] = {'replace': {}, 'update': {}, 'remove': {}}
+
+    for key, value in new.items():
+        old_value = old.get(key)
+        if key in DIFFED_SECTIONS and isinstance(value, dict) and isinstance(old_value, dict):
+            changed = {k: v for k, v in value.items() if old_value.get(k, _MISSING) != v}
+            removed = [k for k in old_value if k not in value]
+            if changed:
+                delta['update'][key] = changed
+            if removed:
+                delta['remove'][key] = removed
+        elif key not in old or old_value != value:
+            delta['replace'][key] = value
+
+    return {kind: changes for kind, changes in delta.items() if changes}
+
+def apply_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """
+    Apply a delta from compute_delta() to a snapshot in place.
+
+    Args:
+        state: Snapshot to update
+        delta: Changes to apply
+    """
+    state.update(delta.get('replace', {}))
+    for section, changes in delta.get('update', {}).items():
+        state.setdefault(section, {}).update(changes)
+    for section, keys in delta.get('remove', {}).items():
+        for key in keys:
+            state.get(section, {}).pop(key, None)
+
+class SaveJournal:
+    """
+    Append-only journals of save changes.
+
+    A save is a full checkpoint (<name>.json) plus an optional journal
+    (<name>.journal) with one JSON line per later save of the same name,
+    each holding only what changed. After compact_every entries the next
+    save writes a fresh checkpoint and the journal starts over.
+    """
+
+    def __init__(self, save_dir: Path,
+                 compact_every: int = config.SAVE_JOURNAL_COMPACT_EVERY):
+        self.save_dir = Path(save_dir)
+        self.compact_every = compact_every
+        self.logger = logging.getLogger(__name__)
+        # save name -> (latest snapshot, journal entry count)
+        self._heads: Dict[str, Tuple[Dict[str, Any], int]] = {}
+        # Journals appended to without an fsync yet
+        self._unsynced: Set[Path] = set()
+
+    def journal_path(self, save_name: str) -> Path:
+        """Get the journal file path for a save."""
+        return self.save_dir / f"{save_name}.journal"
+
+    def can_append(self, save_name: str) -> bool:
+        """
+        Check whether the next save of this name can go to the journal.
+
+        Args:
+            save_name: Name of the save
+
+        Returns:
+            bool: True if a checkpoint is known and compaction is not due
+        """
+        head = self._heads.get(save_name)
+        return head is not None and head[1] < self.compact_every
+
+    def append(self, save_data: Dict[str, Any], durable: bool = True) -> int:
+        """
+        Append the changes since the last save of this name.
+
+        Args:
+            save_data: New snapshot; can_append() must be True for its name
+            durable: fsync the journal now instead of on the next sync()
+
+        Returns:
+            int: Number of bytes written to the journal
+        """
+        save_name = save_data['save_name']
+        previous, count = self._heads[save_name]
+        line = json.dumps(compute_delta(previous, save_data), separators=(',', ':')) + '\n'
+
+        journal_path = self.journal_path(save_name)
+        with open(journal_path, 'a') as f:
+            f.write(line)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        if not durable:
+            self._unsynced.add(journal_path)
+
+        self._heads[save_name] = (save_data, count + 1)
+        return len(line)
+
+    def sync(self) -> None:
+        """fsync every journal appended to with durable=False."""
+        while self._unsynced:
+            journal_path = self._unsynced.pop()
+            try:
+                with open(journal_path, 'rb') as f:
+                    os.fsync(f.fileno())
+            except FileNotFoundError:
+                # Compacted or deleted since the append
+                continue
+
+    def start(self, save_data: Dict[str, Any]) -> None:
+        """
+        Begin a new journal after a checkpoint was written.
+
+        Args:
+            save_data: The snapshot written as the checkpoint
+        """
+        save_name = save_data['save_name']
+        self.journal_path(save_name).unlink(missing_ok=True)
+        self._heads[save_name] = (save_data, 0)
+
+    def replay(self, save_name: str, save_data: Dict[str, Any],
+               track: bool = True) -> Dict[str, Any]:
+        """
+        Apply a save's journal on top of its checkpoint.
+
+        Args:
+            save_name: Name of the save
+            save_data: Checkpoint data
+            track: Whether later saves of this name may append to the journal
+
+        Returns:
+            Dict containing the latest save data
+        """
+        state = copy.deepcopy(save_data)
+        count = 0
+        torn = False
+
+        journal_path = self.journal_path(save_name)
+        if journal_path.exists():
+            with open(journal_path, 'r') as f:
+                for line_number, line in enumerate(f, 1):
+                    try:
+                        apply_delta(state, json.loads(line))
+                        count += 1
+                    except json.JSONDecodeError:
+                        # A torn final line from an interrupted write
+                        self.logger.warning(
+                            f"Ignoring unreadable journal entry {line_number} in {journal_path}"
+                        )
+                        torn = True
+                        break
+
+        if track:
+            # Never append after a torn entry; compact on the next save instead
+            self._heads[save_name] = (
+                copy.deepcopy(state),
+                self.compact_every if torn else count
+            )
+        return state
+
+    def discard(self, save_name: str) -> None:
+        """
+        Remove a save's journal and forget its state.
+
+        Args:
+            save_name: Name of the save being deleted
+        """
+        self._heads.pop(save_name, None)
+        self.journal_path(save_name).unlink(missing_ok=True)
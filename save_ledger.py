@@ -0,0 +1,89 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+import config
+
+class SizeLedger:
+    """
+    Running totals of the disk space used by each save.
+
+    Writes and deletes update the ledger as they happen, so checking the
+    save quotas needs no directory scan. The ledger is rebuilt from disk
+    on first use and again after every reconcile_every updates, which
+    picks up saves changed outside of the game.
+    """
+
+    def __init__(self, reconcile_every: int = config.SAVE_LEDGER_RECONCILE_EVERY):
+        self.reconcile_every = reconcile_every
+        self.logger = logging.getLogger(__name__)
+        # save name -> (bytes on disk, mtime)
+        self._entries: Optional[Dict[str, Tuple[int, float]]] = None
+        self._updates = 0
+
+    def needs_reconcile(self) -> bool:
+        """Check whether the ledger should be rebuilt from disk."""
+        return self._entries is None or self._updates >= self.reconcile_every
+
+    def reset(self, entries: Iterable[Tuple[str, int, float]]) -> None:
+        """
+        Replace the ledger with sizes measured on disk.
+
+        Args:
+            entries: (save name, bytes, mtime) for every save
+        """
+        self._entries = {name: (size, mtime) for name, size, mtime in entries}
+        self._updates = 0
+        self.logger.info(f"Reconciled save size ledger: {self.usage()} bytes in {len(self._entries)} saves")
+
+    def record(self, save_name: str, size: int, mtime: float) -> None:
+        """
+        Set the size of a save that was just written.
+
+        Args:
+            save_name: Name of the save
+            size: Bytes the save uses on disk
+            mtime: Modification time of the save
+        """
+        if self._entries is None:
+            return
+        self._entries[save_name] = (size, mtime)
+        self._updates += 1
+
+    def remove(self, save_name: str) -> None:
+        """
+        Drop a deleted save.
+
+        Args:
+            save_name: Name of the save
+        """
+        if self._entries is None:
+            return
+        self._entries.pop(save_name, None)
+        self._updates += 1
+
+    def usage(self, prefix: str = "") -> int:
+        """
+        Get the bytes used by saves whose names start with prefix.
+
+        Args:
+            prefix: Save name prefix, "" for all saves
+
+        Returns:
+            int: Total bytes
+        """
+        return sum(size for name, (size, _) in (self._entries or {}).items()
+                   if name.startswith(prefix))
+
+    def oldest_first(self, prefix: str = "") -> List[str]:
+        """
+        List saves whose names start with prefix, oldest first.
+
+        Args:
+            prefix: Save name prefix, "" for all saves
+
+        Returns:
+            List of save names
+        """
+        return sorted(
+            (name for name in (self._entries or {}) if name.startswith(prefix)),
+            key=lambda name: self._entries[name][1]
+        )
@@ -0,0 +1,167 @@
+from typing import Callable, Dict, List, Optional, Any
+from pathlib import Path
+import json
+import logging
+from contextlib import contextmanager
+import config
+from save_format import iter_save_files, read_save_file, write_file_atomic
+
+class SaveManifest:
+    """
+    Persistent index of the save directory.
+
+    Keeps the metadata shown by the save listing (name, date, location) in a
+    single manifest file so listing saves does not have to parse every save.
+    The manifest records the directory mtime it was built against; if the
+    directory changed behind our back the index is reconciled against disk.
+    It lives in a subdirectory and is replaced atomically, so rewriting it
+    neither leaves a torn file nor changes the save directory's mtime.
+    """
+
+    def __init__(self, save_dir: Path, filename: str = config.SAVE_MANIFEST_FILE,
+                 loader: Optional[Callable[[Path], Dict[str, Any]]] = None):
+        self.save_dir = Path(save_dir)
+        self.manifest_path = self.save_dir / filename
+        # Reads a save file when the manifest has to be rebuilt
+        self.loader = loader or read_save_file
+        self.logger = logging.getLogger(__name__)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dir_mtime_ns: Optional[int] = None
+
+    def list_entries(self) -> List[Dict[str, Any]]:
+        """
+        Get metadata for all saves, newest first.
+
+        Returns:
+            List of dictionaries with name, date, location and file_path
+        """
+        try:
+            self._ensure_current()
+        except Exception as e:
+            self.logger.error(f"Error validating save manifest: {e}")
+            self.rebuild()
+
+        return sorted(
+            ({key: entry[key] for key in ('name', 'date', 'location', 'file_path')}
+             for entry in self._entries.values()),
+            key=lambda x: x['date'],
+            reverse=True
+        )
+
+    @contextmanager
+    def updating(self):
+        """
+        Context manager wrapping changes to the save directory.
+
+        The manifest is validated before the caller touches any files and
+        written once afterwards, so our own changes do not look like
+        outside modifications and never trigger a rescan.
+
+        Yields:
+            The manifest, for record() and remove() calls
+        """
+        try:
+            self._ensure_current()
+        except Exception as e:
+            self.logger.error(f"Error validating save manifest: {e}")
+            self.rebuild()
+
+        try:
+            yield self
+        except Exception:
+            # Directory state is unknown now, reconcile on next access
+            self._dir_mtime_ns = None
+            raise
+
+        try:
+            self._write()
+        except Exception as e:
+            self.logger.error(f"Error writing save manifest: {e}")
+            self._dir_mtime_ns = None
+
+    def record(self, save_data: Dict[str, Any], file_path: Path) -> None:
+        """
+        Add or replace the entry for a save that was just written.
+        Must be called inside updating().
+
+        Args:
+            save_data: The save data that was written
+            file_path: Path of the written save file
+        """
+        self._entries[file_path.stem] = self._make_entry(save_data, file_path)
+
+    def remove(self, save_name: str) -> None:
+        """
+        Drop the entry for a deleted save. Must be called inside updating().
+
+        Args:
+            save_name: Name of the save that was removed
+        """
+        self._entries.pop(save_name, None)
+
+    def rebuild(self) -> None:
+        """Reconcile the manifest with the save files actually on disk."""
+        try:
+            entries = {}
+            for save_file in iter_save_files(self.save_dir):
+                try:
+                    stat = save_file.stat()
+                    known = self._entries.get(save_file.stem)
+                    if (known and known['size'] == stat.st_size
+                            and known['mtime_ns'] == stat.st_mtime_ns):
+                        entries[save_file.stem] = known
+                        continue
+
+                    save_data = self.loader(save_file)
+                    entries[save_file.stem] = self._make_entry(save_data, save_file)
+                except Exception as e:
+                    self.logger.warning(f"Error reading save file {save_file}: {e}")
+
+            self._entries = entries
+            self._write()
+            self.logger.info(f"Rebuilt save manifest with {len(entries)} entries")
+        except Exception as e:
+            self.logger.error(f"Error rebuilding save manifest: {e}")
+
+    def _ensure_current(self) -> None:
+        """Make sure the in-memory entries match the save directory."""
+        dir_mtime = self.save_dir.stat().st_mtime_ns
+        if self._dir_mtime_ns == dir_mtime:
+            return
+
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r') as f:
+                data = json.load(f)
+            self._entries = data.get('entries', {})
+            if data.get('dir_mtime_ns') == dir_mtime:
+                self._dir_mtime_ns = dir_mtime
+                return
+
+        self.rebuild()
+
+    def _write(self) -> None:
+        """Persist the manifest and remember the directory state it matches."""
+        # Create the manifest's directory before sampling the save directory
+        # mtime; replacing the file inside it leaves that mtime alone.
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self._dir_mtime_ns = self.save_dir.stat().st_mtime_ns
+
+        data = json.dumps({
+            'dir_mtime_ns': self._dir_mtime_ns,
+            'entries': self._entries
+        })
+        # Not flushed: a lost manifest is rebuilt from the saves themselves
+        write_file_atomic(self.manifest_path, data.encode('utf-8'), durable=False)
+
+    @staticmethod
+    def _make_entry(save_data: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+        """Build a manifest entry from save data and its file."""
+        stat = file_path.stat()
+        return {
+            'name': save_data['save_name'],
+            'date': save_data['save_date'],
+            'location': save_data['current_location'],
+            'file_path': str(file_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns
+        }
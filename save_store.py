@@ -0,0 +1,225 @@
+from typing import Any, Dict, Iterable, List, Optional
+from pathlib import Path
+import hashlib
+import json
+import logging
+import zlib
+import config
+from save_format import write_file_atomic
+
+# Save sections stored as shared blobs
+BLOB_SECTIONS = ('game_state', 'location_states', 'inventory_state', 'puzzle_states')
+
+# Marks a save file that refers to blobs instead of holding its sections
+BLOB_MANIFEST_FORMAT = "blobs"
+
+class BlobStore:
+    """
+    Content-addressed storage for save sections.
+
+    Each section is serialized canonically and stored once under its
+    SHA-256 hash, so identical sections across autosaves share one file.
+    Save files become small manifests listing section hashes. Blobs are
+    reference counted; unreferenced blobs are removed by collect_garbage().
+    """
+
+    def __init__(self, save_dir: Path, dirname: str = config.SAVE_BLOB_DIR):
+        self.root = Path(save_dir) / dirname
+        self.refs_path = self.root / "refs.json"
+        self.logger = logging.getLogger(__name__)
+        self._refs: Dict[str, int] = {}
+        self._refs_loaded = False
+        # Blobs exist but their counts couldn't be read; until reset_refs()
+        # recounts them, any blob may still be in use
+        self._refs_lost = False
+        # Running total of blob bytes, measured on first use
+        self._total_size: Optional[int] = None
+        # Whether a blob may have lost its last reference since the last collection
+        self._garbage_possible = True
+
+    @staticmethod
+    def is_manifest(save_data: Dict[str, Any]) -> bool:
+        """Check whether save data is a blob manifest."""
+        return save_data.get('format') == BLOB_MANIFEST_FORMAT
+
+    def store(self, save_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store the sections of a save and build its manifest.
+
+        Args:
+            save_data: Full save data
+
+        Returns:
+            Dict containing the manifest to write as the save file
+        """
+        # Counts are read before any new blob lands next to them
+        self._ensure_refs()
+        manifest = {key: value for key, value in save_data.items()
+                    if key not in BLOB_SECTIONS}
+        manifest['format'] = BLOB_MANIFEST_FORMAT
+        manifest['sections'] = {}
+
+        for section in BLOB_SECTIONS:
+            if section in save_data:
+                manifest['sections'][section] = self._put(save_data[section])
+
+        self._add_refs(manifest['sections'].values())
+        return manifest
+
+    def load(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Rebuild full save data from a manifest.
+
+        Args:
+            manifest: Manifest written by store()
+
+        Returns:
+            Dict containing the full save data
+        """
+        save_data = {key: value for key, value in manifest.items()
+                     if key not in ('format', 'sections')}
+        for section, digest in manifest['sections'].items():
+            with open(self._blob_path(digest), 'rb') as f:
+                save_data[section] = json.loads(zlib.decompress(f.read()))
+        return save_data
+
+    def release(self, manifest: Dict[str, Any]) -> int:
+        """
+        Drop the references held by a manifest that is being removed.
+
+        Args:
+            manifest: Manifest of the deleted save
+
+        Returns:
+            int: Bytes that garbage collection will free as a result
+        """
+        self._ensure_refs()
+        freeable = 0
+        for digest in manifest.get('sections', {}).values():
+            count = self._refs.get(digest, 0) - 1
+            if count > 0:
+                self._refs[digest] = count
+                continue
+            self._refs.pop(digest, None)
+            self._garbage_possible = True
+            try:
+                freeable += self._blob_path(digest).stat().st_size
+            except OSError:
+                pass
+        self._write_refs()
+        return freeable
+
+    def collect_garbage(self) -> int:
+        """
+        Delete blobs that no save refers to.
+
+        Returns:
+            int: Number of bytes freed
+        """
+        if not self._garbage_possible:
+            return 0
+        self._ensure_refs()
+        if self._refs_lost:
+            self.logger.warning("Skipping blob garbage collection until references are recounted")
+            return 0
+        self._garbage_possible = False
+        freed = 0
+        for blob in self._iter_blobs():
+            if self._refs.get(blob.name, 0) > 0:
+                continue
+            try:
+                size = blob.stat().st_size
+                blob.unlink()
+                freed += size
+                if self._total_size is not None:
+                    self._total_size -= size
+            except OSError as e:
+                self.logger.warning(f"Failed to remove unreferenced blob {blob}: {e}")
+        if freed:
+            self.logger.info(f"Blob garbage collection freed {freed} bytes")
+        return freed
+
+    def reset_refs(self, manifests: Iterable[Dict[str, Any]]) -> None:
+        """
+        Recount references from all manifests on disk.
+
+        Args:
+            manifests: Every blob manifest currently in the save directory
+        """
+        refs: Dict[str, int] = {}
+        for manifest in manifests:
+            for digest in manifest.get('sections', {}).values():
+                refs[digest] = refs.get(digest, 0) + 1
+        self._refs = refs
+        self._refs_loaded = True
+        self._refs_lost = False
+        self._garbage_possible = True
+        self._write_refs()
+
+    def needs_reconcile(self) -> bool:
+        """Check whether blobs exist but their reference counts were lost."""
+        self._ensure_refs()
+        return self._refs_lost
+
+    def total_size(self) -> int:
+        """Get the total size of all stored blobs in bytes."""
+        if self._total_size is None:
+            self.measure()
+        return self._total_size
+
+    def measure(self) -> int:
+        """Recompute the total size of all stored blobs from disk."""
+        self._total_size = sum(blob.stat().st_size for blob in self._iter_blobs())
+        return self._total_size
+
+    def _put(self, section: Any) -> str:
+        """Store one section and return its hash."""
+        canonical = json.dumps(section, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(canonical).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            # Saves will refer to this blob, so it must be complete on disk
+            data = zlib.compress(canonical)
+            write_file_atomic(blob_path, data, config.SAVE_FSYNC)
+            if self._total_size is not None:
+                self._total_size += len(data)
+        return digest
+
+    def _add_refs(self, digests: Iterable[str]) -> None:
+        """Count new references to blobs."""
+        self._ensure_refs()
+        for digest in digests:
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+        self._write_refs()
+
+    def _blob_path(self, digest: str) -> Path:
+        """Get the path of a blob, fanned out by hash prefix."""
+        return self.root / digest[:2] / digest
+
+    def _iter_blobs(self) -> List[Path]:
+        """List all blob files on disk."""
+        if not self.root.exists():
+            return []
+        return [path for path in self.root.glob("??/*") if path.is_file()]
+
+    def _ensure_refs(self) -> None:
+        """Load the reference counts on first use."""
+        if self._refs_loaded:
+            return
+        try:
+            if self.refs_path.exists():
+                with open(self.refs_path, 'r') as f:
+                    self._refs = json.load(f)
+            else:
+                self._refs_lost = bool(self._iter_blobs())
+        except Exception as e:
+            self.logger.error(f"Error reading blob reference counts: {e}")
+            self._refs = {}
+            self._refs_lost = True
+        self._refs_loaded = True
+
+    def _write_refs(self) -> None:
+        """Persist the reference counts, replacing the old file in one step."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        write_file_atomic(self.refs_path, json.dumps(self._refs).encode('utf-8'), config.SAVE_FSYNC)
@@ -0,0 +1,108 @@
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+from types import MappingProxyType
+
+class SpellingIndex:
+    """
+    Typo-tolerant lookup over a fixed set of names.
+
+    Uses the symmetric delete method: every name is stored under each
+    string obtained by deleting up to max_distance of its letters. A
+    misspelling is looked up by generating its own deletes, so finding
+    candidates costs a handful of dict lookups that depend on the length
+    of the word, not on how many names are indexed. Candidates are then
+    checked with a real edit distance.
+    """
+
+    def __init__(self, names: Iterable[str], max_distance: int = 2):
+        """
+        Args:
+            names: Every name that can be matched
+            max_distance: Most typos (insertions, deletions, substitutions
+                or swapped neighbours) corrected in a long name
+        """
+        self.max_distance = max_distance
+        self.names = frozenset(names)
+        deletes: Dict[str, List[str]] = {}
+        for name in self.names:
+            for variant in _deletes(name, max_distance):
+                deletes.setdefault(variant, []).append(name)
+        self._deletes = MappingProxyType({variant: tuple(found) for variant, found in deletes.items()})
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.names
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def allowed_distance(self, word: str) -> int:
+        """Get how many typos to accept in a word; short words get fewer."""
+        if len(word) <= 2:
+            return 0
+        if len(word) <= 5:
+            return min(1, self.max_distance)
+        return self.max_distance
+
+    def lookup(self, word: str) -> List[Tuple[str, int]]:
+        """
+        Find the names a word could be a misspelling of.
+
+        Args:
+            word: The word as typed
+
+        Returns:
+            List of (name, edit distance), closest first
+        """
+        if word in self.names:
+            return [(word, 0)]
+        limit = self.allowed_distance(word)
+        if not limit:
+            return []
+        seen: Set[str] = set()
+        matches: List[Tuple[str, int]] = []
+        for variant in _deletes(word, limit):
+            for name in self._deletes.get(variant, ()):
+                if name in seen:
+                    continue
+                seen.add(name)
+                distance = edit_distance(word, name)
+                if distance <= limit:
+                    matches.append((name, distance))
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+def _deletes(word: str, max_distance: int) -> Iterator[str]:
+    """Yield the word and every string made by deleting up to max_distance letters."""
+    seen = {word}
+    level = [word]
+    yield word
+    for _ in range(max_distance):
+        next_level = []
+        for current in level:
+            for i in range(len(current)):
+                variant = current[:i] + current[i + 1:]
+                if variant not in seen:
+                    seen.add(variant)
+                    next_level.append(variant)
+                    yield variant
+        level = next_level
+
+def edit_distance(first: str, second: str) -> int:
+    """
+    Count the edits turning one string into another.
+
+    Edits are inserting, deleting or replacing a letter, or swapping two
+    neighbouring letters (optimal string alignment distance).
+    """
+    if first == second:
+        return 0
+    previous_row = None
+    row = list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        before, previous_row, row = previous_row, row, [i] + [0] * len(second)
+        for j in range(1, len(second) + 1):
+            cost = first[i - 1] != second[j - 1]
+            row[j] = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+            if (i > 1 and j > 1 and first[i - 1] == second[j - 2]
+                    and first[i - 2] == second[j - 1]):
+                row[j] = min(row[j], before[j - 2] + 1)
+    return row[-1]
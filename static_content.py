@@ -0,0 +1,33 @@
+from typing import Any, Mapping
+from types import MappingProxyType
+import sys
+import config
+
+def freeze(value: Any) -> Any:
+    """
+    Build a deeply read-only copy of static game content.
+
+    Dicts become read-only mappings, lists and tuples become tuples, sets
+    become frozensets and strings are interned, so every structure built
+    from the same text shares its strings.
+
+    Args:
+        value: Content to freeze
+
+    Returns:
+        The frozen content
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({freeze(key): freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+# Shared by every game in the process; built once when first imported
+LOCATIONS: Mapping[str, Mapping[str, Any]] = freeze(config.LOCATIONS)
+ITEM_DESCRIPTIONS: Mapping[str, Mapping[str, Any]] = freeze(config.ITEM_DESCRIPTIONS)
+ITEM_COMBINATIONS: Mapping[frozenset, Mapping[str, Any]] = freeze(config.ITEM_COMBINATIONS)
@@ -0,0 +1,98 @@
+from typing import Optional, TextIO
+import logging
+import os
+import sys
+
+# ANSI control sequences
+CLEAR_SCREEN = "\x1b[2J"
+CURSOR_HOME = "\x1b[H"
+CLEAR_LINE = "\x1b[2K\r"
+
+class Terminal:
+    """
+    Terminal control for one output stream.
+
+    Clears the screen and positions the cursor by writing ANSI escape
+    sequences to the stream itself, so each game session controls its
+    own terminal and no shell is spawned. Streams without ANSI support
+    fall back to the system clear command (for the process's own
+    terminal) or to scrolling the old text away with blank lines.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, ansi: Optional[bool] = None):
+        """
+        Args:
+            stream: Output stream, defaults to sys.stdout
+            ansi: Whether the stream understands ANSI escapes, detected if None
+        """
+        self.stream = stream or sys.stdout
+        self.logger = logging.getLogger(__name__)
+        self.ansi = self._detect_ansi() if ansi is None else ansi
+
+    def clear_screen(self) -> None:
+        """Clear the screen and move the cursor to the top left."""
+        if self.ansi:
+            self.stream.write(CLEAR_SCREEN + CURSOR_HOME)
+            self.stream.flush()
+        elif 'idlelib.run' in sys.modules or not self._is_process_stdout():
+            # IDLE and remote sessions cannot be cleared, only scrolled
+            self.stream.write("\n" * 100)
+            self.stream.flush()
+        else:
+            # Earlier output must reach the terminal before it is cleared
+            self.stream.flush()
+            os.system('cls' if os.name == 'nt' else 'clear')
+
+    def move_cursor(self, row: int, column: int) -> None:
+        """
+        Move the cursor to a 1-based screen position.
+
+        Args:
+            row: Screen row
+            column: Screen column
+        """
+        if self.ansi:
+            self.stream.write(f"\x1b[{row};{column}H")
+            self.stream.flush()
+
+    def clear_line(self) -> None:
+        """Erase the current line and return the cursor to its start."""
+        self.stream.write(CLEAR_LINE if self.ansi else "\r")
+        self.stream.flush()
+
+    def _is_process_stdout(self) -> bool:
+        """Whether the stream is this process's own terminal output."""
+        is_process_stdout = getattr(self.stream, 'is_process_stdout', None)
+        if is_process_stdout:
+            return is_process_stdout()
+        return self.stream is sys.__stdout__
+
+    def _detect_ansi(self) -> bool:
+        """Check whether the stream is a terminal that understands ANSI escapes."""
+        if 'idlelib.run' in sys.modules:
+            return False
+        try:
+            if not self.stream.isatty():
+                return False
+        except (AttributeError, ValueError):
+            return False
+        if os.environ.get('TERM') == 'dumb':
+            return False
+        if os.name == 'nt':
+            return self._enable_windows_ansi()
+        return True
+
+    def _enable_windows_ansi(self) -> bool:
+        """Turn on escape sequence processing in the Windows console."""
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+        except Exception as e:
+            self.logger.debug(f"ANSI escapes unavailable in this console: {e}")
+            return False
@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The game modules live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def make_save():
+    """Factory for minimal save data accepted by every save backend."""
+    def make(save_name, save_date='2024-01-01T00:00:00', **changes):
+        save_data = {
+            'save_name': save_name,
+            'save_date': save_date,
+            'version': '1.0.0',
+            'game_state': {},
+            'current_location': 'police_station',
+            'location_states': {},
+            'inventory_state': {},
+            'puzzle_states': {},
+        }
+        save_data.update(changes)
+        return save_data
+    return make
@@ -0,0 +1,28 @@
+import pytest
+
+from game_engine import GameEngine
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = GameEngine(save_dir=str(tmp_path))
+    engine.start()
+    yield engine
+    engine.close()
+
+
+@pytest.mark.parametrize("word", ["q", "qu", "qui", "exi", "by", "lo" + "a"])
+def test_abbreviations_never_quit_or_load(engine, word):
+    result = engine.step(word)
+    assert not result.ended
+    assert "Invalid command" in result.text
+
+
+@pytest.mark.parametrize("word", ["quit", "exit", "bye"])
+def test_quit_words_in_full_still_end_the_game(engine, word):
+    assert engine.step(word).ended
+
+
+def test_other_verbs_still_expand(engine):
+    assert "Exits:" in engine.step("lo").text
+    assert "badge" in engine.step("exam badge").text.lower()
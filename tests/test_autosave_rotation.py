@@ -0,0 +1,43 @@
+import config
+from save_backends import FilesystemSaveBackend
+from utils import SaveLoadManager
+
+
+def write_autosaves(manager, make_save, count):
+    for turn in range(count):
+        manager.write_auto_save(make_save(
+            f"autosave_{1000 + turn}", f"2024-01-01T00:00:{turn:02d}",
+            game_state={'turn': turn}))
+
+
+def test_each_autosave_is_its_own_save(tmp_path, make_save):
+    manager = SaveLoadManager(tmp_path, FilesystemSaveBackend(tmp_path))
+    write_autosaves(manager, make_save, config.MAX_AUTO_SAVES + 2)
+
+    names = sorted(entry['name'] for entry in manager.list_saves())
+    newest = [f"autosave_{1000 + turn}" for turn in range(2, config.MAX_AUTO_SAVES + 2)]
+    assert names == newest
+    for turn, name in enumerate(newest, start=2):
+        assert manager.backend.read(name)['game_state'] == {'turn': turn}
+    assert not list(tmp_path.glob("autosave_*.journal"))
+
+
+def test_damaged_autosave_leaves_older_ones(tmp_path, make_save):
+    manager = SaveLoadManager(tmp_path, FilesystemSaveBackend(tmp_path))
+    write_autosaves(manager, make_save, config.MAX_AUTO_SAVES)
+
+    newest = tmp_path / f"autosave_{1000 + config.MAX_AUTO_SAVES - 1}.json"
+    newest.write_bytes(newest.read_bytes()[:10])
+
+    reopened = FilesystemSaveBackend(tmp_path)
+    for turn in range(config.MAX_AUTO_SAVES - 1):
+        assert reopened.read(f"autosave_{1000 + turn}")['game_state'] == {'turn': turn}
+
+
+def test_repeated_save_of_one_name_is_journaled(tmp_path, make_save):
+    manager = SaveLoadManager(tmp_path, FilesystemSaveBackend(tmp_path))
+    manager.write_save(make_save("slot", game_state={'turn': 0}))
+    manager.write_save(make_save("slot", game_state={'turn': 1}))
+
+    assert (tmp_path / "slot.journal").exists()
+    assert FilesystemSaveBackend(tmp_path).read("slot")['game_state'] == {'turn': 1}
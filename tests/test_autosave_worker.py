@@ -0,0 +1,79 @@
+import threading
+import time
+
+from autosave_worker import AutoSaveWorker
+
+
+class RecordingManager:
+    """Stands in for SaveLoadManager, recording each group commit."""
+
+    def __init__(self):
+        self.batches = []
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def manage_saves(self, max_total_size_mb):
+        self.writing.set()
+        self.release.wait(5)
+
+    def write_auto_saves(self, batch):
+        self.batches.append([save_data['save_name'] for save_data in batch])
+
+
+def snapshot(name):
+    return {'save_name': name}
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_snapshots_within_window_share_a_group_commit():
+    manager = RecordingManager()
+    worker = AutoSaveWorker(manager, queue_size=10, group_commit_window=0.5)
+    for turn in range(3):
+        assert worker.submit(snapshot(f"autosave_{turn}"))
+    worker.stop(timeout=5)
+
+    assert manager.batches == [["autosave_0", "autosave_1", "autosave_2"]]
+
+
+def test_full_queue_drops_the_oldest_snapshot():
+    manager = RecordingManager()
+    manager.release.clear()
+    worker = AutoSaveWorker(manager, queue_size=2, group_commit_window=0)
+    worker.submit(snapshot("autosave_0"))
+    assert manager.writing.wait(5)
+
+    for turn in range(1, 4):
+        worker.submit(snapshot(f"autosave_{turn}"))
+    manager.release.set()
+    worker.stop(timeout=5)
+
+    written = [name for batch in manager.batches for name in batch]
+    assert written == ["autosave_0", "autosave_2", "autosave_3"]
+
+
+def test_idle_worker_exits_and_restarts_on_next_snapshot():
+    manager = RecordingManager()
+    worker = AutoSaveWorker(manager, group_commit_window=0, idle_timeout=0.05)
+    worker.submit(snapshot("autosave_0"))
+    first_thread = worker._thread
+    wait_for(lambda: worker._thread is None)
+    first_thread.join(5)
+    assert not first_thread.is_alive()
+
+    worker.submit(snapshot("autosave_1"))
+    wait_for(lambda: len(manager.batches) == 2)
+    worker.stop(timeout=5)
+    assert manager.batches == [["autosave_0"], ["autosave_1"]]
+
+
+def test_stop_without_snapshots_is_a_no_op():
+    manager = RecordingManager()
+    AutoSaveWorker(manager).stop(timeout=1)
+    assert manager.batches == []
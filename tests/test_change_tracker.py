@@ -0,0 +1,70 @@
+import copy
+import pickle
+
+from change_tracker import ChangeTracker, TrackedDict
+
+
+def test_commands_that_change_state_are_counted():
+    tracker = ChangeTracker()
+    tracker.end_command()
+    assert not tracker.dirty
+    assert tracker.mutating_commands == 0
+
+    tracker.mark("inventory")
+    tracker.mark("game_state")
+    tracker.end_command()
+    tracker.end_command()
+    assert tracker.dirty
+    assert tracker.changed == {"inventory", "game_state"}
+    assert tracker.mutating_commands == 1
+
+    tracker.clear()
+    assert not tracker.dirty
+    assert tracker.mutating_commands == 0
+
+
+def test_assigning_an_equal_value_is_not_a_change():
+    tracker = ChangeTracker()
+    state = TrackedDict({'door_open': False}, tracker)
+    state['door_open'] = False
+    state.setdefault('door_open', True)
+    state.update(door_open=False)
+    assert not tracker.dirty
+
+    state['door_open'] = True
+    assert tracker.changed == {"game_state"}
+
+
+def test_every_mutation_marks_the_tracker():
+    mutations = [
+        lambda state: state.__setitem__('new', 1),
+        lambda state: state.__delitem__('key'),
+        lambda state: state.update({'key': 2}),
+        lambda state: state.setdefault('other', 3),
+        lambda state: state.pop('key'),
+        lambda state: state.popitem(),
+        lambda state: state.clear(),
+    ]
+    for mutate in mutations:
+        tracker = ChangeTracker()
+        mutate(TrackedDict({'key': 1}, tracker, source="location"))
+        assert tracker.changed == {"location"}
+
+
+def test_missing_keys_and_empty_clear_are_not_changes():
+    tracker = ChangeTracker()
+    state = TrackedDict({}, tracker)
+    state.pop('missing', None)
+    state.clear()
+    assert not tracker.dirty
+
+
+def test_copies_are_plain_dicts():
+    tracker = ChangeTracker()
+    state = TrackedDict({'clues': ['letter']}, tracker)
+    for duplicate in (copy.copy(state), copy.deepcopy(state), pickle.loads(pickle.dumps(state))):
+        assert type(duplicate) is dict
+        assert duplicate == {'clues': ['letter']}
+        duplicate['clues'] = []
+    assert not tracker.dirty
+    assert copy.deepcopy(state)['clues'] is not state['clues']
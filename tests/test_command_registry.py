@@ -0,0 +1,67 @@
+import pytest
+
+from command_registry import Command, CommandRegistry
+
+
+def handler(game, args):
+    return True
+
+
+def test_decorator_registers_name_and_aliases():
+    registry = CommandRegistry()
+
+    @registry.command("take", "get", min_args=1, usage="Take what?", completes="item")
+    def take(game, args):
+        return True
+
+    command, args = registry.resolve("get", ["key"])
+    assert command.name == "take"
+    assert command.handler is take
+    assert command.completes == "item"
+    assert args == ["key"]
+    assert registry.resolve("grab") is None
+    assert "take" in registry
+    assert len(registry) == 1
+    assert [command.name for command in registry] == ["take"]
+
+
+def test_alias_puts_fixed_arguments_first():
+    registry = CommandRegistry()
+    registry.register(Command("go", handler, min_args=1))
+    registry.alias("n", "go", "north")
+
+    command, args = registry.resolve("n")
+    assert command.name == "go"
+    assert args == ["north"]
+    assert registry.resolve("n", ["quickly"])[1] == ["north", "quickly"]
+    assert sorted(registry.words()) == ["go", "n"]
+
+
+def test_taken_words_are_refused():
+    registry = CommandRegistry()
+    registry.register(Command("look", handler, aliases=("l",)))
+    with pytest.raises(ValueError):
+        registry.register(Command("look", handler))
+    with pytest.raises(ValueError):
+        registry.register(Command("listen", handler, aliases=("l",)))
+    with pytest.raises(ValueError):
+        registry.alias("look", "look")
+    with pytest.raises(KeyError):
+        registry.alias("x", "examine")
+
+
+def test_exact_commands_are_not_abbreviable():
+    registry = CommandRegistry()
+    registry.register(Command("look", handler))
+    registry.register(Command("quit", handler, aliases=("exit",), exact=True))
+    assert sorted(registry.words()) == ["exit", "look", "quit"]
+    assert list(registry.abbreviable_words()) == ["look"]
+
+
+def test_accepts_checks_argument_count():
+    command = Command("use", handler, min_args=1, max_args=2)
+    assert not command.accepts(0)
+    assert command.accepts(1)
+    assert command.accepts(2)
+    assert not command.accepts(3)
+    assert Command("say", handler).accepts(10)
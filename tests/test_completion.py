@@ -0,0 +1,61 @@
+from completion import Completer, PrefixTrie
+
+
+def test_trie_lists_words_by_prefix_in_order():
+    trie = PrefixTrie(["take", "talk", "go", "take"])
+    assert len(trie) == 3
+    assert "take" in trie
+    assert "ta" not in trie
+    assert 42 not in trie
+    assert trie.with_prefix("ta") == ["take", "talk"]
+    assert trie.with_prefix("ta", limit=1) == ["take"]
+    assert trie.with_prefix("x") == []
+    assert list(trie) == ["go", "take", "talk"]
+
+
+def test_trie_finds_unique_completions():
+    trie = PrefixTrie(["examine", "exit", "go"])
+    assert trie.unique("exa") == "examine"
+    assert trie.unique("g") == "go"
+    assert trie.unique("ex") is None
+    assert trie.unique("z") is None
+
+
+def test_discard_prunes_empty_branches():
+    trie = PrefixTrie(["read", "readme"])
+    assert trie.discard("readme")
+    assert not trie.discard("readme")
+    assert trie.with_prefix("") == ["read"]
+    assert trie.discard("read")
+    assert len(trie) == 0
+    assert trie.with_prefix("r") == []
+    assert trie.add("read")
+
+
+def test_expand_abbreviations():
+    completer = Completer(PrefixTrie(["examine", "exit", "take"]))
+    completer.sync(["notebook", "newspaper"], ["north"])
+    assert completer.expand("ta", "verb") == ("take", [])
+    assert completer.expand("ex", "verb") == ("ex", ["examine", "exit"])
+    assert completer.expand("note", "item") == ("notebook", [])
+    assert completer.expand("no", "exit") == ("north", [])
+    assert completer.expand("", "item") == ("", [])
+
+
+def test_sync_replaces_reachable_names():
+    completer = Completer(PrefixTrie())
+    completer.sync(["notebook", "key"], ["north"])
+    completer.sync(["key", "badge"], ["south"])
+    assert completer.reachable("item") == {"key", "badge"}
+    assert completer.tries["item"].with_prefix("") == ["badge", "key"]
+    assert completer.tries["exit"].with_prefix("") == ["south"]
+
+
+def test_candidates_complete_the_last_word():
+    completer = Completer(PrefixTrie(["take", "talk", "go"]))
+    completer.sync(["notebook", "key"], ["north", "east"])
+    assert completer.candidates("ta") == ["take", "talk"]
+    assert completer.candidates("") == ["go", "take", "talk"]
+    assert completer.candidates("take n") == ["north", "notebook"]
+    assert completer.candidates("take n", kinds=("item",)) == ["notebook"]
+    assert completer.candidates("go ") == ["east", "key", "north", "notebook"]
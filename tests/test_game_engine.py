@@ -0,0 +1,79 @@
+import pytest
+
+from game_engine import GameEngine
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = GameEngine(save_dir=str(tmp_path))
+    engine.start()
+    yield engine
+    engine.close()
+
+
+def open_cipher_puzzle(engine):
+    game = engine.game
+    game.current_location = game.location_manager.current_location = "evidence_room"
+    game.item_manager.inventory.append("cipher_wheel")
+    return engine.step("solve")
+
+
+def test_start_describes_the_first_location(tmp_path):
+    engine = GameEngine(save_dir=str(tmp_path))
+    result = engine.start()
+    assert "Exits: outside, office, basement" in result.text
+    assert result.delta == {}
+    assert not result.ended
+    engine.close()
+
+
+def test_step_reports_what_changed(engine):
+    result = engine.step("take badge")
+    assert "badge" in result.text
+    assert result.delta == {
+        'game_state': {'has_badge': True},
+        'inventory': {'added': ['badge'], 'removed': []},
+        'location_items': {'police_station': ['case_file', 'coffee']},
+    }
+    assert engine.step("inventory").delta == {}
+
+
+def test_chained_commands_run_as_one_step(engine):
+    result = engine.step("take badge; take coffee")
+    assert result.delta['inventory']['added'] == ['badge', 'coffee']
+
+
+def test_empty_command_asks_for_one(engine):
+    result = engine.step("   ")
+    assert "Please enter a command" in result.text
+    assert result.delta == {}
+
+
+def test_puzzle_waits_for_answers(engine):
+    result = open_cipher_puzzle(engine)
+    assert result.awaiting_answer
+    assert result.prompt == engine.game.puzzle_manager.prompt
+
+    result = engine.step("WRONG")
+    assert result.awaiting_answer
+    assert "attempts remaining" in result.text
+
+    result = engine.step("SEATTLE")
+    assert not result.awaiting_answer
+    assert result.prompt is None
+    assert result.delta['puzzles_solved'] == ['cipher_puzzle']
+
+
+def test_quit_inside_a_puzzle_only_leaves_the_puzzle(engine):
+    open_cipher_puzzle(engine)
+    result = engine.step("quit")
+    assert not result.awaiting_answer
+    assert not result.ended
+
+
+def test_quit_ends_the_session(engine):
+    result = engine.step("quit")
+    assert result.ended
+    assert "Thanks for playing" in result.text
+    assert engine.step("look").text == ""
+    assert engine.step("look").ended
@@ -0,0 +1,100 @@
+import asyncio
+
+import config
+from game_server import COMMAND_PROMPT, IAC, NAME_PROMPT, SB, SE, WILL, GameServer, strip_telnet
+
+TIMEOUT = 5
+
+
+def test_strip_telnet_removes_negotiation():
+    assert strip_telnet(b"look\r\n") == b"look\r\n"
+    data = bytes((IAC, WILL, 1)) + b"lo" + bytes((IAC, SB, 24, 0, IAC, SE)) + b"ok" + bytes((IAC, IAC))
+    assert strip_telnet(data) == b"look\xff"
+
+
+def run_with_server(tmp_path, client, **options):
+    """Run client(server) against a server listening on a free port."""
+    async def main():
+        server = GameServer(host="127.0.0.1", port=0, save_dir=tmp_path, **options)
+        await server.start()
+        try:
+            return await asyncio.wait_for(client(server), TIMEOUT)
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+
+async def connect(server):
+    return await asyncio.open_connection("127.0.0.1", server.port)
+
+
+async def read_until(reader, prompt):
+    expected = prompt.replace("\n", "\r\n").encode()
+    return (await reader.readuntil(expected)).decode()
+
+
+async def join(server, name):
+    reader, writer = await connect(server)
+    await read_until(reader, NAME_PROMPT)
+    writer.write(f"{name}\r\n".encode())
+    return reader, writer, await read_until(reader, COMMAND_PROMPT)
+
+
+def test_player_plays_and_quits(tmp_path):
+    async def client(server):
+        reader, writer, opening = await join(server, "sam")
+        assert "Exits:" in opening
+        assert "sam" in server.sessions
+
+        writer.write(b"take badge\r\n")
+        assert "badge" in await read_until(reader, COMMAND_PROMPT)
+        writer.write(b"quit\r\n")
+        farewell = (await reader.read()).decode()
+        assert "Thanks for playing" in farewell
+        writer.close()
+        while "sam" in server.sessions:
+            await asyncio.sleep(0.01)
+
+    run_with_server(tmp_path, client)
+
+
+def test_names_are_validated_and_claimed_once(tmp_path):
+    async def client(server):
+        _, first, _ = await join(server, "Sam")
+        reader, writer = await connect(server)
+        await read_until(reader, NAME_PROMPT)
+        writer.write(b"../sam\r\n")
+        assert "Use up to 24" in await read_until(reader, NAME_PROMPT)
+        writer.write(b"sam\r\n")
+        assert "already on the case" in await read_until(reader, NAME_PROMPT)
+        writer.write(b"lou\r\n")
+        await read_until(reader, COMMAND_PROMPT)
+        assert sorted(server.sessions) == ["lou", "sam"]
+        first.close()
+        writer.close()
+
+    run_with_server(tmp_path, client)
+
+
+def test_overlong_line_is_skipped_whole(tmp_path):
+    async def client(server):
+        reader, writer, _ = await join(server, "sam")
+        writer.write(b"x" * (config.SERVER_MAX_LINE_BYTES * 3) + b" take badge\r\n")
+        assert "too long" in await read_until(reader, COMMAND_PROMPT)
+        writer.write(b"inventory\r\n")
+        response = await read_until(reader, COMMAND_PROMPT)
+        assert "badge" not in response
+        writer.close()
+
+    run_with_server(tmp_path, client)
+
+
+def test_full_server_turns_players_away(tmp_path):
+    async def client(server):
+        _, first, _ = await join(server, "sam")
+        reader, writer = await connect(server)
+        assert b"precinct is full" in await reader.read()
+        first.close()
+        writer.close()
+
+    run_with_server(tmp_path, client, max_sessions=1)
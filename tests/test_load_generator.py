@@ -0,0 +1,22 @@
+import asyncio
+
+from game_server import GameServer
+from load_generator import generate_load
+
+
+def test_scripted_players_all_finish(tmp_path):
+    async def main():
+        server = GameServer(host="127.0.0.1", port=0, save_dir=tmp_path)
+        await server.start()
+        try:
+            return await asyncio.wait_for(
+                generate_load("127.0.0.1", server.port, clients=3, rounds=2,
+                              script=["look", "take badge"]), 10)
+        finally:
+            await server.close()
+
+    stats = asyncio.run(main())
+    assert stats["failed_clients"] == 0
+    assert stats["commands"] == 3 * 2 * 2
+    assert stats["p50_ms"] <= stats["p99_ms"]
+    assert sorted(path.name for path in (tmp_path / "players").iterdir()) == ["load0", "load1", "load2"]
@@ -0,0 +1,59 @@
+import pytest
+
+from game_engine import GameEngine
+from natural_commands import NaturalCommandHandler
+from spelling_index import SpellingIndex
+
+
+@pytest.fixture
+def handler():
+    return NaturalCommandHandler(literal_verbs={"save", "solve"})
+
+
+@pytest.mark.parametrize("command, expected", [
+    ("pick up the badge", ("take", "badge")),
+    ("examine newspaper", ("examine", "newspaper")),
+    ("look around", ("look", "")),
+    ("walk north", ("go", "north")),
+    ("n", ("go", "north")),
+    ("go exit", ("go", "exit")),
+    ("i", ("inventory", "")),
+    ("bye", ("quit", "")),
+    ("save slot", ("unknown", "save slot")),
+    ("", ("invalid", "")),
+])
+def test_understand_command(handler, command, expected):
+    assert handler.understand_command(command) == expected
+
+
+def test_quitting_depends_on_context(handler):
+    assert handler.understand_command("goodbye", "conversation") == ("end_conversation", "")
+    assert handler.understand_command("quit", "puzzle") == ("leave_puzzle", "")
+
+
+@pytest.mark.parametrize("item, expected", [
+    ("Police Badge", "police_badge"),
+    ("newspaper piece 2", "newspaper_piece_2"),
+    ("bagde", "bagde"),
+])
+def test_normalize_item_name_only_formats(handler, item, expected):
+    assert handler.normalize_item_name(item) == expected
+
+
+def test_correct_name_only_offers_reachable_names_of_its_kind(handler):
+    assert handler.correct_name("bagde", {"badge"}) == "badge"
+    assert handler.correct_name("bagde", {"office"}) == "bagde"
+    assert handler.correct_name("offcie", {"office"}, "exit") == "office"
+    assert handler.correct_name("offcie", {"office"}, "item") == "offcie"
+
+
+def test_parsing_does_not_look_up_spellings(tmp_path, monkeypatch):
+    engine = GameEngine(save_dir=str(tmp_path))
+
+    def lookup(self, word):
+        raise AssertionError(f"spelling lookup for {word!r} while parsing")
+    monkeypatch.setattr(SpellingIndex, "lookup", lookup)
+
+    assert engine.game.parse_command("pick up the bagde") == ("take", ["bagde"])
+    assert engine.game.parse_command("examine police badge") == ("examine", ["police_badge"])
+    engine.close()
@@ -0,0 +1,52 @@
+import io
+
+import pytest
+
+from output_sink import BufferSink, TerminalSink
+
+
+def test_command_output_is_written_once():
+    sink = BufferSink()
+    with sink.command():
+        sink.print("You look around.")
+        with sink.command():
+            sink.print("Exits:", "north", sep=" ")
+        assert sink.getvalue() == ""
+    assert sink.getvalue() == "You look around.\nExits: north\n"
+    assert sink.writes == 1
+    assert sink.bytes_written == len(sink.getvalue())
+
+
+def test_output_outside_commands_is_written_at_once():
+    sink = BufferSink()
+    sink.write("a")
+    sink.write("")
+    sink.write("b")
+    assert sink.writes == 2
+    assert sink.take() == "ab"
+    assert sink.getvalue() == ""
+
+
+def test_prompt_flushes_before_reading():
+    sink = BufferSink(["SEATTLE"])
+    with sink.command():
+        sink.print("Decode this:")
+        assert sink.prompt("> ") == "SEATTLE"
+        assert sink.getvalue() == "Decode this:\n> "
+    sink.feed(["quit"])
+    assert sink.read_line() == "quit"
+    with pytest.raises(EOFError):
+        sink.read_line()
+
+
+def test_terminal_sink_uses_its_streams():
+    stream = io.StringIO()
+    sink = TerminalSink(stream, io.StringIO("look\r\n"))
+    sink.print("hello")
+    assert stream.getvalue() == "hello\n"
+    assert sink.read_line() == "look"
+    with pytest.raises(EOFError):
+        sink.read_line()
+    assert not sink.isatty()
+    assert not sink.is_process_stdout()
+    assert not sink.terminal.ansi
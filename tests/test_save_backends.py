@@ -0,0 +1,79 @@
+import pytest
+
+from save_backends import (FilesystemSaveBackend, MemorySaveBackend, SQLiteSaveBackend,
+                           create_save_backend)
+
+
+@pytest.fixture(params=["filesystem", "sqlite", "memory"])
+def backend(request, tmp_path):
+    backend = create_save_backend(request.param, tmp_path)
+    yield backend
+    backend.close()
+
+
+def test_create_save_backend_picks_the_backend(tmp_path):
+    assert isinstance(create_save_backend("filesystem", tmp_path), FilesystemSaveBackend)
+    assert isinstance(create_save_backend("memory", tmp_path), MemorySaveBackend)
+    sqlite = create_save_backend("sqlite", tmp_path)
+    assert isinstance(sqlite, SQLiteSaveBackend)
+    sqlite.close()
+    with pytest.raises(ValueError):
+        create_save_backend("floppy", tmp_path)
+
+
+def test_write_read_and_delete(backend, make_save):
+    backend.write(make_save("slot1", game_state={'turn': 1}))
+    backend.write(make_save("slot1", game_state={'turn': 2}))
+
+    assert backend.read("slot1")['game_state'] == {'turn': 2}
+    assert backend.read("missing") is None
+    assert backend.delete("slot1")
+    assert not backend.delete("slot1")
+    assert backend.read("slot1") is None
+
+
+def test_list_saves_newest_first(backend, make_save):
+    backend.write(make_save("old", '2024-01-01T00:00:00'))
+    backend.write(make_save("new", '2024-01-02T00:00:00'))
+
+    saves = backend.list_saves()
+    assert [entry['name'] for entry in saves] == ["new", "old"]
+    assert saves[0]['location'] == "police_station"
+
+
+def test_prune_keeps_the_newest_autosaves(backend, make_save):
+    backend.write(make_save("manual", '2024-01-01T00:00:00'))
+    for turn in range(5):
+        backend.write(make_save(f"autosave_{1000 + turn}", f"2024-01-02T00:00:0{turn}"))
+
+    backend.prune_autosaves(2)
+    names = sorted(entry['name'] for entry in backend.list_saves())
+    assert names == ["autosave_1003", "autosave_1004", "manual"]
+    stats = backend.autosave_stats()
+    assert stats['count'] == 2
+    assert stats['total_size_bytes'] > 0
+
+
+def test_group_commit_writes_every_save(backend, make_save):
+    with backend.group_commit():
+        for turn in range(3):
+            backend.write(make_save(f"autosave_{turn}", game_state={'turn': turn}))
+    for turn in range(3):
+        assert backend.read(f"autosave_{turn}")['game_state'] == {'turn': turn}
+
+
+def test_sqlite_group_commit_rolls_back_on_error(tmp_path, make_save):
+    backend = SQLiteSaveBackend(tmp_path / "saves.db")
+    with pytest.raises(RuntimeError):
+        with backend.group_commit():
+            backend.write(make_save("autosave_1"))
+            raise RuntimeError("crash")
+    assert backend.read("autosave_1") is None
+    backend.close()
+
+
+def test_filesystem_saves_survive_reopening(tmp_path, make_save):
+    FilesystemSaveBackend(tmp_path).write(make_save("slot1", game_state={'turn': 1}))
+    reopened = FilesystemSaveBackend(tmp_path)
+    assert reopened.read("slot1")['game_state'] == {'turn': 1}
+    assert [entry['name'] for entry in reopened.list_saves()] == ["slot1"]
@@ -0,0 +1,99 @@
+import json
+import os
+
+import pytest
+
+import config
+from save_format import (SAVE_HEADER, decode_save, encode_save, migrate_save_data,
+                         parse_save_header, read_save_file, read_save_header,
+                         write_file_atomic)
+
+
+@pytest.fixture
+def save_data(make_save):
+    return make_save(
+        "slot1",
+        version=config.SAVE_FILE_VERSION,
+        game_state={'has_badge': True, 'tracked_car': False, 'cipher_attempts': 3,
+                    'inventory': ['badge']},
+        location_states={'diner': {'items': ['newspaper_piece_1'], 'visited': True}},
+        inventory_state={'items': ['badge'], 'weight': 1.5, 'note': None, 'count': -7},
+        puzzle_states={'cipher_puzzle': {'solved': True, 'solved_ciphers': ['initial']}},
+    )
+
+
+@pytest.mark.parametrize("save_format", ["json", "binary"])
+def test_round_trip(save_data, save_format):
+    assert decode_save(encode_save(save_data, save_format)) == save_data
+
+
+def test_header_carries_listing_metadata(save_data):
+    header = parse_save_header(encode_save(save_data, "json"))
+    assert header['save_name'] == "slot1"
+    assert header['current_location'] == "police_station"
+    assert header['version'] == config.SAVE_FILE_VERSION
+
+
+def test_long_names_are_cut_at_a_character_boundary(save_data):
+    # 96 bytes ends halfway through a two-byte character
+    save_data['save_name'] = "a" + "é" * 60
+    data = encode_save(save_data, "json")
+
+    assert parse_save_header(data)['save_name'] == "a" + "é" * 47
+    assert decode_save(data)['save_name'] == "a" + "é" * 60
+
+
+def test_damaged_payload_fails_its_checksum(save_data):
+    data = bytearray(encode_save(save_data, "json"))
+    data[SAVE_HEADER.size + 5] ^= 0xFF
+    with pytest.raises(ValueError, match="checksum"):
+        decode_save(bytes(data))
+
+
+def test_truncated_save_is_rejected(save_data, tmp_path):
+    data = encode_save(save_data, "binary")
+    with pytest.raises(ValueError, match="truncated"):
+        decode_save(data[:-3])
+
+    file_path = tmp_path / "slot1.sav"
+    file_path.write_bytes(data[:-3])
+    with pytest.raises(ValueError, match="truncated"):
+        read_save_file(file_path)
+    assert read_save_header(file_path)['save_name'] == "slot1"
+
+
+def test_saves_without_a_header_still_load(save_data):
+    assert decode_save(json.dumps(save_data).encode('utf-8')) == save_data
+    assert parse_save_header(json.dumps(save_data).encode('utf-8')) is None
+
+
+def test_migrates_old_saves_to_the_current_version(make_save):
+    old = make_save("slot1", version="1.0.0")
+    del old['puzzle_states']
+    migrated = migrate_save_data(old)
+    assert migrated['version'] == config.SAVE_FILE_VERSION
+    assert migrated['puzzle_states'] == {}
+
+    unversioned = make_save("slot2")
+    del unversioned['version']
+    assert migrate_save_data(unversioned)['version'] == config.SAVE_FILE_VERSION
+
+
+def test_unknown_versions_are_refused(make_save):
+    with pytest.raises(ValueError, match="No migration"):
+        migrate_save_data(make_save("slot1", version="0.9.0"))
+
+
+def test_atomic_write_keeps_the_old_file_on_failure(tmp_path, monkeypatch):
+    file_path = tmp_path / "slot1.json"
+    write_file_atomic(file_path, b"old")
+    write_file_atomic(file_path, b"new", durable=False)
+    assert file_path.read_bytes() == b"new"
+
+    def crash(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "replace", crash)
+    with pytest.raises(OSError):
+        write_file_atomic(file_path, b"newer")
+    assert file_path.read_bytes() == b"new"
+    assert [path.name for path in tmp_path.iterdir()] == ["slot1.json"]
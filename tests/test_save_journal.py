@@ -0,0 +1,71 @@
+import copy
+
+from save_journal import SaveJournal, apply_delta, compute_delta
+
+
+def test_delta_holds_only_changed_keys(make_save):
+    old = make_save("slot1", game_state={'a': 1, 'b': 2, 'c': 3})
+    new = make_save("slot1", save_date='2024-01-02T00:00:00', game_state={'a': 1, 'b': 5})
+
+    delta = compute_delta(old, new)
+    assert delta == {
+        'replace': {'save_date': '2024-01-02T00:00:00'},
+        'update': {'game_state': {'b': 5}},
+        'remove': {'game_state': ['c']},
+    }
+    state = copy.deepcopy(old)
+    apply_delta(state, delta)
+    assert state == new
+
+
+def test_unchanged_snapshot_has_an_empty_delta(make_save):
+    assert compute_delta(make_save("slot1"), make_save("slot1")) == {}
+
+
+def test_replay_rebuilds_the_latest_save(tmp_path, make_save):
+    journal = SaveJournal(tmp_path)
+    checkpoint = make_save("slot1", game_state={'turn': 0})
+    journal.start(checkpoint)
+    for turn in range(1, 4):
+        journal.append(make_save("slot1", game_state={'turn': turn}), durable=False)
+    journal.sync()
+
+    reopened = SaveJournal(tmp_path)
+    assert reopened.replay("slot1", checkpoint)['game_state'] == {'turn': 3}
+    assert reopened.can_append("slot1")
+
+
+def test_compaction_is_due_after_compact_every_entries(tmp_path, make_save):
+    journal = SaveJournal(tmp_path, compact_every=2)
+    assert not journal.can_append("slot1")
+    journal.start(make_save("slot1"))
+    for turn in range(2):
+        assert journal.can_append("slot1")
+        journal.append(make_save("slot1", game_state={'turn': turn}))
+    assert not journal.can_append("slot1")
+
+    journal.start(make_save("slot1", game_state={'turn': 2}))
+    assert not journal.journal_path("slot1").exists()
+    assert journal.can_append("slot1")
+
+
+def test_torn_last_entry_is_ignored_and_forces_compaction(tmp_path, make_save):
+    journal = SaveJournal(tmp_path)
+    checkpoint = make_save("slot1", game_state={'turn': 0})
+    journal.start(checkpoint)
+    journal.append(make_save("slot1", game_state={'turn': 1}))
+    with open(journal.journal_path("slot1"), 'a') as f:
+        f.write('{"update":{"game_state":{"tu')
+
+    reopened = SaveJournal(tmp_path)
+    assert reopened.replay("slot1", checkpoint)['game_state'] == {'turn': 1}
+    assert not reopened.can_append("slot1")
+
+
+def test_discard_removes_the_journal(tmp_path, make_save):
+    journal = SaveJournal(tmp_path)
+    journal.start(make_save("slot1"))
+    journal.append(make_save("slot1", game_state={'turn': 1}))
+    journal.discard("slot1")
+    assert not journal.journal_path("slot1").exists()
+    assert not journal.can_append("slot1")
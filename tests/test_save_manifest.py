@@ -0,0 +1,70 @@
+import json
+import os
+
+import pytest
+
+from save_format import encode_save, read_save_file
+from save_manifest import SaveManifest
+
+
+@pytest.fixture
+def loads():
+    """Loader that records which save files had to be parsed."""
+    calls = []
+
+    def loader(file_path):
+        calls.append(file_path.stem)
+        return read_save_file(file_path)
+    loader.calls = calls
+    return loader
+
+
+def write_save(manifest, make_save, name):
+    save_data = make_save(name)
+    file_path = manifest.save_dir / f"{name}.json"
+    with manifest.updating():
+        file_path.write_bytes(encode_save(save_data, "json"))
+        manifest.record(save_data, file_path)
+
+
+def test_own_writes_do_not_trigger_a_rescan(tmp_path, make_save, loads):
+    manifest = SaveManifest(tmp_path, loader=loads)
+    write_save(manifest, make_save, "slot1")
+    write_save(manifest, make_save, "slot2")
+
+    reopened = SaveManifest(tmp_path, loader=loads)
+    assert [entry['name'] for entry in reopened.list_entries()] == ["slot1", "slot2"]
+    assert loads.calls == []
+
+
+def test_outside_changes_are_picked_up(tmp_path, make_save, loads):
+    manifest = SaveManifest(tmp_path, loader=loads)
+    write_save(manifest, make_save, "slot1")
+    (tmp_path / "copied.json").write_bytes(encode_save(make_save("copied"), "json"))
+
+    assert sorted(entry['name'] for entry in manifest.list_entries()) == ["copied", "slot1"]
+    assert loads.calls == ["copied"]
+
+
+def test_failed_write_keeps_the_old_manifest(tmp_path, make_save, monkeypatch):
+    manifest = SaveManifest(tmp_path)
+    write_save(manifest, make_save, "slot1")
+    before = manifest.manifest_path.read_bytes()
+
+    def crash(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "replace", crash)
+    write_save(manifest, make_save, "slot2")
+
+    assert manifest.manifest_path.read_bytes() == before
+    assert json.loads(before)['entries'].keys() == {"slot1"}
+
+
+def test_unreadable_manifest_is_rebuilt(tmp_path, make_save):
+    manifest = SaveManifest(tmp_path)
+    write_save(manifest, make_save, "slot1")
+    manifest.manifest_path.write_text('{"entries": {')
+
+    reopened = SaveManifest(tmp_path)
+    assert [entry['name'] for entry in reopened.list_entries()] == ["slot1"]
+    assert json.loads(reopened.manifest_path.read_text())['entries'].keys() == {"slot1"}
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import pytest
+
+from game_engine import GameEngine
+from output_sink import BufferSink
+from save_backends import FilesystemSaveBackend, is_valid_save_name
+from utils import SaveLoadManager
+
+
+@pytest.fixture
+def players(tmp_path):
+    """Save managers for two players with neighbouring save directories."""
+    root = tmp_path / "players"
+    return {
+        name: SaveLoadManager(root / name, FilesystemSaveBackend(root / name))
+        for name in ("alice", "mallory")
+    }
+
+
+@pytest.mark.parametrize("name", ["slot1", "my-save", "Case_File_2", "a" * 64])
+def test_valid_save_names(name):
+    assert is_valid_save_name(name)
+
+
+@pytest.mark.parametrize("name", [
+    "", "..", "../alice/pwned", "../../..", "a/b", "a\\b", "/etc/passwd",
+    "save.json", "name with spaces", "a" * 65, None,
+])
+def test_invalid_save_names(name):
+    assert not is_valid_save_name(name)
+
+
+def test_write_save_refuses_traversal(players, tmp_path, make_save):
+    assert not players["mallory"].write_save(make_save("../alice/pwned"))
+    assert not (tmp_path / "players" / "alice" / "pwned.json").exists()
+    assert not list((tmp_path / "players" / "alice").glob("pwned*"))
+
+
+def test_save_game_reports_invalid_name(players, tmp_path):
+    game = SimpleNamespace(output=BufferSink())
+    assert not players["mallory"].save_game(game, "../alice/pwned")
+    assert "Save names can use" in game.output.getvalue()
+    assert not list((tmp_path / "players" / "alice").glob("pwned*"))
+
+
+def test_load_and_delete_refuse_traversal(players, tmp_path, make_save):
+    assert players["alice"].write_save(make_save("pwned"))
+    game = SimpleNamespace(output=BufferSink())
+
+    assert not players["mallory"].load_game(game, "../alice/pwned")
+    assert not players["mallory"].delete_save("../alice/pwned")
+    assert [entry['name'] for entry in players["alice"].list_saves()] == ["pwned"]
+
+
+def test_backend_keeps_paths_inside_save_dir(tmp_path, make_save):
+    backend = FilesystemSaveBackend(tmp_path / "saves")
+    for name in ("../outside", "../../..", "sub/../../outside"):
+        with pytest.raises(ValueError):
+            backend.write(make_save(name))
+        with pytest.raises(ValueError):
+            backend.read(name)
+    assert list(tmp_path.iterdir()) == [tmp_path / "saves"]
+
+
+def test_valid_save_round_trips(players, make_save):
+    assert players["alice"].write_save(make_save("slot-1"))
+    assert players["alice"].backend.read("slot-1")['current_location'] == "police_station"
+
+
+def test_in_game_save_stays_in_player_directory(tmp_path):
+    root = tmp_path / "players"
+    engine = GameEngine(save_dir=str(root / "mallory"))
+    engine.start()
+    try:
+        result = engine.step("save ../alice/pwned")
+        assert "Game saved successfully" not in result.text
+        result = engine.step("load ../alice/pwned")
+        assert "Loaded save" not in result.text
+        assert not (root / "alice").exists()
+    finally:
+        engine.close()
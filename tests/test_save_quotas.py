@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from save_backends import AUTOSAVE_PREFIX, create_save_backend
+from save_ledger import SizeLedger
+from utils import SaveLoadManager
+
+AUTOSAVES = [f"{AUTOSAVE_PREFIX}{1000 + turn}" for turn in range(4)]
+
+
+def test_ledger_waits_for_first_reconcile():
+    ledger = SizeLedger(reconcile_every=2)
+    assert ledger.needs_reconcile()
+    ledger.record("slot", 10, 1.0)
+    assert ledger.usage() == 0
+
+    ledger.reset([("slot", 10, 1.0)])
+    assert not ledger.needs_reconcile()
+    ledger.record("other", 5, 2.0)
+    ledger.remove("slot")
+    assert ledger.needs_reconcile()
+    assert ledger.usage() == 5
+
+
+def test_ledger_usage_and_order_by_prefix():
+    ledger = SizeLedger()
+    ledger.reset([("autosave_2", 30, 3.0), ("slot", 100, 0.0), ("autosave_1", 20, 5.0)])
+
+    assert ledger.usage() == 150
+    assert ledger.usage("autosave_") == 50
+    assert ledger.oldest_first("autosave_") == ["autosave_2", "autosave_1"]
+    assert ledger.oldest_first() == ["slot", "autosave_2", "autosave_1"]
+
+
+@pytest.fixture(params=["filesystem", "sqlite", "memory"])
+def filled_backend(request, tmp_path, make_save):
+    """Backend holding one manual save and four autosaves, oldest first."""
+    backend = create_save_backend(request.param, tmp_path)
+    backend.write(make_save("manual", '2024-01-01T00:00:00', game_state={'notes': "x" * 500}))
+    for turn, name in enumerate(AUTOSAVES):
+        backend.write(make_save(name, f"2024-01-02T00:00:0{turn}",
+                                game_state={'turn': turn, 'notes': str(turn) * 200}))
+    if request.param == "filesystem":
+        # The filesystem backend orders saves by modification time
+        for turn, name in enumerate(["manual", *AUTOSAVES]):
+            for file_path in tmp_path.glob(f"{name}.*"):
+                os.utime(file_path, (1_000_000 + turn, 1_000_000 + turn))
+        backend.close()
+        backend = create_save_backend(request.param, tmp_path)
+    yield backend
+    backend.close()
+
+
+def names(backend):
+    return sorted(entry['name'] for entry in backend.list_saves())
+
+
+def test_quota_removes_oldest_autosaves_only_as_needed(filled_backend):
+    over_by_one = filled_backend.usage(AUTOSAVE_PREFIX) - 1
+    filled_backend.enforce_quota(AUTOSAVE_PREFIX, over_by_one)
+
+    assert names(filled_backend) == sorted(["manual", *AUTOSAVES[1:]])
+    assert filled_backend.usage(AUTOSAVE_PREFIX) <= over_by_one
+
+
+def test_quota_never_removes_manual_saves(filled_backend):
+    filled_backend.enforce_quota("", 0)
+    assert names(filled_backend) == ["manual"]
+
+
+def test_quota_under_limit_removes_nothing(filled_backend):
+    filled_backend.enforce_quota("", filled_backend.usage())
+    assert names(filled_backend) == sorted(["manual", *AUTOSAVES])
+
+
+def test_check_quota_refuses_saves_when_prefix_is_full(tmp_path, make_save, monkeypatch):
+    manager = SaveLoadManager(tmp_path, create_save_backend("memory", tmp_path))
+    manager.write_save(make_save("case_1", game_state={'notes': "x" * 500}))
+    monkeypatch.setattr("config.SAVE_QUOTAS_MB", {"case_": 100 / (1024 * 1024)})
+
+    assert not manager.check_quota("case_2")
+    assert manager.check_quota("slot")
@@ -0,0 +1,87 @@
+import json
+import os
+
+import pytest
+
+import config
+from save_backends import FilesystemSaveBackend
+from save_store import BlobStore
+
+
+def blobs(store):
+    return sorted(path.name for path in store._iter_blobs())
+
+
+def test_identical_sections_share_one_blob(tmp_path, make_save):
+    store = BlobStore(tmp_path)
+    first = store.store(make_save("autosave_1", game_state={'a': 1}))
+    second = store.store(make_save("autosave_2", game_state={'a': 1}))
+
+    assert first['sections'] == second['sections']
+    assert blobs(store) == sorted(set(first['sections'].values()))
+    assert store.load(second)['game_state'] == {'a': 1}
+
+
+def test_garbage_collection_keeps_referenced_blobs(tmp_path, make_save):
+    store = BlobStore(tmp_path)
+    old = store.store(make_save("autosave_1", game_state={'turn': 1}))
+    new = store.store(make_save("autosave_2", game_state={'turn': 2}))
+
+    assert store.release(old) > 0
+    assert store.collect_garbage() > 0
+    assert set(blobs(store)) == set(new['sections'].values())
+    assert store.load(new)['game_state'] == {'turn': 2}
+
+
+def test_refs_survive_a_failed_write(tmp_path, make_save, monkeypatch):
+    store = BlobStore(tmp_path)
+    store.store(make_save("autosave_1"))
+    before = store.refs_path.read_bytes()
+
+    def crash(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "replace", crash)
+    with pytest.raises(OSError):
+        store.store(make_save("autosave_2", game_state={'turn': 2}))
+
+    assert store.refs_path.read_bytes() == before
+    assert not list(store.root.glob("*.tmp"))
+
+
+@pytest.mark.parametrize("damage", ["missing", "corrupt"])
+def test_lost_refs_block_garbage_collection(tmp_path, make_save, damage):
+    store = BlobStore(tmp_path)
+    live = store.store(make_save("autosave_1", game_state={'turn': 1}))
+    if damage == "missing":
+        store.refs_path.unlink()
+    else:
+        store.refs_path.write_text('{"trunc')
+
+    reopened = BlobStore(tmp_path)
+    # Writing counts for a new save must not hide that the old ones were lost
+    reopened.store(make_save("autosave_2", game_state={'turn': 2}))
+    assert reopened.needs_reconcile()
+    assert reopened.collect_garbage() == 0
+    assert reopened.load(live)['game_state'] == {'turn': 1}
+
+    reopened.reset_refs([live])
+    assert not reopened.needs_reconcile()
+    assert reopened.collect_garbage() > 0
+    assert reopened.load(live)['game_state'] == {'turn': 1}
+
+
+def test_backend_recounts_refs_before_collecting(tmp_path, make_save, monkeypatch):
+    monkeypatch.setattr(config, "SAVE_DEDUP_AUTOSAVES", True)
+    backend = FilesystemSaveBackend(tmp_path)
+    for turn in range(3):
+        backend.write(make_save(f"autosave_{turn}", game_state={'turn': turn}))
+    (tmp_path / config.SAVE_BLOB_DIR / "refs.json").write_text("")
+
+    reopened = FilesystemSaveBackend(tmp_path)
+    reopened.write(make_save("autosave_3", game_state={'turn': 3}))
+    reopened.enforce_quotas({"": 1024 * 1024 * 1024})
+
+    for turn in range(4):
+        assert reopened.read(f"autosave_{turn}")['game_state'] == {'turn': turn}
+    refs = json.loads((tmp_path / config.SAVE_BLOB_DIR / "refs.json").read_text())
+    assert all(count > 0 for count in refs.values())
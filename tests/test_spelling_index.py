@@ -0,0 +1,36 @@
+from spelling_index import SpellingIndex, edit_distance
+
+
+def test_edit_distance_counts_each_kind_of_typo():
+    assert edit_distance("notebook", "notebook") == 0
+    assert edit_distance("notebook", "notebok") == 1
+    assert edit_distance("notebook", "notebooks") == 1
+    assert edit_distance("notebook", "notebiok") == 1
+    assert edit_distance("notebook", "ntoebook") == 1
+    assert edit_distance("", "key") == 3
+
+
+def test_lookup_returns_closest_names_first():
+    index = SpellingIndex(["flashlight", "flashlamp", "notebook"])
+    assert index.lookup("notebook") == [("notebook", 0)]
+    assert index.lookup("flashlihgt") == [("flashlight", 1)]
+    assert index.lookup("flashlamps") == [("flashlamp", 1)]
+    assert index.lookup("flashligt") == [("flashlight", 1)]
+    assert index.lookup("typewriter") == []
+
+
+def test_short_words_allow_fewer_typos():
+    index = SpellingIndex(["key", "badge", "envelope"])
+    assert index.allowed_distance("ke") == 0
+    assert index.lookup("ke") == []
+    assert index.lookup("kay") == [("key", 1)]
+    assert index.lookup("bdgx") == []
+    assert index.lookup("envelpoe") == [("envelope", 1)]
+    assert index.lookup("envlepoe") == [("envelope", 2)]
+
+
+def test_max_distance_caps_long_words():
+    index = SpellingIndex(["envelope"], max_distance=1)
+    assert index.lookup("envlepoe") == []
+    assert "envelope" in index
+    assert len(index) == 1
@@ -0,0 +1,26 @@
+from types import MappingProxyType
+
+import pytest
+
+from static_content import ITEM_DESCRIPTIONS, LOCATIONS, freeze
+
+
+def test_freeze_makes_content_read_only():
+    frozen = freeze({'items': ['badge'], 'exits': {'north': 'hall'}, 'tags': {'dark'}})
+    assert isinstance(frozen, MappingProxyType)
+    assert frozen['items'] == ('badge',)
+    assert frozen['tags'] == frozenset({'dark'})
+    with pytest.raises(TypeError):
+        frozen['exits']['south'] = 'street'
+
+
+def test_strings_are_interned():
+    text = "".join(["rainy ", "night"])
+    assert freeze([text])[0] is freeze({"x": "rainy night"})["x"]
+
+
+def test_game_content_is_frozen():
+    for content in (LOCATIONS, ITEM_DESCRIPTIONS):
+        assert isinstance(content, MappingProxyType)
+        with pytest.raises(TypeError):
+            content["new"] = {}
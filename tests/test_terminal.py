@@ -0,0 +1,27 @@
+import io
+
+from terminal import CLEAR_LINE, CLEAR_SCREEN, CURSOR_HOME, Terminal
+
+
+def test_ansi_terminal_writes_escape_sequences():
+    stream = io.StringIO()
+    terminal = Terminal(stream, ansi=True)
+    terminal.clear_screen()
+    terminal.move_cursor(3, 7)
+    terminal.clear_line()
+    assert stream.getvalue() == CLEAR_SCREEN + CURSOR_HOME + "\x1b[3;7H" + CLEAR_LINE
+
+
+def test_remote_stream_without_ansi_is_scrolled(monkeypatch):
+    monkeypatch.setattr("os.system", refuse_shell)
+    stream = io.StringIO()
+    terminal = Terminal(stream)
+    assert not terminal.ansi
+    terminal.clear_screen()
+    terminal.move_cursor(1, 1)
+    terminal.clear_line()
+    assert stream.getvalue() == "\n" * 100 + "\r"
+
+
+def refuse_shell(command):
+    raise AssertionError(f"spawned a shell: {command}")
@@ -0,0 +1,72 @@
+import io
+
+from text_renderer import TypewriterRenderer, WrapCache
+
+
+class CountingStream(io.StringIO):
+    def __init__(self, tty):
+        super().__init__()
+        self.tty = tty
+        self.write_count = 0
+
+    def isatty(self):
+        return self.tty
+
+    def write(self, text):
+        self.write_count += 1
+        return super().write(text)
+
+
+def test_renderer_writes_non_terminals_at_once():
+    stream = CountingStream(tty=False)
+    TypewriterRenderer(stream).render("The fog rolls in.", delay=1.0)
+    assert stream.getvalue() == "The fog rolls in.\n"
+    assert stream.write_count == 1
+
+
+def test_renderer_batches_characters_per_frame():
+    stream = CountingStream(tty=True)
+    text = "x" * 200
+    TypewriterRenderer(stream, frame_rate=50, skip_on_keypress=False).render(text, delay=0.0005)
+    assert stream.getvalue() == text + "\n"
+    assert stream.write_count < len(text) / 4
+
+
+class Wrapper:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text, width, indent):
+        self.calls += 1
+        return f"{' ' * indent}{text[:width]}"
+
+
+def test_wrap_cache_reuses_wrapped_text():
+    cache, wrap = WrapCache(max_entries=2), Wrapper()
+    assert cache.get_or_wrap("rain", 80, 2, wrap) == "  rain"
+    assert cache.get_or_wrap("rain", 80, 2, wrap) == "  rain"
+    assert cache.get_or_wrap("rain", 40, 2, wrap) == "  rain"
+    assert wrap.calls == 2
+
+
+def test_wrap_cache_evicts_least_recently_used():
+    cache, wrap = WrapCache(max_entries=2), Wrapper()
+    cache.get_or_wrap("a", 80, 0, wrap)
+    cache.get_or_wrap("b", 80, 0, wrap)
+    cache.get_or_wrap("a", 80, 0, wrap)
+    cache.get_or_wrap("c", 80, 0, wrap)
+    cache.get_or_wrap("a", 80, 0, wrap)
+    assert wrap.calls == 3
+    cache.get_or_wrap("b", 80, 0, wrap)
+    assert wrap.calls == 4
+
+
+def test_width_change_flushes_the_cache():
+    cache, wrap = WrapCache(), Wrapper()
+    cache.set_width(80)
+    cache.get_or_wrap("a", 80, 0, wrap)
+    cache.set_width(80)
+    cache.get_or_wrap("a", 80, 0, wrap)
+    cache.set_width(100)
+    cache.get_or_wrap("a", 80, 0, wrap)
+    assert wrap.calls == 2
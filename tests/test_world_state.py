@@ -0,0 +1,52 @@
+import pytest
+
+from static_content import LOCATIONS, freeze
+from world_state import WorldState
+
+
+@pytest.fixture
+def rooms():
+    return freeze({
+        'office': {'items': ['badge', 'coffee'], 'first_visit': True},
+        'hall': {'items': []},
+    })
+
+
+def test_changes_stay_in_the_session(rooms):
+    world, other = WorldState(rooms), WorldState(rooms)
+    world.set('office', 'first_visit', False)
+    assert world.remove_item('office', 'badge')
+    assert not world.remove_item('office', 'badge')
+
+    assert world['office']['items'] == ('coffee',)
+    assert world['office']['first_visit'] is False
+    assert other['office']['items'] == ('badge', 'coffee')
+    assert rooms['office']['first_visit'] is True
+    assert world.touched() == {'office'}
+
+
+def test_setting_the_shared_value_drops_the_change(rooms):
+    world = WorldState(rooms)
+    world.set('office', 'items', ['badge'])
+    world.set('office', 'items', ['badge', 'coffee'])
+    assert world.touched() == set()
+    assert world['office'] is rooms['office']
+
+
+def test_rooms_are_read_only_and_reset(rooms):
+    world = WorldState(rooms)
+    world.set('hall', 'items', ['coffee'])
+    with pytest.raises(TypeError):
+        world['hall']['items'] = []
+    with pytest.raises(KeyError):
+        world.set('attic', 'items', [])
+    world.reset()
+    assert world['hall']['items'] == ()
+    assert len(world) == 2
+    assert 'hall' in world
+
+
+def test_game_rooms_are_shared_static_content():
+    world = WorldState(LOCATIONS)
+    assert set(world) == set(LOCATIONS)
+    assert world['police_station'] is LOCATIONS['police_station']
@@ -0,0 +1,182 @@
+from typing import Callable, Iterator, Optional, TextIO, Tuple
+from collections import OrderedDict
+from contextlib import contextmanager
+import logging
+import os
+import sys
+import threading
+import time
+import config
+
+class TypewriterRenderer:
+    """
+    Typewriter text effect driven by a fixed frame clock.
+
+    Instead of writing, flushing and sleeping once per character, each
+    frame writes every character that is due by then in one write, so the
+    text appears at the same rate with at most frame_rate writes a second.
+    A keypress shows the rest of the text at once, and output that is not
+    a terminal gets the whole text in a single write.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None,
+                 frame_rate: int = config.TEXT_FRAME_RATE,
+                 skip_on_keypress: bool = config.TEXT_SKIP_ON_KEYPRESS):
+        self.stream = stream
+        self.frame_interval = 1.0 / frame_rate
+        self.skip_on_keypress = skip_on_keypress
+        self.logger = logging.getLogger(__name__)
+
+    def render(self, text: str, delay: float) -> None:
+        """
+        Write text with the typewriter effect, followed by a newline.
+
+        Args:
+            text: Text to write
+            delay: Seconds per character
+        """
+        stream = self.stream or sys.stdout
+        if delay <= 0 or not _isatty(stream):
+            stream.write(text + "\n")
+            stream.flush()
+            return
+
+        with self._key_watcher(stream) as key_pressed:
+            start = time.monotonic()
+            next_frame = start
+            written = 0
+            while written < len(text):
+                if key_pressed():
+                    break
+                due = min(len(text), int((time.monotonic() - start) / delay) + 1)
+                if due > written:
+                    stream.write(text[written:due])
+                    stream.flush()
+                    written = due
+
+                # Sleep to the next frame boundary so frames don't drift
+                next_frame += self.frame_interval
+                pause = next_frame - time.monotonic()
+                if pause > 0:
+                    time.sleep(pause)
+
+            stream.write(text[written:] + "\n")
+            stream.flush()
+
+    @contextmanager
+    def _key_watcher(self, stream: TextIO) -> Iterator[Callable[[], bool]]:
+        """
+        Watch stdin for a keypress while rendering.
+
+        Yields:
+            Function returning True once a key was pressed
+        """
+        is_local = (stream is sys.stdout
+                    or getattr(stream, 'is_process_stdout', lambda: False)())
+        if not self.skip_on_keypress or not is_local or not _isatty(sys.stdin):
+            yield lambda: False
+            return
+
+        if os.name == 'nt':
+            import msvcrt
+
+            def key_pressed() -> bool:
+                if not msvcrt.kbhit():
+                    return False
+                # Swallow the key so it doesn't end up in the next command
+                while msvcrt.kbhit():
+                    msvcrt.getwch()
+                return True
+
+            yield key_pressed
+            return
+
+        import select
+        import termios
+        import tty
+
+        fd = sys.stdin.fileno()
+        try:
+            saved = termios.tcgetattr(fd)
+            # Unbuffered input so a single key counts, without echoing it
+            tty.setcbreak(fd)
+            attrs = termios.tcgetattr(fd)
+            attrs[3] &= ~termios.ECHO
+            termios.tcsetattr(fd, termios.TCSANOW, attrs)
+        except (termios.error, OSError) as e:
+            self.logger.debug(f"Keypress skipping unavailable: {e}")
+            yield lambda: False
+            return
+
+        def key_pressed() -> bool:
+            return bool(select.select([fd], [], [], 0)[0])
+
+        try:
+            yield key_pressed
+        finally:
+            # Restore the terminal and drop any keys pressed meanwhile
+            termios.tcsetattr(fd, termios.TCSAFLUSH, saved)
+
+def _isatty(stream: TextIO) -> bool:
+    """Check whether a stream is an interactive terminal."""
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+class WrapCache:
+    """
+    Bounded LRU cache of wrapped text.
+
+    Entries are keyed by (hash of the text, width, indent) and keep the
+    original text to guard against hash collisions. All entries are
+    dropped when the terminal width changes, since they would never be
+    used again.
+    """
+
+    def __init__(self, max_entries: int = config.WRAP_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.width: Optional[int] = None
+        self._entries: "OrderedDict[Tuple[int, int, int], Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def set_width(self, width: int) -> None:
+        """
+        Record the current terminal width, flushing the cache if it changed.
+
+        Args:
+            width: Terminal width in columns
+        """
+        with self._lock:
+            if width != self.width:
+                self._entries.clear()
+                self.width = width
+
+    def get_or_wrap(self, text: str, width: int, indent: int,
+                    wrap: Callable[[str, int, int], str]) -> str:
+        """
+        Get wrapped text from the cache, wrapping and storing it on a miss.
+
+        Args:
+            text: Text to wrap
+            width: Line width
+            indent: Indent in spaces
+            wrap: Function doing the actual wrapping
+
+        Returns:
+            str: Wrapped text
+        """
+        key = (hash(text), width, indent)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == text:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        wrapped = wrap(text, width, indent)
+        with self._lock:
+            self._entries[key] = (text, wrapped)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return wrapped
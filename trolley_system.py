@@ -1,6 +1,7 @@
 from typing import Tuple, Dict, Optional
 from dataclasses import dataclass
 import logging
+from static_content import freeze
 
 @dataclass
 class TrolleyState:
@@ -9,30 +10,32 @@ class TrolleyState:
     last_stop: Optional[str] = None
 
 class TrolleySystem:
+    # Stops along the route, shared by every trolley
+    routes = freeze({
+        0: {
+            "description": "Downtown Stop",
+            "exits": {"off": "pike_place"},
+            "history": "The Downtown trolley stop has served Pike Place Market since 1907, connecting shoppers to Seattle's famous public market."
+        },
+        1: {
+            "description": "Pioneer Square Stop", 
+            "exits": {"off": "pioneer_square"},
+            "history": "Pioneer Square's trolley stop dates back to the 1890s, serving Seattle's historic first neighborhood."
+        },
+        2: {
+            "description": "Waterfront Stop",
+            "exits": {"off": "waterfront"},
+            "history": "The Waterfront trolley line, established in the early 1900s, was crucial for maritime commerce and shipyard workers."
+        },
+        3: {
+            "description": "Smith Tower Stop",
+            "exits": {"off": "smith_tower"},
+            "history": "Added in 1914 when Smith Tower opened, this stop served Seattle's first skyscraper."
+        }
+    })
+
     def __init__(self):
         self.position = 0
-        self.routes = {
-            0: {
-                "description": "Downtown Stop",
-                "exits": {"off": "pike_place"},
-                "history": "The Downtown trolley stop has served Pike Place Market since 1907, connecting shoppers to Seattle's famous public market."
-            },
-            1: {
-                "description": "Pioneer Square Stop", 
-                "exits": {"off": "pioneer_square"},
-                "history": "Pioneer Square's trolley stop dates back to the 1890s, serving Seattle's historic first neighborhood."
-            },
-            2: {
-                "description": "Waterfront Stop",
-                "exits": {"off": "waterfront"},
-                "history": "The Waterfront trolley line, established in the early 1900s, was crucial for maritime commerce and shipyard workers."
-            },
-            3: {
-                "description": "Smith Tower Stop",
-                "exits": {"off": "smith_tower"},
-                "history": "Added in 1914 when Smith Tower opened, this stop served Seattle's first skyscraper."
-            }
-        }
         self.in_motion = False
         self.last_stop = None
 
@@ -4,13 +4,22 @@ import time
 import logging
 import json
 import shutil
+import signal
 import textwrap
+import copy
+import threading
 from typing import Tuple, Optional, Dict, Any, List
 from functools import wraps
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 import config
+import static_content
+from save_backends import AUTOSAVE_PREFIX, SaveBackend, create_save_backend, is_valid_save_name
+from save_format import migrate_save_data
+from text_renderer import TypewriterRenderer, WrapCache
+from terminal import Terminal
+from output_sink import OutputSink
 
 
 # Configure root logger
@@ -22,6 +31,11 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Shown when a player picks a save name that can't be used as a file name
+INVALID_SAVE_NAME_MESSAGE = (
+    f"Save names can use up to {config.SAVE_NAME_MAX_LENGTH} letters, digits, '-' or '_'."
+)
+
 @dataclass
 class SaveGameData:
     """Data structure for saved game state"""
@@ -39,23 +53,90 @@ class SaveGameData:
 class DisplayManager:
     """Handles all display-related functionality in a centralized way."""
     
+    # Wrapped output shared by all wrap_text calls
+    _wrap_cache = WrapCache()
+    _wrap_prewarmed = False
+    
+    # Terminal size, cleared by SIGWINCH or refresh_terminal_size()
+    _terminal_size: Optional[Tuple[int, int]] = None
+    _terminal_size_time = 0.0
+    _resize_handler_installed = False
+    
+    # Terminal control for sys.stdout, created on first use
+    _terminal: Optional[Terminal] = None
+    
     @staticmethod
     def get_terminal_size() -> tuple[int, int]:
         """Get current terminal size with fallback values."""
+        size = DisplayManager._terminal_size
+        if size is not None and (
+                DisplayManager._resize_handler_installed
+                or time.monotonic() - DisplayManager._terminal_size_time < config.TERMINAL_SIZE_TTL):
+            return size
+        
         try:
             width, height = shutil.get_terminal_size()
             width = max(config.MIN_TERMINAL_WIDTH, 
                        min(width, config.MAX_TERMINAL_WIDTH))
-            return width, height
+            size = (width, height)
         except Exception:
-            return config.DEFAULT_TERMINAL_WIDTH, config.DEFAULT_TERMINAL_HEIGHT
+            size = (config.DEFAULT_TERMINAL_WIDTH, config.DEFAULT_TERMINAL_HEIGHT)
+        
+        DisplayManager._terminal_size = size
+        DisplayManager._terminal_size_time = time.monotonic()
+        return size
+    
+    @staticmethod
+    def refresh_terminal_size() -> tuple[int, int]:
+        """Forget the cached terminal size and measure it again."""
+        DisplayManager._terminal_size = None
+        return DisplayManager.get_terminal_size()
+    
+    @staticmethod
+    def install_resize_handler() -> bool:
+        """
+        Invalidate the cached terminal size whenever the terminal is resized.
+        
+        Without SIGWINCH (Windows) or off the main thread, the cached size
+        is instead re-measured after config.TERMINAL_SIZE_TTL seconds.
+        
+        Returns:
+            bool: True if the SIGWINCH handler is installed
+        """
+        if DisplayManager._resize_handler_installed:
+            return True
+        if not hasattr(signal, 'SIGWINCH'):
+            return False
+        
+        try:
+            previous = signal.getsignal(signal.SIGWINCH)
+            
+            def on_resize(signum, frame):
+                DisplayManager._terminal_size = None
+                if callable(previous):
+                    previous(signum, frame)
+            
+            signal.signal(signal.SIGWINCH, on_resize)
+            DisplayManager._resize_handler_installed = True
+            return True
+        except ValueError:
+            # Signal handlers can only be installed from the main thread
+            return False
     
     @staticmethod
     def wrap_text(text: str, width: Optional[int] = None, indent: int = 0) -> str:
         """Wrap text to fit terminal width with proper indentation."""
         if width is None:
             width, _ = DisplayManager.get_terminal_size()
+            DisplayManager._wrap_cache.set_width(width)
         
+        return DisplayManager._wrap_cache.get_or_wrap(
+            text, width, indent, DisplayManager._wrap_uncached
+        )
+    
+    @staticmethod
+    def _wrap_uncached(text: str, width: int, indent: int) -> str:
+        """Wrap text paragraph by paragraph, bypassing the cache."""
         # Adjust width for indent
         effective_width = width - indent
         
@@ -83,9 +164,40 @@ class DisplayManager:
         
         return '\n\n'.join(wrapped_paragraphs)
     
+    @staticmethod
+    def prewarm_wrap_cache(texts: List[str]) -> Optional[threading.Thread]:
+        """
+        Wrap fixed texts in a background thread so showing them later is a cache hit.
+        
+        Only the first call in a process does anything, since all games
+        share the wrap cache. Texts must be passed exactly as they will be
+        given to print_text, or the cache entries won't match.
+        
+        Args:
+            texts: Texts shown through print_text with the default indent
+        
+        Returns:
+            The started thread, None if the cache was already prewarmed
+        """
+        if DisplayManager._wrap_prewarmed:
+            return None
+        DisplayManager._wrap_prewarmed = True
+        
+        def prewarm() -> None:
+            try:
+                for text in texts:
+                    DisplayManager.wrap_text(text)
+            except Exception as e:
+                logging.error(f"Error pre-wrapping text: {e}")
+        
+        thread = threading.Thread(target=prewarm, name="wrap-prewarm", daemon=True)
+        thread.start()
+        return thread
+    
     @staticmethod
     def print_text(text: str, delay: Optional[float] = None, 
-                  indent: int = 0, wrap: bool = True) -> None:
+                  indent: int = 0, wrap: bool = True,
+                  output: Optional[OutputSink] = None) -> None:
         """
         Print text with optional wrapping and slow printing effect.
         
@@ -94,38 +206,42 @@ class DisplayManager:
             delay: Delay between characters for slow printing
             indent: Number of spaces to indent text
             wrap: Whether to wrap text to terminal width
+            output: Session output sink, defaults to sys.stdout
         """
+        write = output.print if output else print
         try:
             # Prepare the text
             display_text = DisplayManager.wrap_text(text, indent=indent) if wrap else text
             
             # Print with or without delay
             if delay:
-                for char in display_text:
-                    sys.stdout.write(char)
-                    sys.stdout.flush()
-                    time.sleep(delay)
-                print()  # Add final newline
+                TypewriterRenderer(output).render(display_text, delay)
             else:
-                print(display_text)
+                write(display_text)
                 
         except KeyboardInterrupt:
-            print("\nDisplay interrupted.")
+            write("\nDisplay interrupted.")
         except Exception as e:
             logging.error(f"Error displaying text: {e}")
-            print("\nError displaying text.")
+            write("\nError displaying text.")
     
     @staticmethod
-    def clear_screen() -> None:
-        """Clear the terminal screen."""
+    def get_terminal() -> Terminal:
+        """Get the terminal controller for sys.stdout."""
+        if DisplayManager._terminal is None or DisplayManager._terminal.stream is not sys.stdout:
+            DisplayManager._terminal = Terminal(sys.stdout)
+        return DisplayManager._terminal
+    
+    @staticmethod
+    def clear_screen(terminal: Optional[Terminal] = None) -> None:
+        """
+        Clear the terminal screen.
+        
+        Args:
+            terminal: Terminal of the session to clear, defaults to sys.stdout's
+        """
         try:
-            # Check if running in IDLE
-            if 'idlelib.run' in sys.modules:
-                print("\n" * 100)
-                return
-            
-            # Use appropriate clear command based on OS
-            os.system('cls' if os.name == 'nt' else 'clear')
+            (terminal or DisplayManager.get_terminal()).clear_screen()
         except Exception as e:
             logging.error(f"Error clearing screen: {e}")
             print("\n" * 100)  # Fallback
@@ -159,9 +275,10 @@ def clear_screen() -> None:
     DisplayManager.clear_screen()
 
 def print_text(text: str, delay: Optional[float] = None, 
-              indent: int = 0, wrap: bool = True) -> None:
+              indent: int = 0, wrap: bool = True,
+              output: Optional[OutputSink] = None) -> None:
     """Print text using DisplayManager."""
-    DisplayManager.print_text(text, delay, indent, wrap)
+    DisplayManager.print_text(text, delay, indent, wrap, output)
 
 class InputValidator:
     """Handles input validation for game commands."""
@@ -228,35 +345,74 @@ class InputValidator:
             bool: True if valid, False otherwise
         """
         return bool(direction and direction in valid_exits)
+
 class SaveLoadManager:
-    def __init__(self, save_dir: str):
+    def __init__(self, save_dir: str, backend: Optional[SaveBackend] = None):
         self.save_dir = Path(save_dir)
-        self.save_dir.mkdir(exist_ok=True)
         self.logger = logging.getLogger(__name__)
+        self.backend = backend or create_save_backend(config.SAVE_BACKEND, self.save_dir)
+        # Saves may be written from the autosave worker thread
+        self._lock = threading.RLock()
+
+    def create_snapshot(self, game_instance: 'SeattleNoir', save_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Capture the current game state as save data.
+        
+        The snapshot shares nothing mutable with the running game, so it can
+        be serialized later or on another thread.
+        
+        Args:
+            game_instance: Current game instance
+            save_name: Name of the save, defaults to a timestamped autosave name
+            
+        Returns:
+            Dict containing the save data
+        """
+        if not save_name:
+            save_name = f"{AUTOSAVE_PREFIX}{int(time.time())}"
+        
+        return {
+            'save_name': save_name,
+            'save_date': datetime.now().isoformat(),
+            'version': config.SAVE_FILE_VERSION,
+            'game_state': copy.deepcopy(game_instance.game_state),
+            'current_location': game_instance.current_location,
+            'location_states': game_instance.location_manager.get_location_states(),
+            'inventory_state': game_instance.item_manager.get_inventory_state(),
+            'puzzle_states': copy.deepcopy(game_instance.puzzle_manager.get_all_states())
+        }
 
     def save_game(self, game_instance: 'SeattleNoir', save_name: Optional[str] = None) -> bool:
         """Save the current game state to a file."""
         try:
-            if not save_name:
-                save_name = f"autosave_{int(time.time())}"
-            
-            # Create save data dictionary with all necessary state
-            save_data = {
-                'save_name': save_name,
-                'save_date': datetime.now().isoformat(),
-                'version': config.SAVE_FILE_VERSION,
-                'game_state': game_instance.game_state,
-                'current_location': game_instance.current_location,
-                'location_states': game_instance.location_manager.get_location_states(),
-                'inventory_state': game_instance.item_manager.get_inventory_state()
-            }
-            
-            file_path = self.save_dir / f"{save_name}.json"
-            
-            with open(file_path, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            if save_name and not is_valid_save_name(save_name):
+                game_instance.output.print(f"\n{INVALID_SAVE_NAME_MESSAGE}")
+                return False
+            save_data = self.create_snapshot(game_instance, save_name)
+            if not self.check_quota(save_data['save_name']):
+                game_instance.output.print("\nNot enough save space left. Delete some saves and try again.")
+                return False
+            return self.write_save(save_data)
+        except Exception as e:
+            self.logger.error(f"Error saving game: {e}")
+            return False
+
+    def write_save(self, save_data: Dict[str, Any], checkpoint: bool = False) -> bool:
+        """
+        Write a snapshot from create_snapshot() to the save backend.
+        
+        Args:
+            save_data: Save data to write
+            checkpoint: Write a full checkpoint even if the journal could be used
             
-            self.logger.info(f"Game saved successfully to {file_path}")
+        Returns:
+            bool: True if the save was written, False otherwise
+        """
+        try:
+            if not is_valid_save_name(save_data.get('save_name')):
+                raise ValueError(f"Invalid save name: {save_data.get('save_name')!r}")
+            with self._lock:
+                self.backend.write(save_data, checkpoint)
             return True
             
         except Exception as e:
@@ -266,13 +422,19 @@ class SaveLoadManager:
     def load_game(self, game_instance: 'SeattleNoir', save_name: str) -> bool:
         """Load a saved game state."""
         try:
-            file_path = self.save_dir / f"{save_name}.json"
-            if not file_path.exists():
-                print(f"\nSave file not found: {save_name}")
+            if not is_valid_save_name(save_name):
+                game_instance.output.print(f"\n{INVALID_SAVE_NAME_MESSAGE}")
                 return False
-
-            with open(file_path, 'r') as f:
-                save_data = json.load(f)
+            with self._lock:
+                save_data = self.backend.read(save_name)
+                if save_data is None:
+                    game_instance.output.print(f"\nSave file not found: {save_name}")
+                    return False
+                if self.backend.needs_conversion(save_name, save_data):
+                    save_data = migrate_save_data(save_data)
+                    if config.SAVE_CONVERT_ON_LOAD:
+                        save_data['save_name'] = save_name
+                        self.write_save(copy.deepcopy(save_data), checkpoint=True)
 
             # Verify save data structure
             required_keys = {'game_state', 'current_location', 'location_states', 'inventory_state'}
@@ -290,32 +452,16 @@ class SaveLoadManager:
             # Restore inventory
             game_instance.item_manager.restore_inventory_state(save_data['inventory_state'])
             
-            self.logger.info(f"Game loaded successfully from {file_path}")
+            # Restore puzzle progress
+            game_instance.puzzle_manager.restore_all_states(save_data.get('puzzle_states', {}))
+            
+            self.logger.info(f"Game loaded successfully: {save_name}")
             return True
 
         except Exception as e:
             self.logger.error(f"Error loading game: {str(e)}")
             return False
 
-    def list_saves(self) -> List[Dict[str, Any]]:
-        """List all available save files with metadata."""
-        saves = []
-        for save_file in self.save_dir.glob("*.json"):
-            try:
-                with open(save_file, 'r') as f:
-                    save_data = json.load(f)
-                    saves.append({
-                        'name': save_data['save_name'],
-                        'date': save_data['save_date'],
-                        'location': save_data['current_location'],
-                        'file_path': str(save_file)
-                    })
-            except Exception as e:
-                self.logger.warning(f"Error reading save file {save_file}: {e}")
-                continue
-        
-        return sorted(saves, key=lambda x: x['date'], reverse=True)
-    
     def _verify_loaded_state(self, game_instance: 'SeattleNoir', save_data: SaveGameData) -> None:
         """
         Verify the integrity of loaded game state.
@@ -331,7 +477,7 @@ class SaveLoadManager:
             
             # Verify inventory items exist
             for item in game_instance.item_manager.inventory:
-                if item not in config.ITEM_DESCRIPTIONS:
+                if item not in static_content.ITEM_DESCRIPTIONS:
                     self.logger.warning(f"Unknown item in inventory: {item}")
                 
             # Check for any duplicate items (shouldn't exist in both inventory and locations)
@@ -349,24 +495,14 @@ class SaveLoadManager:
         """
         List all available save files with metadata.
         
+        Metadata comes from the backend's index (the save manifest or the
+        save database), so individual saves are not parsed.
+        
         Returns:
             List of dictionaries containing save file information
         """
-        saves = []
-        for save_file in self.save_dir.glob("*.json"):
-            try:
-                with open(save_file, 'r') as f:
-                    save_data = json.load(f)
-                saves.append({
-                    'name': save_data['save_name'],
-                    'date': save_data['save_date'],
-                    'location': save_data['current_location'],
-                    'file_path': str(save_file)
-                })
-            except Exception as e:
-                self.logger.warning(f"Error reading save file {save_file}: {e}")
-        
-        return sorted(saves, key=lambda x: x['date'], reverse=True)
+        with self._lock:
+            return self.backend.list_saves()
 
     def delete_save(self, save_name: str) -> bool:
         """
@@ -379,12 +515,11 @@ class SaveLoadManager:
             bool: True if deletion successful, False otherwise
         """
         try:
-            file_path = self.save_dir / f"{save_name}.json"
-            if file_path.exists():
-                file_path.unlink()
-                self.logger.info(f"Deleted save file: {file_path}")
-                return True
-            return False
+            if not is_valid_save_name(save_name):
+                self.logger.warning(f"Refused to delete invalid save name: {save_name!r}")
+                return False
+            with self._lock:
+                return self.backend.delete(save_name)
         except Exception as e:
             self.logger.error(f"Error deleting save file: {e}")
             return False
@@ -400,22 +535,57 @@ class SaveLoadManager:
             bool: True if autosave successful, False otherwise
         """
         try:
-            # Create autosave name with timestamp
-            save_name = f"autosave_{int(time.time())}"
+            return self.write_auto_save(self.create_snapshot(game_instance))
+        except Exception as e:
+            self.logger.error(f"Error during auto-save: {e}")
+            return False
+
+    def write_auto_save(self, save_data: Dict[str, Any]) -> bool:
+        """
+        Write an autosave snapshot and prune old autosaves.
+        
+        Every autosave is a save of its own, so the last MAX_AUTO_SAVES
+        are separate restore points; only a second autosave under the
+        same name goes to that save's journal.
+        
+        Args:
+            save_data: Snapshot from create_snapshot()
             
-            # Attempt to save
-            if not self.save_game(game_instance, save_name):
-                self.logger.error("Failed to create auto-save")
-                return False
-                
-            # Clean up old auto-saves
-            self._cleanup_old_autosaves()
+        Returns:
+            bool: True if autosave successful, False otherwise
+        """
+        try:
+            with self._lock:
+                # Attempt to save
+                if not self.write_save(save_data):
+                    self.logger.error("Failed to create auto-save")
+                    return False
+                    
+                # Clean up old auto-saves
+                self._cleanup_old_autosaves()
             return True
             
         except Exception as e:
             self.logger.error(f"Error during auto-save: {e}")
             return False
 
+    def write_auto_saves(self, batch: List[Dict[str, Any]]) -> bool:
+        """
+        Write several autosave snapshots as one group commit.
+
+        Args:
+            batch: Snapshots from create_snapshot(), oldest first
+
+        Returns:
+            bool: True if every autosave was written, False otherwise
+        """
+        try:
+            with self._lock, self.backend.group_commit():
+                return all([self.write_auto_save(save_data) for save_data in batch])
+        except Exception as e:
+            self.logger.error(f"Error during auto-save: {e}")
+            return False
+
     def _cleanup_old_autosaves(self, keep_count: int = config.MAX_AUTO_SAVES) -> None:
         """
         Clean up old auto-save files, keeping only the most recent ones.
@@ -424,27 +594,8 @@ class SaveLoadManager:
             keep_count: Number of recent auto-saves to keep (default: 5)
         """
         try:
-            # Get all auto-save files
-            autosaves = []
-            for save_file in self.save_dir.glob("autosave_*.json"):
-                try:
-                    timestamp = int(save_file.stem.split('_')[1])
-                    autosaves.append((timestamp, save_file))
-                except (IndexError, ValueError):
-                    # Handle files that don't match our naming pattern
-                    continue
-            
-            # Sort by timestamp (newest first) and remove old ones
-            autosaves.sort(reverse=True)
-            
-            # Keep the newest 'keep_count' saves, delete the rest
-            for _, file_path in autosaves[keep_count:]:
-                try:
-                    file_path.unlink()
-                    self.logger.info(f"Cleaned up old auto-save: {file_path}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to delete old auto-save {file_path}: {e}")
-                    
+            with self._lock:
+                self.backend.prune_autosaves(keep_count)
         except Exception as e:
             self.logger.error(f"Error during auto-save cleanup: {e}")
 
@@ -456,15 +607,8 @@ class SaveLoadManager:
             Dict containing auto-save statistics
         """
         try:
-            autosaves = list(self.save_dir.glob("autosave_*.json"))
-            total_size = sum(f.stat().st_size for f in autosaves)
-            
-            return {
-                'count': len(autosaves),
-                'total_size_bytes': total_size,
-                'oldest': min(f.stat().st_mtime for f in autosaves) if autosaves else None,
-                'newest': max(f.stat().st_mtime for f in autosaves) if autosaves else None,
-            }
+            with self._lock:
+                return self.backend.autosave_stats()
         except Exception as e:
             self.logger.error(f"Error getting auto-save stats: {e}")
             return {
@@ -483,35 +627,66 @@ class SaveLoadManager:
             max_total_size_mb: Maximum total size of all saves in MB
         """
         try:
-            all_saves = list(self.save_dir.glob("*.json"))
-            total_size = sum(f.stat().st_size for f in all_saves)
-            
-            # If total size exceeds limit, remove old auto-saves first
-            if total_size > max_total_size_mb * 1024 * 1024:
-                self.logger.warning("Save directory size exceeds limit, cleaning up...")
-                
-                # Sort saves by modification time (oldest first)
-                saves_by_time = sorted(
-                    (f for f in all_saves if f.stem.startswith('autosave_')),
-                    key=lambda f: f.stat().st_mtime
-                )
-                
-                # Remove old auto-saves until we're under the limit
-                for save_file in saves_by_time:
-                    if total_size <= max_total_size_mb * 1024 * 1024:
-                        break
-                        
-                    try:
-                        size = save_file.stat().st_size
-                        save_file.unlink()
-                        total_size -= size
-                        self.logger.info(f"Removed old auto-save to free space: {save_file}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to remove old save {save_file}: {e}")
-                        
+            with self._lock:
+                self.backend.enforce_quotas(self._quota_bytes(max_total_size_mb))
         except Exception as e:
             self.logger.error(f"Error managing saves: {e}")
 
+    def check_quota(self, save_name: str) -> bool:
+        """
+        Check that a new save of this name stays within its quotas.
+        
+        Only autosaves are ever removed to free space, so manual saves are
+        refused once a quota covering them is used up.
+        
+        Args:
+            save_name: Name of the save about to be written
+            
+        Returns:
+            bool: True if the save may be written
+        """
+        with self._lock:
+            for prefix, max_bytes in self._quota_bytes().items():
+                if save_name.startswith(prefix) and self.backend.usage(prefix) >= max_bytes:
+                    self.logger.warning(f"Save {save_name} refused: quota for '{prefix}' is full")
+                    return False
+        return True
+
+    def _quota_bytes(self, max_total_size_mb: float = config.MAX_SAVE_DIR_SIZE_MB) -> Dict[str, int]:
+        """Get the save quotas in bytes by name prefix, '' being the overall limit."""
+        quotas = {"": max_total_size_mb, **config.SAVE_QUOTAS_MB}
+        return {prefix: int(size_mb * 1024 * 1024) for prefix, size_mb in quotas.items()}
+
+    def migrate_all_saves(self) -> int:
+        """
+        Convert every save to the current version and save format.
+        
+        Returns:
+            int: Number of saves that were rewritten
+        """
+        converted = 0
+        with self._lock:
+            for entry in self.backend.list_saves():
+                save_name = entry['name']
+                try:
+                    save_data = self.backend.read(save_name)
+                    if save_data is None or not self.backend.needs_conversion(save_name, save_data):
+                        continue
+                    save_data = migrate_save_data(save_data)
+                    save_data['save_name'] = save_name
+                    if self.write_save(save_data, checkpoint=True):
+                        converted += 1
+                except Exception as e:
+                    self.logger.error(f"Error migrating save {save_name}: {e}")
+        
+        self.logger.info(f"Migrated {converted} save files")
+        return converted
+
+    def close(self) -> None:
+        """Release the save backend."""
+        with self._lock:
+            self.backend.close()
+
 class ErrorHandler:
     # ... rest of the file continues as before ...
     """Handles error management and logging."""
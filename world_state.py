@@ -0,0 +1,101 @@
+from typing import Any, Dict, Iterator, Mapping, Set
+from collections import ChainMap
+from types import MappingProxyType
+import logging
+
+class WorldState(Mapping):
+    """
+    One session's view of the game world, copy-on-write over shared rooms.
+
+    The room definitions (normally config.LOCATIONS) are shared by every
+    session in the process and never modified. A session's changes to a
+    room are kept in a small per-room overlay of changed fields, so memory
+    per session grows only with what the player changed. Setting a field
+    back to its original value drops it from the overlay.
+
+    Rooms read through the mapping are read-only; all changes go through
+    set() and remove_item().
+    """
+
+    def __init__(self, rooms: Mapping[str, Mapping[str, Any]]):
+        """
+        Args:
+            rooms: Shared room definitions, keyed by location ID
+        """
+        self.logger = logging.getLogger(__name__)
+        self._rooms = rooms
+        # location -> fields changed in this session
+        self._overlay: Dict[str, Dict[str, Any]] = {}
+
+    def __getitem__(self, location: str) -> Mapping[str, Any]:
+        room = self._rooms[location]
+        changes = self._overlay.get(location)
+        if changes is None:
+            return room if isinstance(room, MappingProxyType) else MappingProxyType(room)
+        return MappingProxyType(ChainMap(changes, room))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rooms)
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def __contains__(self, location: object) -> bool:
+        return location in self._rooms
+
+    def set(self, location: str, field: str, value: Any) -> None:
+        """
+        Change one field of a room for this session.
+
+        Args:
+            location: Location ID
+            field: Room field, e.g. "first_visit"
+            value: New value; lists and dicts are stored as frozen copies
+
+        Raises:
+            KeyError: If the location doesn't exist
+        """
+        room = self._rooms[location]
+        value = _freeze(value)
+        if field in room and _freeze(room[field]) == value:
+            # Back to the shared value, nothing to keep
+            changes = self._overlay.get(location)
+            if changes is not None:
+                changes.pop(field, None)
+                if not changes:
+                    del self._overlay[location]
+            return
+        self._overlay.setdefault(location, {})[field] = value
+
+    def remove_item(self, location: str, item: str) -> bool:
+        """
+        Take an item out of a room for this session.
+
+        Args:
+            location: Location ID
+            item: Item ID
+
+        Returns:
+            bool: True if the item was in the room
+        """
+        items = self[location].get("items", ())
+        if item not in items:
+            return False
+        self.set(location, "items", [other for other in items if other != item])
+        return True
+
+    def touched(self) -> Set[str]:
+        """Get the locations this session has changed."""
+        return set(self._overlay)
+
+    def reset(self) -> None:
+        """Forget all of this session's changes."""
+        self._overlay.clear()
+
+def _freeze(value: Any) -> Any:
+    """Get an immutable copy of a room field value."""
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return MappingProxyType(dict(value))
+    return value